@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""複数の社員データファイルを並列に検証し、まとめたレポートを保存するスクリプト。
+
+使い方:
+    python batch_validation.py data/branches/ --workers 4 --report report.json
+    python batch_validation.py "data/**/*.csv" --check-unique-ids --report report.parquet
+"""
+
+import argparse
+import logging
+import sys
+
+# ロギングの設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger("batch_validation")
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析する。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="検証するディレクトリ、globパターン、またはファイルのパス",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="同時に検証するファイル数（省略時はCPUコア数）",
+    )
+    parser.add_argument(
+        "--report",
+        default="validation_report.json",
+        help="レポートの保存先（拡張子が .parquet の場合はParquet、それ以外はJSON）",
+    )
+    parser.add_argument(
+        "--check-unique-ids",
+        action="store_true",
+        help="社員IDがファイル間で重複していないことも確認する",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """メインの実行関数。"""
+    args = parse_args(argv)
+
+    # --help だけで終わる場合にpandas・Panderaを読み込まないよう、引数の解析後に読み込む
+    from pandera_validation.utils.batch import find_files, validate_employee_files
+
+    # ファイルごとの検証ログはレポートにまとめるため抑制
+    logging.getLogger("pandera_validation.utils.validation").setLevel(logging.WARNING)
+
+    paths = find_files(args.paths)
+    if not paths:
+        logger.error(f"検証するファイルがありません: {args.paths}")
+        return 1
+
+    report = validate_employee_files(
+        paths, max_workers=args.workers, check_unique_ids=args.check_unique_ids
+    )
+    report.write(args.report)
+
+    summary = report.to_dict()
+    status = "✅ 検証成功" if report.success else "❌ 検証失敗"
+    print(
+        f"{status}: {summary['file_count']}ファイル中"
+        f"{summary['failed_file_count']}ファイルが失敗（{report.seconds:.2f}秒）"
+    )
+    if summary.get("duplicate_id_count"):
+        print(
+            f"ファイル間で重複した社員ID: {summary['duplicate_id_count']}件 "
+            f"{summary['duplicate_ids']}"
+        )
+    print(f"レポートを '{args.report}' に保存しました")
+    return 0 if report.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
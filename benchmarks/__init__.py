@@ -0,0 +1 @@
+"""バリデーション性能計測用のベンチマーク。"""
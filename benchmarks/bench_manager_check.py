@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""上司IDチェックの行単位実装とベクトル化実装の速度比較ベンチマーク。
+
+管理職の評価スコアのチェックについても、isinとデータフレームの部分的な複製を
+使う従来方式と、社員IDの索引を使う方式を比較する。
+
+使い方:
+    python -m benchmarks.bench_manager_check --rows 1000000
+    python -m benchmarks.bench_manager_check --rows 10000000 --managers 100
+"""
+
+import argparse
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from pandera_validation.schemas import check_manager_min_score, check_manager_not_self
+from pandera_validation.schemas.employee import MIN_MANAGER_SCORE
+
+
+def make_frame(
+    rows: int, seed: int = 0, managers: Optional[int] = None
+) -> pd.DataFrame:
+    """上司IDの約1割がNULLのテスト用データフレームを生成する。
+
+    Args:
+        rows: 行数
+        seed: 乱数のシード
+        managers: 上司となる社員の人数（Noneの場合は全社員から無作為に選ぶ）
+    """
+    rng = np.random.default_rng(seed)
+    employee_id = np.arange(1000, 1000 + rows, dtype=np.int64)
+    candidates = employee_id if managers is None else employee_id[:managers]
+    manager_id = pd.array(rng.choice(candidates, size=rows), dtype="Int64")
+    manager_id[rng.random(rows) < 0.1] = pd.NA
+    return pd.DataFrame(
+        {
+            "employee_id": employee_id,
+            "manager_id": manager_id,
+            "performance_score": rng.uniform(MIN_MANAGER_SCORE, 5.0, size=rows),
+        }
+    )
+
+
+def check_element_wise(df: pd.DataFrame) -> pd.Series:
+    """行ごとにPython関数を呼び出す従来方式のチェック。"""
+    return pd.Series(
+        [pd.isna(m) or m != e for e, m in zip(df["employee_id"], df["manager_id"])],
+        index=df.index,
+    )
+
+
+def check_manager_score_isin(df: pd.DataFrame) -> bool:
+    """isinで管理職を求め、データフレームの部分的な複製から最小値を求める従来方式。"""
+    managers = df[df["employee_id"].isin(df["manager_id"].dropna())]
+    return managers["performance_score"].min() >= MIN_MANAGER_SCORE
+
+
+def time_call(func, df: pd.DataFrame, repeat: int) -> float:
+    """関数を複数回実行し、最短の実行時間（秒）を返す。"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """ベンチマークを実行して結果を表示する。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="行数")
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数")
+    parser.add_argument(
+        "--managers",
+        type=int,
+        default=None,
+        help="上司となる社員の人数（少ないほど1人あたりの部下が多い）",
+    )
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, managers=args.managers)
+
+    # 両方式の結果が一致することを確認
+    expected = check_element_wise(df)
+    actual = check_manager_not_self(df)["manager_id"]
+    assert (expected.values == actual.values).all(), "チェック結果が一致しません"
+
+    element_wise = time_call(check_element_wise, df, args.repeat)
+    vectorized = time_call(check_manager_not_self, df, args.repeat)
+
+    print(f"行数: {args.rows}")
+    print(f"行単位:       {element_wise:.4f}秒")
+    print(f"ベクトル化:   {vectorized:.4f}秒")
+    print(f"高速化倍率:   {element_wise / vectorized:.1f}倍")
+
+    # 管理職の評価スコア（索引は他の管理階層チェックと共有されるため、
+    # 初回の呼び出しでのみ作成される）
+    assert check_manager_score_isin(df) == (check_manager_min_score(df) is True)
+    isin_time = time_call(check_manager_score_isin, df, args.repeat)
+    indexed_time = time_call(check_manager_min_score, df, args.repeat)
+    print(f"管理職スコア（isin）:   {isin_time:.4f}秒")
+    print(f"管理職スコア（索引）:   {indexed_time:.4f}秒")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+"""ベンチマーク用の合成社員データ生成。"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from pandera_validation.schemas.employee import ALLOWED_DEPARTMENTS, MIN_MANAGER_SCORE
+
+# 生成に使用する名前（2〜20文字）
+NAMES = np.array(
+    [
+        "山田太郎",
+        "佐藤花子",
+        "鈴木一郎",
+        "田中美香",
+        "伊藤健太",
+        "渡辺直美",
+        "高橋誠",
+        "小林由美子",
+        "加藤翔太",
+        "吉田さくら",
+    ],
+    dtype=object,
+)
+
+# 不正値の種類（行単位のチェックに違反する値を1つ注入する）
+INVALID_KINDS = [
+    "salary",
+    "age",
+    "department",
+    "performance_score",
+    "name",
+    "join_date",
+    "manager_id",
+]
+
+
+def generate_employee_data(
+    rows: int,
+    invalid_rate: float = 0.0,
+    department_weights: Optional[Dict[str, float]] = None,
+    manager_ratio: float = 0.05,
+    manager_skew: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """``create_employee_schema`` に適合する合成社員データを生成する。
+
+    すべての列をNumPyのベクトル演算で生成する。``invalid_rate`` が0の場合、
+    生成したデータは部署平均給与や管理職の評価スコアを含むすべての
+    チェックを通過する。
+
+    Args:
+        rows: 生成する行数
+        invalid_rate: 行単位のチェックに違反する値を注入する行の割合
+        department_weights: 部署ごとの出現比率（Noneの場合は均等）
+        manager_ratio: 管理職（他の社員の上司）となる社員の割合
+        manager_skew: 部下の割り当ての偏り（0で均等、大きいほど一部の管理職に集中）
+        seed: 乱数シード
+
+    Returns:
+        pd.DataFrame: 合成した社員データ
+    """
+    rng = np.random.default_rng(seed)
+
+    employee_id = np.arange(1000, 1000 + rows, dtype=np.int64)
+
+    # 部署の割り当て
+    if department_weights:
+        weights = np.array(
+            [department_weights.get(dept, 0.0) for dept in ALLOWED_DEPARTMENTS]
+        )
+    else:
+        weights = np.ones(len(ALLOWED_DEPARTMENTS))
+    departments = np.array(ALLOWED_DEPARTMENTS, dtype=object)
+    department = departments[
+        rng.choice(len(departments), size=rows, p=weights / weights.sum())
+    ]
+
+    # 管理職は先頭の社員から選び、評価スコアを基準以上にする
+    n_managers = max(1, int(rows * manager_ratio)) if rows > 1 else 0
+    is_manager = np.zeros(rows, dtype=bool)
+    is_manager[:n_managers] = True
+    performance_score = np.round(rng.uniform(1.0, 5.0, size=rows), 1)
+    performance_score[is_manager] = np.round(
+        rng.uniform(MIN_MANAGER_SCORE, 5.0, size=n_managers), 1
+    )
+
+    # 管理職以外の社員に上司を割り当てる（管理職自身の上司はNULL）
+    manager_values = np.zeros(rows, dtype=np.int64)
+    manager_mask = np.ones(rows, dtype=bool)
+    if n_managers > 0:
+        fanin = np.arange(1, n_managers + 1, dtype=np.float64) ** -manager_skew
+        assigned = rng.choice(n_managers, size=rows - n_managers, p=fanin / fanin.sum())
+        manager_values[n_managers:] = employee_id[assigned]
+        manager_mask[n_managers:] = False
+    manager_id = pd.arrays.IntegerArray(manager_values, manager_mask)
+
+    df = pd.DataFrame(
+        {
+            "employee_id": employee_id,
+            "name": NAMES[rng.integers(0, len(NAMES), size=rows)],
+            "age": rng.integers(18, 66, size=rows, dtype=np.int64),
+            "department": department,
+            "salary": rng.integers(300000, 800001, size=rows, dtype=np.int64),
+            "join_date": pd.Timestamp("2000-01-01")
+            + pd.to_timedelta(rng.integers(0, 9000, size=rows), unit="D"),
+            "manager_id": manager_id,
+            "performance_score": performance_score,
+        }
+    )
+
+    if invalid_rate > 0:
+        _inject_invalid_values(df, invalid_rate, rng)
+    return df
+
+
+def _inject_invalid_values(
+    df: pd.DataFrame, invalid_rate: float, rng: np.random.Generator
+) -> None:
+    """指定した割合の行に、行単位のチェックに違反する値を注入する。"""
+    invalid_rows = np.flatnonzero(rng.random(len(df)) < invalid_rate)
+    kinds = rng.integers(0, len(INVALID_KINDS), size=len(invalid_rows))
+
+    for code, kind in enumerate(INVALID_KINDS):
+        rows = invalid_rows[kinds == code]
+        if len(rows) == 0:
+            continue
+        if kind == "salary":
+            df.loc[rows, "salary"] = 200000
+        elif kind == "age":
+            df.loc[rows, "age"] = 17
+        elif kind == "department":
+            df.loc[rows, "department"] = "Legal"
+        elif kind == "performance_score":
+            df.loc[rows, "performance_score"] = 5.5
+        elif kind == "name":
+            df.loc[rows, "name"] = "X"
+        elif kind == "join_date":
+            df.loc[rows, "join_date"] = pd.Timestamp("1999-12-31")
+        elif kind == "manager_id":
+            df.loc[rows, "manager_id"] = df.loc[rows, "employee_id"]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""検証サービスに小さなリクエストを同時に送り、スループットと遅延を計測する。
+
+使い方:
+    python -m benchmarks.load_service --concurrency 64 --requests 2000
+    python -m benchmarks.load_service --max-batch-size 1 16 64 --output load.json
+    python -m benchmarks.load_service --url 127.0.0.1:8080
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.data import generate_employee_data
+from benchmarks.run_benchmarks import environment_info
+from pandera_validation.utils.service import DEFAULT_MAX_WAIT, ValidationService
+
+
+def make_payloads(
+    count: int, min_rows: int = 1, max_rows: int = 50, seed: int = 0
+) -> List[bytes]:
+    """1リクエストあたりmin_rows〜max_rows行のリクエストボディを作成する。"""
+    rng = np.random.default_rng(seed)
+    payloads = []
+    for i in range(count):
+        rows = int(rng.integers(min_rows, max_rows + 1))
+        df = generate_employee_data(rows, manager_ratio=0.3, seed=seed + i)
+        df["join_date"] = df["join_date"].dt.strftime("%Y-%m-%d")
+        body = df.to_json(orient="records", force_ascii=False)
+        payloads.append(body.encode())
+    return payloads
+
+
+async def _post(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, body: bytes
+) -> Dict[str, Any]:
+    """Keep-Aliveの接続で /validate にリクエストを送り、レスポンスを読み込む。"""
+    writer.write(
+        b"POST /validate HTTP/1.1\r\nHost: localhost\r\n"
+        b"Content-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    response = json.loads(await reader.readexactly(length))
+    if b" 200 " not in status:
+        raise RuntimeError(f"リクエストが失敗しました: {status!r} {response}")
+    return response
+
+
+async def run_load(
+    host: str, port: int, payloads: Sequence[bytes], concurrency: int
+) -> Dict[str, Any]:
+    """同時接続数のクライアントからリクエストを送り、遅延の分布を求める。"""
+    latencies: List[float] = []
+    failures = 0
+    next_index = 0
+
+    async def client() -> None:
+        nonlocal next_index, failures
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while next_index < len(payloads):
+                body = payloads[next_index]
+                next_index += 1
+                start = time.perf_counter()
+                response = await _post(reader, writer, body)
+                latencies.append(time.perf_counter() - start)
+                failures += not response["success"]
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    seconds = np.array(latencies)
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "failed_validations": failures,
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "latency_p50_ms": float(np.percentile(seconds, 50) * 1000),
+        "latency_p99_ms": float(np.percentile(seconds, 99) * 1000),
+        "latency_max_ms": float(seconds.max() * 1000),
+    }
+
+
+async def run_local(
+    payloads: Sequence[bytes],
+    concurrency: int,
+    max_batch_size: int,
+    max_wait: float,
+) -> Dict[str, Any]:
+    """同じプロセス内で検証サービスを起動して負荷をかける。"""
+    service = ValidationService(
+        port=0, max_batch_size=max_batch_size, max_wait=max_wait
+    )
+    await service.start()
+    try:
+        # 接続とスキーマの準備を計測から除くための予備実行
+        await run_load(service.host, service.port, payloads[:concurrency], concurrency)
+        batches = service.batcher.batch_count
+        result = await run_load(service.host, service.port, payloads, concurrency)
+        batches = service.batcher.batch_count - batches
+    finally:
+        await service.stop()
+    return {
+        "max_batch_size": max_batch_size,
+        "max_wait": max_wait,
+        "batches": batches,
+        "mean_batch_size": result["requests"] / batches if batches else None,
+        **result,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """負荷試験を実行して結果を表示・保存する。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="リクエスト数")
+    parser.add_argument("--concurrency", type=int, default=64, help="同時接続数")
+    parser.add_argument(
+        "--max-batch-size",
+        nargs="+",
+        type=int,
+        default=[1, 64],
+        help="計測するマイクロバッチの最大件数（1はバッチ化なし）",
+    )
+    parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=DEFAULT_MAX_WAIT,
+        help="後続のリクエストを待つ最大時間（秒）",
+    )
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="起動済みのサービスのホスト:ポート（省略時は同じプロセスで起動する）",
+    )
+    parser.add_argument("--output", default=None, help="結果を保存するJSONファイル")
+    args = parser.parse_args(argv)
+
+    # 計測中のログ出力を抑制
+    logging.getLogger("pandera_validation").setLevel(logging.CRITICAL)
+
+    payloads = make_payloads(args.requests)
+    results = []
+    if args.url:
+        host, _, port = args.url.rpartition(":")
+        results.append(
+            asyncio.run(run_load(host, int(port), payloads, args.concurrency))
+        )
+    else:
+        for max_batch_size in args.max_batch_size:
+            results.append(
+                asyncio.run(
+                    run_local(payloads, args.concurrency, max_batch_size, args.max_wait)
+                )
+            )
+
+    for result in results:
+        print(
+            f"batch={result.get('max_batch_size', '-'):>4} "
+            f"{result['requests_per_second']:8.1f}件/秒 "
+            f"p50={result['latency_p50_ms']:7.1f}ms "
+            f"p99={result['latency_p99_ms']:7.1f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"environment": environment_info(), "results": results},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\n結果を '{args.output}' に保存しました")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""社員データバリデーションのベンチマークを実行し、結果をJSONに保存する。
+
+使い方:
+    python -m benchmarks.run_benchmarks --sizes 1e3 1e4 1e5 1e6 --output results.json
+    python -m benchmarks.run_benchmarks --sizes 1e5 --compare baseline.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.schemas import create_employee_schema
+from pandera_validation.utils import get_employee_schema, validate_employee_data
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.readers import _has_pyarrow, read_employee_csv
+from pandera_validation.utils.snapshot import load_employee_snapshot
+from pandera_validation.utils.validation import build_summary
+
+
+def time_stage(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """処理を複数回実行し、最短・中央値の実行時間（秒）を返す。"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings)}
+
+
+def run_size(rows: int, invalid_rate: float, repeat: int) -> List[Dict[str, Any]]:
+    """1つのデータサイズについて、全体と段階ごとの実行時間を計測する。"""
+    df = generate_employee_data(rows, invalid_rate=invalid_rate)
+    schema = get_employee_schema()
+    row_schema = get_employee_schema(row_level=True)
+
+    def validate_full():
+        try:
+            return schema.validate(df)
+        except pa.errors.SchemaError:
+            return None
+
+    def validate_rows():
+        try:
+            row_schema.validate(df)
+        except pa.errors.SchemaError:
+            pass
+
+    # 組み込みの値チェックのみのスキーマ（Panderaでの評価と融合した評価の比較用）
+    fused = compile_schema(schema)
+    builtin_schema = pa.DataFrameSchema(
+        {
+            name: pa.Column(checks=checks, nullable=True)
+            for name, checks in fused.column_checks.items()
+        }
+    )
+
+    def validate_builtin():
+        try:
+            builtin_schema.validate(df)
+        except pa.errors.SchemaError:
+            pass
+
+    validated_df = validate_full()
+    stages = {
+        "end_to_end": lambda: validate_employee_data(df),
+        "compact": lambda: validate_employee_data(df, compact=True),
+        "schema_build": create_employee_schema,
+        "row_checks": validate_rows,
+        "all_checks": validate_full,
+        "builtin_checks": validate_builtin,
+        "fused_checks": lambda: fused.failure_masks(df),
+    }
+    if validated_df is not None:
+        stages["summary"] = lambda: build_summary(validated_df)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # CSVの読み込みと、列指向キャッシュをメモリマップで開く場合の比較
+        if _has_pyarrow():
+            csv_path = Path(tmp_dir) / "employees.csv"
+            df.to_csv(csv_path, index=False)
+            load_employee_snapshot(csv_path)
+            stages["csv_load"] = lambda: read_employee_csv(csv_path)
+            stages["snapshot_load"] = lambda: load_employee_snapshot(csv_path)
+
+        for stage, func in stages.items():
+            timing = time_stage(func, repeat)
+            results.append(
+                {
+                    "rows": rows,
+                    "invalid_rate": invalid_rate,
+                    "stage": stage,
+                    "seconds_min": timing["min"],
+                    "seconds_median": timing["median"],
+                    "rows_per_second": (
+                        rows / timing["min"] if timing["min"] else None
+                    ),
+                }
+            )
+    return results
+
+
+def environment_info() -> Dict[str, Any]:
+    """計測環境とコミットの情報を返す。"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": pd.Timestamp.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pandera": pa.__version__,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str) -> None:
+    """ベースラインのJSONと比較し、段階ごとの速度比を表示する。"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    base_index = {
+        (r["rows"], r["invalid_rate"], r["stage"]): r["seconds_min"]
+        for r in baseline["results"]
+    }
+
+    print(f"\n=== ベースライン比較 ({baseline['environment'].get('commit')}) ===")
+    for result in results:
+        key = (result["rows"], result["invalid_rate"], result["stage"])
+        if key in base_index:
+            ratio = base_index[key] / result["seconds_min"]
+            print(f"{key[0]:>10} {key[2]:<14} {ratio:6.2f}倍")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """ベンチマークを実行して結果を保存する。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=float,
+        default=[1e3, 1e4, 1e5, 1e6],
+        help="計測する行数（例: 1e3 1e7）",
+    )
+    parser.add_argument(
+        "--invalid-rate", type=float, default=0.0, help="不正値を含む行の割合"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数")
+    parser.add_argument(
+        "--output", default="bench_results.json", help="結果を保存するJSONファイル"
+    )
+    parser.add_argument("--compare", default=None, help="比較するベースラインJSON")
+    args = parser.parse_args(argv)
+
+    # 計測中のログ出力を抑制
+    logging.getLogger("pandera_validation").setLevel(logging.WARNING)
+
+    results = []
+    for size in args.sizes:
+        rows = int(size)
+        for result in run_size(rows, args.invalid_rate, args.repeat):
+            results.append(result)
+            print(
+                f"{result['rows']:>10} {result['stage']:<14} "
+                f"{result['seconds_min']:.4f}秒"
+            )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(
+            {"environment": environment_info(), "results": results},
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    print(f"\n結果を '{args.output}' に保存しました")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
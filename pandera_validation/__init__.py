@@ -1,3 +1,24 @@
-"""Panderaを使用したデータバリデーションのデモパッケージ。"""
+"""Panderaを使用したデータバリデーションのデモパッケージ。
+
+``create_employee_schema`` と ``validate_employee_data`` は最初に参照されたときに
+読み込むため、パッケージの読み込みではpandas・Panderaを読み込まない。
+"""
+
+from typing import TYPE_CHECKING
+
+from pandera_validation._lazy import attach
+
+if TYPE_CHECKING:
+    from pandera_validation.schemas.employee import create_employee_schema
+    from pandera_validation.utils.validation import validate_employee_data
 
 __version__ = "0.1.0"
+
+# 属性名と、その属性を定義するモジュールの対応
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "create_employee_schema": "pandera_validation.schemas.employee",
+        "validate_employee_data": "pandera_validation.utils.validation",
+    },
+)
@@ -0,0 +1,42 @@
+"""パッケージの属性を最初に参照されたときに読み込む遅延読み込みの共通処理。
+
+各パッケージの ``__init__`` は属性名と定義元モジュールの対応を ``attach`` に渡し、
+返されたモジュールレベルの ``__getattr__`` ・ ``__dir__`` ・ ``__all__`` を定義する。
+このモジュールは標準ライブラリのみを使用する。
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(
+    package_name: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """パッケージに遅延読み込みする属性を登録する。
+
+    Args:
+        package_name: 属性を登録するパッケージの名前（``__name__``）
+        attributes: 属性名と、その属性を定義するモジュールの対応
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+            パッケージの ``__getattr__`` 、 ``__dir__`` 、 ``__all__``
+            （属性名の昇順）
+    """
+
+    def __getattr__(name: str) -> Any:
+        """属性を定義するモジュールを読み込み、属性を返す。"""
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        # 2回目以降はモジュールの属性として直接参照される
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        """読み込み前の属性を含む属性名の一覧を返す。"""
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes))
+
+    return __getattr__, __dir__, sorted(attributes)
@@ -1,5 +1,38 @@
-"""Panderaスキーマ定義モジュール。"""
+"""Panderaスキーマ定義モジュール。
 
-from pandera_validation.schemas.employee import create_employee_schema
+スキーマ定義はPanderaを読み込むため、各属性は最初に参照されたときに読み込む。
+スキーマの定義（``EMPLOYEE_STRUCTURE``）とアーティファクトの読み書きは
+Panderaに依存しない。
+"""
 
-__all__ = ["create_employee_schema"]
+from typing import TYPE_CHECKING
+
+from pandera_validation._lazy import attach
+
+if TYPE_CHECKING:
+    from pandera_validation.schemas.artifact import (
+        export_schema_artifact,
+        load_schema_artifact,
+    )
+    from pandera_validation.schemas.columns import EMPLOYEE_STRUCTURE, schema_hash
+    from pandera_validation.schemas.employee import (
+        check_department_avg_salary,
+        check_manager_min_score,
+        check_manager_not_self,
+        create_employee_schema,
+    )
+
+# 属性名と、その属性を定義するモジュールの対応
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "EMPLOYEE_STRUCTURE": "pandera_validation.schemas.columns",
+        "check_department_avg_salary": "pandera_validation.schemas.employee",
+        "check_manager_min_score": "pandera_validation.schemas.employee",
+        "check_manager_not_self": "pandera_validation.schemas.employee",
+        "create_employee_schema": "pandera_validation.schemas.employee",
+        "export_schema_artifact": "pandera_validation.schemas.artifact",
+        "load_schema_artifact": "pandera_validation.schemas.artifact",
+        "schema_hash": "pandera_validation.schemas.columns",
+    },
+)
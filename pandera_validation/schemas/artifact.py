@@ -0,0 +1,135 @@
+"""スキーマの定義をバージョン付きのJSON・YAMLファイルとして保存・読み込みする。
+
+アーティファクトには ``FrameStructure.to_dict()`` の内容に、スキーマのハッシュ
+（``schema_hash``）を加えて保存する。読み込み時はハッシュを内容から求め直し、
+編集や破損で内容と一致しない場合はエラーとする。読み込んだ定義は
+``get_employee_schema(structure=...)`` に渡すと、ワーカープロセスでも
+ハッシュごとに一度だけPanderaのスキーマを構築する。
+YAMLの読み書きにはPyYAMLが必要となる（JSONは標準ライブラリのみで扱える）。
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pandera_validation.schemas.columns import (
+    EMPLOYEE_STRUCTURE,
+    FrameStructure,
+    schema_hash,
+)
+
+# YAML形式として扱う拡張子
+YAML_SUFFIXES = frozenset({".yaml", ".yml"})
+
+# アーティファクトの形式のバージョン（辞書の構造を変更したら更新する）
+ARTIFACT_FORMAT = 1
+
+
+def _is_yaml(path: Union[str, Path]) -> bool:
+    """拡張子からYAMLファイルかどうかを判定する。"""
+    return Path(path).suffix.lower() in YAML_SUFFIXES
+
+
+def _require_yaml() -> Any:
+    """PyYAMLモジュールを返す（インストールされていない場合はエラー）。"""
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError(
+            "YAML形式のアーティファクトにはPyYAMLが必要です（pip install pyyaml）"
+        ) from e
+    return yaml
+
+
+def artifact_dict(structure: Optional[FrameStructure] = None) -> Dict[str, Any]:
+    """スキーマの定義をアーティファクトの辞書にする。
+
+    Args:
+        structure: スキーマの定義（Noneの場合は ``EMPLOYEE_STRUCTURE``）
+
+    Returns:
+        Dict[str, Any]: 形式のバージョンとハッシュを加えた定義の辞書
+    """
+    structure = structure if structure is not None else EMPLOYEE_STRUCTURE
+    return {
+        "format": ARTIFACT_FORMAT,
+        "hash": schema_hash(structure),
+        **structure.to_dict(),
+    }
+
+
+def export_schema_artifact(
+    path: Union[str, Path], structure: Optional[FrameStructure] = None
+) -> str:
+    """スキーマの定義をJSONまたはYAMLファイルに保存する。
+
+    拡張子が ``.yaml``・``.yml`` の場合はYAML、それ以外はJSONで保存する。
+    書き込み途中のファイルが残らないよう、一時ファイルに書き出してから置き換える。
+
+    Args:
+        path: 保存先のファイルパス
+        structure: スキーマの定義（Noneの場合は ``EMPLOYEE_STRUCTURE``）
+
+    Returns:
+        str: 保存したスキーマのハッシュ
+
+    Raises:
+        ImportError: YAMLで保存する場合にPyYAMLがインストールされていない場合
+    """
+    data = artifact_dict(structure)
+    if _is_yaml(path):
+        text = _require_yaml().safe_dump(data, allow_unicode=True, sort_keys=False)
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return data["hash"]
+
+
+def load_schema_artifact(path: Union[str, Path]) -> FrameStructure:
+    """JSONまたはYAMLファイルからスキーマの定義を読み込む。
+
+    同じファイルは大きさと更新時刻が変わらない限り一度だけ解析する。
+
+    Args:
+        path: 読み込むファイルのパス
+
+    Returns:
+        FrameStructure: スキーマの定義
+
+    Raises:
+        ImportError: YAMLファイルでPyYAMLがインストールされていない場合
+        ValueError: 未対応の形式のバージョンの場合、または記録されたハッシュが
+            内容から求めたハッシュと一致しない場合
+    """
+    stat = os.stat(path)
+    return _load_schema_artifact(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_schema_artifact(path: str, size: int, mtime_ns: int) -> FrameStructure:
+    """ファイルの大きさと更新時刻をキーとしてアーティファクトを解析する。"""
+    with open(path, encoding="utf-8") as f:
+        if _is_yaml(path):
+            data = _require_yaml().safe_load(f)
+        else:
+            data = json.load(f)
+
+    if data.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(
+            f"未対応のアーティファクトの形式です: {data.get('format')}"
+            f"（対応: {ARTIFACT_FORMAT}）"
+        )
+    structure = FrameStructure.from_dict(data)
+    actual = schema_hash(structure)
+    if data.get("hash") != actual:
+        raise ValueError(
+            f"アーティファクトのハッシュが内容と一致しません: {path} "
+            f"（記録: {data.get('hash')}, 内容: {actual}）"
+        )
+    return structure
@@ -0,0 +1,278 @@
+"""社員データスキーマの定義（列名・データ型・NULL許容・チェックなど）。
+
+Panderaのスキーマ（``create_employee_schema``）、構造の事前チェック
+（``preflight_check``）、CSVの読み込み引数、スキーマのアーティファクトは
+すべてこの定義から作成する。pandas・Panderaに依存しないため、構造の確認では
+これらを読み込まずに参照できる。各属性は ``DataFrameSchema`` の列と同じ名前を
+持つため、スキーマの代わりに渡せる。
+
+チェックは名前とパラメータで表す。列のチェックはPanderaの組み込みチェック
+（``Check.<名前>``）、データフレームレベルのチェックは ``schemas.employee`` の
+``FRAME_CHECKS`` に登録したベクトル演算の関数を名前で参照する。
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+# スキーマのバージョン（検証ルールを変更したら更新し、保存済みの検証結果を無効にする）
+SCHEMA_VERSION = 5
+
+# 許可された部署名
+ALLOWED_DEPARTMENTS = ["IT", "HR", "Finance", "Marketing", "Sales", "R&D"]
+
+# 部署平均給与の下限（円）
+MIN_DEPARTMENT_AVG_SALARY = 300000
+
+# 管理職の評価スコアの下限
+MIN_MANAGER_SCORE = 3.5
+
+# 管理階層の深さ（最上位の社員から数えた上司の段数）の上限
+MAX_HIERARCHY_DEPTH = 10
+
+# スキーマのハッシュの16進数の桁数
+SCHEMA_HASH_LENGTH = 16
+
+
+@dataclass(frozen=True)
+class CheckStructure:
+    """1つのチェックの定義。
+
+    Attributes:
+        name: チェック名（列のチェックは組み込みチェックの名前、データフレーム
+            レベルのチェックは ``FRAME_CHECKS`` に登録した名前）
+        options: チェックのパラメータ（日付列の値はISO 8601形式の文字列）
+        error: 失敗時のエラーメッセージ（Noneの場合はPanderaの既定のメッセージ）
+    """
+
+    name: str
+    options: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書にする。"""
+        return {"name": self.name, "options": self.options, "error": self.error}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CheckStructure":
+        """``to_dict`` の辞書から作成する。"""
+        return cls(data["name"], dict(data.get("options") or {}), data.get("error"))
+
+
+@dataclass(frozen=True)
+class ColumnStructure:
+    """1つの列の定義。
+
+    Attributes:
+        dtype: データ型の名前（``str(Column.dtype)`` と同じ表記）
+        nullable: NULL値を許容するかどうか
+        required: 必須の列かどうか
+        coerce: 検証時にデータ型を変換するかどうか
+        unique: 値が一意である必要があるかどうか
+        checks: 列の値のチェック
+        description: 列の説明
+    """
+
+    dtype: str
+    nullable: bool = False
+    required: bool = True
+    coerce: bool = False
+    unique: bool = False
+    checks: Tuple[CheckStructure, ...] = ()
+    description: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書にする。"""
+        return {
+            "dtype": self.dtype,
+            "nullable": self.nullable,
+            "required": self.required,
+            "coerce": self.coerce,
+            "unique": self.unique,
+            "checks": [check.to_dict() for check in self.checks],
+            "description": self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnStructure":
+        """``to_dict`` の辞書から作成する。"""
+        return cls(
+            dtype=data["dtype"],
+            nullable=data.get("nullable", False),
+            required=data.get("required", True),
+            coerce=data.get("coerce", False),
+            unique=data.get("unique", False),
+            checks=tuple(CheckStructure.from_dict(c) for c in data.get("checks", [])),
+            description=data.get("description"),
+        )
+
+
+@dataclass(frozen=True)
+class FrameStructure:
+    """データフレームのスキーマの定義。
+
+    内容から求めたハッシュで比較・ハッシュ化するため、``get_employee_schema`` の
+    キャッシュのキーとして使用できる。
+
+    Attributes:
+        columns: 列名と列の定義の対応（スキーマの列の順序）
+        ordered: 列の順序を確認するかどうか
+        checks: データフレームレベルのチェック（評価する順序）
+        name: スキーマの名前
+        description: スキーマの説明
+        version: スキーマのバージョン
+    """
+
+    columns: Dict[str, ColumnStructure]
+    ordered: bool = False
+    checks: Tuple[CheckStructure, ...] = ()
+    name: Optional[str] = None
+    description: Optional[str] = None
+    version: int = 0
+
+    def __hash__(self) -> int:
+        return hash(schema_hash(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書にする。"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "version": self.version,
+            "ordered": self.ordered,
+            "columns": {
+                name: column.to_dict() for name, column in self.columns.items()
+            },
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FrameStructure":
+        """``to_dict`` の辞書から作成する。"""
+        return cls(
+            columns={
+                name: ColumnStructure.from_dict(column)
+                for name, column in data["columns"].items()
+            },
+            ordered=data.get("ordered", False),
+            checks=tuple(CheckStructure.from_dict(c) for c in data.get("checks", [])),
+            name=data.get("name"),
+            description=data.get("description"),
+            version=data.get("version", 0),
+        )
+
+
+def schema_hash(structure: Optional[FrameStructure] = None) -> str:
+    """スキーマの定義の内容から、バージョンを識別するハッシュを求める。
+
+    キーを並べ替えたJSONのSHA-256の先頭 ``SCHEMA_HASH_LENGTH`` 桁とするため、
+    同じ定義からは実行環境によらず同じ値になる。
+
+    Args:
+        structure: スキーマの定義（Noneの場合は ``EMPLOYEE_STRUCTURE``）
+
+    Returns:
+        str: 16進数のハッシュ文字列
+    """
+    if structure is None:
+        return EMPLOYEE_SCHEMA_HASH
+    text = json.dumps(
+        structure.to_dict(), sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:SCHEMA_HASH_LENGTH]
+
+
+# 社員データスキーマの定義
+EMPLOYEE_STRUCTURE = FrameStructure(
+    columns={
+        # 社員ID: 1000以上の整数で一意である必要がある
+        "employee_id": ColumnStructure(
+            "int64",
+            unique=True,
+            checks=(CheckStructure("greater_than_or_equal_to", {"min_value": 1000}),),
+            description="社員ID（1000以上の一意の整数）",
+        ),
+        # 名前: 文字列で2〜20文字の長さ
+        "name": ColumnStructure(
+            "str",
+            checks=(CheckStructure("str_length", {"min_value": 2, "max_value": 20}),),
+            description="社員名（2-20文字）",
+        ),
+        # 年齢: 18〜65歳の整数
+        "age": ColumnStructure(
+            "int64",
+            checks=(CheckStructure("in_range", {"min_value": 18, "max_value": 65}),),
+            description="年齢（18-65歳）",
+        ),
+        # 部署: 許可されたリストの中の値
+        "department": ColumnStructure(
+            "str",
+            checks=(CheckStructure("isin", {"allowed_values": ALLOWED_DEPARTMENTS}),),
+            description="部署名",
+        ),
+        # 給与: 250000以上の数値
+        "salary": ColumnStructure(
+            "int64",
+            checks=(CheckStructure("greater_than_or_equal_to", {"min_value": 250000}),),
+            description="月給（円）",
+        ),
+        # 入社日: 日付型、2000年以降の日付
+        "join_date": ColumnStructure(
+            "datetime64[ns]",
+            checks=(
+                CheckStructure(
+                    "greater_than_or_equal_to",
+                    {"min_value": "2000-01-01"},
+                    error="入社日は2000年1月1日以降である必要があります",
+                ),
+            ),
+            description="入社日",
+        ),
+        # 上司のID: NULLまたは自分自身のIDではない社員ID
+        # （自分自身との比較はデータフレームレベルのチェックで行う）
+        # （欠損値を含むため浮動小数点数で保存された列は整数型に変換する）
+        "manager_id": ColumnStructure(
+            "Int64", nullable=True, coerce=True, description="上司の社員ID"
+        ),
+        # 評価スコア: 1.0〜5.0の範囲の浮動小数点数
+        "performance_score": ColumnStructure(
+            "float64",
+            checks=(CheckStructure("in_range", {"min_value": 1.0, "max_value": 5.0}),),
+            description="業績評価スコア（1.0-5.0）",
+        ),
+    },
+    checks=(
+        # 上司IDがNULLでなければ、自分自身のIDと異なること
+        CheckStructure(
+            "manager_not_self", error="上司IDは自分自身のIDと異なる必要があります"
+        ),
+        # 上司IDが社員IDとして存在すること
+        CheckStructure(
+            "manager_exists", error="上司IDは存在する社員IDである必要があります"
+        ),
+        # 管理階層に循環がないこと
+        CheckStructure("no_manager_cycle", error="管理階層に循環があってはなりません"),
+        # 管理階層の深さが上限以下であること
+        CheckStructure(
+            "hierarchy_depth",
+            error=f"管理階層の深さは{MAX_HIERARCHY_DEPTH}段以下である必要があります",
+        ),
+        # 各部署の平均給与が下限以上であること
+        CheckStructure(
+            "department_avg_salary",
+            error=f"各部署の平均給与は{MIN_DEPARTMENT_AVG_SALARY}円以上である必要があります",
+        ),
+        # 管理職（他の人の上司になっている人）の評価スコアが下限以上であること
+        CheckStructure(
+            "manager_min_score",
+            error=f"管理職の評価スコアは{MIN_MANAGER_SCORE}以上である必要があります",
+        ),
+    ),
+    name="社員情報スキーマ",
+    description="会社社員の基本情報と業績に関するデータスキーマ",
+    version=SCHEMA_VERSION,
+)
+
+# 社員データスキーマの定義のハッシュ
+EMPLOYEE_SCHEMA_HASH = schema_hash(EMPLOYEE_STRUCTURE)
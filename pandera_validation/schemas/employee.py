@@ -1,15 +1,429 @@
-"""社員データバリデーションのためのPanderaスキーマ定義。"""
+"""社員データバリデーションのためのPanderaスキーマ定義。
 
+スキーマの列とチェックは ``schemas.columns`` の ``EMPLOYEE_STRUCTURE`` に定義し、
+このモジュールはその定義からPanderaのスキーマを構築する。データフレームレベルの
+チェックは、定義の名前に対応するベクトル演算の関数（``FRAME_CHECKS``）で評価する。
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
 import pandera as pa
-from pandera import Column, DataFrameSchema, Check
+from pandera import Check, Column, DataFrameSchema
+
+from pandera_validation.schemas.columns import (
+    ALLOWED_DEPARTMENTS,
+    EMPLOYEE_STRUCTURE,
+    MAX_HIERARCHY_DEPTH,
+    MIN_DEPARTMENT_AVG_SALARY,
+    MIN_MANAGER_SCORE,
+    SCHEMA_VERSION,
+    CheckStructure,
+    ColumnStructure,
+    FrameStructure,
+    schema_hash,
+)
+from pandera_validation.schemas.hierarchy import ManagerHierarchy
+
+# 行ごとに独立して評価できるデータフレームレベルのチェック名
+ROW_LEVEL_CHECKS = frozenset({"manager_not_self"})
+
+# 直前に作成した管理階層（同じデータに対する複数のチェックで共有する）
+_hierarchy_memo = threading.local()
+
+
+def check_manager_not_self(df: pd.DataFrame) -> pd.DataFrame:
+    """上司IDが自分自身の社員IDと異なることを列単位でまとめて検証する。
+
+    行ごとにPython関数を呼び出す代わりに、``manager_id`` 列と
+    ``employee_id`` 列をベクトル演算で比較する。上司IDがNULLの行は有効とする。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        pd.DataFrame: 入力と同じ形状のブール値のデータフレーム。
+            失敗ケースが ``manager_id`` 列に対して報告されるよう、
+            他の列はすべてTrueとする
+    """
+    manager_id = df["manager_id"]
+    is_valid = manager_id.isna() | (manager_id != df["employee_id"])
+    result = pd.DataFrame(True, index=df.index, columns=df.columns)
+    result["manager_id"] = is_valid.fillna(True).astype(bool)
+    return result
+
+
+def manager_hierarchy(df: pd.DataFrame) -> ManagerHierarchy:
+    """社員データの管理階層を取得する。
+
+    存在・循環・深さの3つのチェックで同じ管理階層を使用するため、
+    直前に作成した管理階層を社員ID・上司IDの値が一致する場合に再利用する。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        ManagerHierarchy: 管理階層の状態
+    """
+    employee_ids = df["employee_id"].to_numpy(dtype=np.int64)
+    manager_ids = df["manager_id"].to_numpy(dtype=np.int64, na_value=0)
+    has_manager = df["manager_id"].notna().to_numpy()
+    memo = getattr(_hierarchy_memo, "value", None)
+    if memo is not None:
+        key, hierarchy = memo
+        if all(
+            np.array_equal(cached, current)
+            for cached, current in zip(key, (employee_ids, manager_ids, has_manager))
+        ):
+            return hierarchy
+
+    hierarchy = ManagerHierarchy.from_ids(employee_ids, manager_ids, has_manager)
+    key = (employee_ids.copy(), manager_ids.copy(), has_manager.copy())
+    _hierarchy_memo.value = (key, hierarchy)
+    return hierarchy
+
+
+def check_manager_exists(df: pd.DataFrame) -> Union[bool, pd.DataFrame]:
+    """上司IDが社員IDとして存在することを検証する。上司IDがNULLの行は有効とする。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Union[bool, pd.DataFrame]: すべての行が有効な場合はTrue、それ以外は
+            ``manager_id`` 列に結果を持つブール値のデータフレーム
+    """
+    return _failure_table(df, "manager_id", ~manager_hierarchy(df).missing)
+
+
+def check_no_manager_cycle(df: pd.DataFrame) -> Union[bool, pd.DataFrame]:
+    """上司をたどった管理階層に循環（A→B→A）がないことを検証する。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Union[bool, pd.DataFrame]: すべての行が有効な場合はTrue、それ以外は
+            ``manager_id`` 列に結果を持つブール値のデータフレーム。
+            循環に含まれる行が失敗となる
+    """
+    return _failure_table(df, "manager_id", ~manager_hierarchy(df).in_cycle)
+
+
+def check_hierarchy_depth(df: pd.DataFrame) -> Union[bool, pd.DataFrame]:
+    """管理階層の深さが上限（``MAX_HIERARCHY_DEPTH``）以下であることを検証する。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Union[bool, pd.DataFrame]: すべての行が有効な場合はTrue、それ以外は
+            ``manager_id`` 列に結果を持つブール値のデータフレーム。
+            上限を超える行と、循環に至る行が失敗となる
+    """
+    hierarchy = manager_hierarchy(df)
+    return _failure_table(df, "manager_id", ~hierarchy.too_deep(MAX_HIERARCHY_DEPTH))
+
+
+def _failure_table(
+    df: pd.DataFrame, column: str, is_valid: np.ndarray
+) -> Union[bool, pd.DataFrame]:
+    """失敗した行のみを指定した列の失敗ケースとするチェック結果を作成する。
+
+    Panderaはデータフレームの結果から失敗ケースを集める際に全列を走査するため、
+    すべての行が有効な場合はTrueを返してその処理を省く。
+    """
+    if is_valid.all():
+        return True
+    result = pd.DataFrame(True, index=df.index, columns=df.columns)
+    result[column] = is_valid
+    return result
+
+
+def low_score_manager_rows(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """評価スコアが下限未満の管理職の行位置を求める。
+
+    管理職（他の社員の上司として参照されている社員）の行は、管理階層と共有する
+    社員IDの索引から求め、その行の評価スコアのみを参照する（データフレームの
+    部分的な複製は作成しない）。社員IDが重複する場合は最初の行を管理職とする。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        Optional[np.ndarray]: 下限未満の管理職の行位置。管理職が1人もいない場合
+            （管理職の評価スコアがすべてNULLの場合を含む）はNone
+    """
+    rows = np.flatnonzero(manager_hierarchy(df).referenced)
+    scores = df["performance_score"].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+    if np.isnan(scores).all():
+        return None
+    return rows[scores < MIN_MANAGER_SCORE]
+
+
+def check_manager_min_score(df: pd.DataFrame) -> Union[bool, pd.DataFrame]:
+    """管理職の評価スコアが下限（``MIN_MANAGER_SCORE``）以上であることを検証する。
+
+    管理職が1人もいない場合は失敗とする。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Union[bool, pd.DataFrame]: すべての管理職が下限以上の場合はTrue、
+            管理職がいない場合はFalse、それ以外は下限未満の管理職の行を
+            ``performance_score`` 列の失敗ケースとするブール値のデータフレーム
+    """
+    low = low_score_manager_rows(df)
+    if low is None:
+        return False
+    is_valid = np.ones(len(df), dtype=bool)
+    is_valid[low] = False
+    return _failure_table(df, "performance_score", is_valid)
+
+
+# 失敗ケースを ``manager_id`` 列に報告するデータフレームレベルのチェック
+MANAGER_ID_CHECKS = {
+    "manager_not_self": check_manager_not_self,
+    "manager_exists": check_manager_exists,
+    "no_manager_cycle": check_no_manager_cycle,
+    "hierarchy_depth": check_hierarchy_depth,
+}
+
 
+def department_codes(departments: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """部署名を整数の部署コードに変換する。
 
-def create_employee_schema() -> DataFrameSchema:
+    カテゴリ型の列はカテゴリのコードをそのまま使用する。それ以外の列は
+    許可された部署名の一覧での位置をコードとし、一覧にない部署名がある場合のみ
+    出現した部署名からコードを作成する。NULL値のコードは-1とする。
+
+    Args:
+        departments: 部署名の列
+
+    Returns:
+        Tuple[np.ndarray, pd.Index]: 各行の部署コードと、各コードの部署名
+    """
+    if isinstance(departments.dtype, pd.CategoricalDtype):
+        return departments.cat.codes.to_numpy(), departments.cat.categories
+    names = pd.Index(ALLOWED_DEPARTMENTS)
+    codes = names.get_indexer(departments)
+    unknown = codes < 0
+    if unknown.any() and departments[unknown].notna().any():
+        codes, names = pd.factorize(departments)
+    return codes, names
+
+
+def department_salary_totals(
+    df: pd.DataFrame,
+) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+    """部署ごとの給与合計と人数を部署コードに対する ``np.bincount`` で求める。
+
+    部署または給与がNULLの行は集計しない。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        Tuple[pd.Index, np.ndarray, np.ndarray]: 部署名、各部署の給与合計と人数
+    """
+    codes, names = department_codes(df["department"])
+    salary = df["salary"].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = (codes >= 0) & ~np.isnan(salary)
+    if not valid.all():
+        codes, salary = codes[valid], salary[valid]
+    totals = np.bincount(codes, weights=salary, minlength=len(names))
+    counts = np.bincount(codes, minlength=len(names))
+    return names, totals, counts
+
+
+def department_salary_means(df: pd.DataFrame) -> pd.Series:
+    """社員のいる部署ごとの平均給与を求める。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        pd.Series: 部署名をインデックスとする平均給与
+    """
+    names, totals, counts = department_salary_totals(df)
+    present = counts > 0
+    return pd.Series(totals[present] / counts[present], index=names[present])
+
+
+def check_department_avg_salary(df: pd.DataFrame) -> pd.Series:
+    """各部署の平均給与が下限（``MIN_DEPARTMENT_AVG_SALARY``）以上であることを検証する。
+
+    文字列のキーでグループ化する代わりに、部署コードごとの給与合計と人数を
+    ``np.bincount`` で求める。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        pd.Series: 部署名をインデックスとする、平均給与が下限以上かどうかのブール値
+    """
+    return department_salary_means(df) >= MIN_DEPARTMENT_AVG_SALARY
+
+
+def describe_low_score_managers(df: pd.DataFrame) -> str:
+    """評価スコアが下限未満の管理職の社員IDと評価スコアを説明する文字列を返す。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        str: 社員IDと評価スコアの一覧（管理職がいない場合はその旨）
+    """
+    low = low_score_manager_rows(df)
+    if low is None:
+        return "管理職がいません"
+    managers = df.iloc[low[:10]]
+    scores = dict(
+        zip(managers["employee_id"].tolist(), managers["performance_score"].tolist())
+    )
+    return f"評価スコアが基準未満の管理職（{len(low)}人）: {scores}"
+
+
+def describe_low_salary_departments(df: pd.DataFrame) -> str:
+    """平均給与が下限未満の部署とその平均給与を説明する文字列を返す。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        str: 部署名と平均給与の一覧
+    """
+    means = department_salary_means(df)
+    low = means[~(means >= MIN_DEPARTMENT_AVG_SALARY)]
+    return f"平均給与が基準未満の部署: {low.round(2).to_dict()}"
+
+
+# 失敗内容の説明をエラーメッセージに加えるデータフレームレベルのチェック
+FRAME_CHECK_DETAILS = {
+    "department_avg_salary": describe_low_salary_departments,
+    "manager_min_score": describe_low_score_managers,
+}
+
+
+# 定義のデータフレームレベルのチェック名と、評価するベクトル演算の関数の対応
+FRAME_CHECKS = {
+    **MANAGER_ID_CHECKS,
+    "department_avg_salary": check_department_avg_salary,
+    "manager_min_score": check_manager_min_score,
+}
+
+
+def employee_column_dtypes(
+    dtype_backend: Optional[str] = None, compact: bool = False
+) -> Dict[str, Any]:
+    """スキーマの各列のデータ型を返す。
+
+    Args:
+        dtype_backend: ``"pyarrow"`` の場合はpyarrowを使用する ``pd.ArrowDtype`` を、
+            Noneの場合はNumPyベースのデータ型を返す
+        compact: Trueの場合、部署をカテゴリ型、整数列を値の範囲に合わせた
+            幅の狭い整数型とするメモリ節約用のデータ型を返す
+
+    Returns:
+        Dict[str, Any]: 列名とデータ型の対応
+
+    Raises:
+        ImportError: ``"pyarrow"`` を指定したがpyarrowがインストールされていない場合
+        ValueError: 未対応の ``dtype_backend`` を指定した場合、または
+            ``dtype_backend`` と ``compact`` を同時に指定した場合
+    """
+    if compact:
+        if dtype_backend is not None:
+            raise ValueError("compactはdtype_backendと同時に指定できません")
+        return {
+            "employee_id": "int32",
+            "name": str,
+            "age": "int8",
+            "department": "category",
+            "salary": "int32",
+            "join_date": "datetime64[ns]",
+            "manager_id": "Int32",
+            "performance_score": float,
+        }
+    if dtype_backend is None:
+        return {
+            name: column.dtype for name, column in EMPLOYEE_STRUCTURE.columns.items()
+        }
+    if dtype_backend == "pyarrow":
+        import pyarrow
+
+        return {
+            "employee_id": pd.ArrowDtype(pyarrow.int64()),
+            "name": pd.ArrowDtype(pyarrow.string()),
+            "age": pd.ArrowDtype(pyarrow.int64()),
+            "department": pd.ArrowDtype(pyarrow.string()),
+            "salary": pd.ArrowDtype(pyarrow.int64()),
+            "join_date": pd.ArrowDtype(pyarrow.timestamp("ns")),
+            "manager_id": pd.ArrowDtype(pyarrow.int64()),
+            "performance_score": pd.ArrowDtype(pyarrow.float64()),
+        }
+    raise ValueError(f"未対応のdtype_backendです: {dtype_backend}")
+
+
+def _build_check(check: CheckStructure, column: ColumnStructure) -> Check:
+    """列のチェックの定義からPanderaの組み込みチェックを作成する。"""
+    factory = getattr(Check, check.name, None)
+    if factory is None:
+        raise ValueError(f"未対応のチェックです: {check.name}")
+    options = check.options
+    if column.dtype.startswith("datetime64"):
+        # 日付列のパラメータはISO 8601形式の文字列で定義する
+        options = {
+            name: pd.Timestamp(value) if isinstance(value, str) else value
+            for name, value in options.items()
+        }
+    if check.error is not None:
+        # 指定しない場合はPanderaの既定のメッセージ（``in_range(18, 65)`` など）とする
+        options = {**options, "error": check.error}
+    return factory(**options)
+
+
+def _build_frame_check(check: CheckStructure) -> Check:
+    """データフレームレベルのチェックの定義から、登録済みの関数のチェックを作成する。"""
+    check_fn = FRAME_CHECKS.get(check.name)
+    if check_fn is None:
+        raise ValueError(f"未対応のデータフレームレベルのチェックです: {check.name}")
+    return Check(check_fn, name=check.name, error=check.error)
+
+
+def create_employee_schema(
+    row_level: bool = False,
+    dtype_backend: Optional[str] = None,
+    compact: bool = False,
+    structure: Optional[FrameStructure] = None,
+    wide_columns: Tuple[str, ...] = (),
+) -> DataFrameSchema:
     """社員データバリデーションのためのPanderaスキーマを作成する。
 
+    Args:
+        row_level: Trueの場合、行ごとに独立して評価できるチェックのみを持つ
+            スキーマを作成する（社員IDの一意性と、部署平均給与・管理職の
+            評価スコア、管理階層のチェックを除外する）。チャンク単位の検証で使用する
+        dtype_backend: ``"pyarrow"`` の場合、Parquet・Arrow IPCから読み込んだ
+            pyarrowベースの列（``pd.ArrowDtype``）をそのまま受け付けるスキーマを
+            作成する。NumPyのデータ型への変換は行わない
+        compact: Trueの場合、カテゴリ型の部署と幅の狭い整数型の列を受け付ける
+            メモリ節約用のスキーマを作成する。部署のチェックと部署別の集計は
+            カテゴリのコードに対して実行される
+        structure: スキーマの定義（Noneの場合は ``EMPLOYEE_STRUCTURE``。
+            ``load_schema_artifact`` で読み込んだ定義を指定できる）
+        wide_columns: ``compact`` の場合に幅の狭い整数型の代わりに定義どおりの
+            データ型で受け付ける列（値が幅の狭い整数型に収まらない列）
+
     Returns:
-        DataFrameSchema: 社員データ検証用のPanderaスキーマ
+        DataFrameSchema: 社員データ検証用のPanderaスキーマ。``metadata`` に
+            定義のバージョン（``schema_version``）とハッシュ（``schema_hash``）を持つ
+
+    Raises:
+        ValueError: 定義に未対応のチェック名がある場合
 
     Notes:
         以下のバリデーションを実装:
@@ -19,96 +433,46 @@ def create_employee_schema() -> DataFrameSchema:
         - 部署: 許可されたリスト内の値
         - 給与: 25万円以上の整数
         - 入社日: 2000年以降の日付
-        - 上司ID: NULL or 自分自身でない社員ID
+        - 上司ID: NULL or 自分自身でない、存在する社員ID
+        - 管理階層: 循環がなく、深さ10段以下
         - 評価スコア: 1.0～5.0の浮動小数点数
         - 部署平均給与: 30万円以上
         - 管理職の評価スコア: 3.5以上
     """
+    structure = structure if structure is not None else EMPLOYEE_STRUCTURE
+    dtypes = {name: column.dtype for name, column in structure.columns.items()}
+    if dtype_backend is not None or compact:
+        variant = employee_column_dtypes(dtype_backend, compact=compact)
+        for name in wide_columns:
+            variant.pop(name, None)
+        dtypes.update(variant)
+
+    columns = {
+        name: Column(
+            dtypes[name],
+            [_build_check(check, column) for check in column.checks],
+            nullable=column.nullable,
+            unique=column.unique and not row_level,
+            coerce=column.coerce,
+            required=column.required,
+            description=column.description,
+        )
+        for name, column in structure.columns.items()
+    }
+    checks = [
+        _build_frame_check(check)
+        for check in structure.checks
+        if not row_level or check.name in ROW_LEVEL_CHECKS
+    ]
     return DataFrameSchema(
-        {
-            # 社員ID: 1000以上の整数で一意である必要がある
-            "employee_id": Column(
-                int,
-                Check.greater_than_or_equal_to(1000),
-                unique=True,
-                nullable=False,
-                description="社員ID（1000以上の一意の整数）",
-            ),
-            # 名前: 文字列で2〜20文字の長さ
-            "name": Column(
-                str,
-                Check.str_length(min_value=2, max_value=20),
-                nullable=False,
-                description="社員名（2-20文字）",
-            ),
-            # 年齢: 18〜65歳の整数
-            "age": Column(
-                int,
-                Check.in_range(18, 65),
-                nullable=False,
-                description="年齢（18-65歳）",
-            ),
-            # 部署: 許可されたリストの中の値
-            "department": Column(
-                str,
-                Check.isin(["IT", "HR", "Finance", "Marketing", "Sales", "R&D"]),
-                nullable=False,
-                description="部署名",
-            ),
-            # 給与: 250000以上の数値
-            "salary": Column(
-                int,
-                Check.greater_than_or_equal_to(250000),
-                nullable=False,
-                description="月給（円）",
-            ),
-            # 入社日: 日付型、2000年以降の日付
-            "join_date": Column(
-                pd.DatetimeDtype(),
-                Check(
-                    lambda x: x >= pd.Timestamp("2000-01-01"),
-                    error="入社日は2000年1月1日以降である必要があります",
-                ),
-                nullable=False,
-                description="入社日",
-            ),
-            # 上司のID: NULLまたは自分自身のIDではない社員ID
-            "manager_id": Column(
-                int,
-                # 上司IDがNULLでなければ、自分自身のIDと異なること
-                Check(
-                    lambda x, df: pd.isna(x) | (x != df["employee_id"]),
-                    element_wise=True,
-                    error="上司IDは自分自身のIDと異なる必要があります",
-                ),
-                nullable=True,
-                description="上司の社員ID",
-            ),
-            # 評価スコア: 1.0〜5.0の範囲の浮動小数点数
-            "performance_score": Column(
-                float,
-                Check.in_range(1.0, 5.0),
-                nullable=False,
-                description="業績評価スコア（1.0-5.0）",
-            ),
+        columns,
+        checks=checks,
+        ordered=structure.ordered,
+        name=structure.name,
+        description=structure.description,
+        # 検証結果に記録するスキーマのバージョンとハッシュ
+        metadata={
+            "schema_version": structure.version,
+            "schema_hash": schema_hash(structure),
         },
-        # カスタムデータフレームレベルのチェック
-        checks=[
-            # 各部署の平均給与が300000円以上であることを確認
-            Check(
-                lambda df: df.groupby("department")["salary"].mean() >= 300000,
-                error="各部署の平均給与は300000円以上である必要があります",
-            ),
-            # 管理職（他の人の上司になっている人）の評価スコアが3.5以上であることを確認
-            Check(
-                lambda df: df[df["employee_id"].isin(df["manager_id"].dropna())][
-                    "performance_score"
-                ].min()
-                >= 3.5,
-                error="管理職の評価スコアは3.5以上である必要があります",
-            ),
-        ],
-        # スキーマの名前と説明
-        name="社員情報スキーマ",
-        description="会社社員の基本情報と業績に関するデータスキーマ",
     )
@@ -0,0 +1,215 @@
+"""社員IDと上司IDの配列から作成する管理階層のインデックス。
+
+上司の参照先が存在するか、管理階層に循環（A→B→A）がないか、階層が深すぎないかを、
+各社員の上司の行位置の配列に対するポインタジャンプ（ダブリング）でまとめて求める。
+各反復で全社員の「2^k 段上の上司」と、そこまでの段数を同時に更新するため、
+階層の深さをDとしてO(n log D)で評価できる（循環がある場合もO(n log n)）。
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ManagerHierarchy:
+    """上司の行位置の配列から求めた管理階層の状態。
+
+    Attributes:
+        missing: 上司IDが社員IDとして存在しない行のマスク
+        referenced: 他の社員（自分自身を含む）の上司として参照されている行のマスク
+        in_cycle: 管理階層の循環に含まれる行のマスク
+        depth: 上司をたどって最上位の社員に達するまでの段数
+            （最上位の社員は0。循環に含まれる・循環に至る行は-1）
+    """
+
+    def __init__(
+        self,
+        parent: np.ndarray,
+        missing: np.ndarray,
+        step: Optional[np.ndarray] = None,
+        referenced: Optional[np.ndarray] = None,
+    ) -> None:
+        """管理階層を評価する。
+
+        Args:
+            parent: 各行の上司の行位置（上司がいない行は-1）
+            missing: 上司IDが社員IDとして存在しない行のマスク
+            step: 各行から上司（上司がいない行は最上位の外側）までの段数
+                （Noneの場合はすべて1。既存の社員を上司とする行の深さの加算に使用する）
+            referenced: 上司として参照されている行のマスク
+                （Noneの場合は ``parent`` から求める）
+        """
+        n = len(parent)
+        self.missing = missing
+        if referenced is None:
+            referenced = np.zeros(n, dtype=bool)
+            referenced[parent[parent >= 0]] = True
+        self.referenced = referenced
+        # 最上位の外側を表す仮想的な行（位置n）を自己参照とし、到達後の段数を0とする
+        ancestor = np.append(np.where(parent < 0, n, parent), n)
+        distance = (
+            np.ones(n + 1, dtype=np.int64) if step is None else np.append(step, 0)
+        )
+        distance[n] = 0
+
+        active = np.flatnonzero(ancestor[:n] != n)
+        jumps = 1
+        while len(active) and jumps <= n:
+            current = ancestor[active]
+            distance[active] += distance[current]
+            ancestor[active] = ancestor[current]
+            active = active[ancestor[active] != n]
+            jumps *= 2
+
+        # n段以上たどっても最上位に達しない行の到達先は循環上にあり、
+        # 循環上の行は写像の下で互いに移り合うため、到達先の集合が循環そのものとなる
+        self.in_cycle = np.zeros(n, dtype=bool)
+        self.in_cycle[ancestor[active]] = True
+        self.depth = distance[:n] - 1
+        self.depth[active] = -1
+
+    @classmethod
+    def from_ids(
+        cls,
+        employee_ids: np.ndarray,
+        manager_ids: np.ndarray,
+        has_manager: np.ndarray,
+        groups: Optional[np.ndarray] = None,
+        known_ids: Optional[np.ndarray] = None,
+        known_depths: Optional[np.ndarray] = None,
+    ) -> "ManagerHierarchy":
+        """社員IDと上司IDの配列から管理階層を作成する。
+
+        上司IDは社員IDの配列から二分探索で行位置に変換する（社員IDが重複する
+        場合は最初の行を参照する）。自分自身を上司とする行は上司がいない行として扱う
+        （自己参照は ``manager_not_self`` チェックで報告される）。
+
+        Args:
+            employee_ids: 各行の社員ID
+            manager_ids: 各行の上司ID（``has_manager`` がFalseの行の値は使用しない）
+            has_manager: 上司IDがNULLでない行のマスク
+            groups: 指定した場合、同じグループ内の社員IDのみを上司として参照する
+                （複数のリクエストをまとめて評価する場合のリクエスト番号など）
+            known_ids: 検証済みの既存の社員ID（ソート済みで一意）。``employee_ids``
+                に存在しない上司IDは、ここに含まれれば存在するものとする
+            known_depths: ``known_ids`` の各社員の階層の深さ
+
+        Returns:
+            ManagerHierarchy: 管理階層の状態
+        """
+        n = len(employee_ids)
+        employee_ids = np.asarray(employee_ids, dtype=np.int64)
+        manager_ids = np.asarray(manager_ids, dtype=np.int64)
+        if groups is not None:
+            # 社員IDを連番のコードに変換し、グループと組み合わせたキーで参照する
+            codes, uniques = pd.factorize(
+                np.concatenate([employee_ids, manager_ids[has_manager]])
+            )
+            employee_keys = groups * len(uniques) + codes[:n]
+            manager_keys = np.zeros(n, dtype=np.int64)
+            manager_keys[has_manager] = groups[has_manager] * len(uniques) + codes[n:]
+        else:
+            employee_keys, manager_keys = employee_ids, manager_ids
+
+        parent = np.full(n, -1, dtype=np.int64)
+        rows = np.flatnonzero(has_manager)
+        positions = lookup_positions(employee_keys, manager_keys[rows])
+        found = positions >= 0
+        parent[rows[found]] = positions[found]
+        referenced = np.zeros(n, dtype=bool)
+        referenced[parent[rows[found]]] = True
+        parent[parent == np.arange(n)] = -1
+
+        missing = np.zeros(n, dtype=bool)
+        missing[rows[~found]] = True
+        step = None
+        if known_ids is not None and len(known_ids) and missing.any():
+            # 既存の社員を上司とする行は、その社員の深さに続く段数とする
+            outside = rows[~found]
+            known = lookup_positions(known_ids, manager_ids[outside])
+            missing[outside[known >= 0]] = False
+            step = np.ones(n, dtype=np.int64)
+            if known_depths is not None:
+                step[outside[known >= 0]] += known_depths[known[known >= 0]] + 1
+        return cls(parent, missing, step=step, referenced=referenced)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **kwargs: Any) -> "ManagerHierarchy":
+        """社員データの ``employee_id`` 列と ``manager_id`` 列から管理階層を作成する。
+
+        Args:
+            df: 社員データのデータフレーム
+            **kwargs: ``from_ids`` に渡す追加の引数（``groups``、``known_ids``、
+                ``known_depths``）
+
+        Returns:
+            ManagerHierarchy: 管理階層の状態
+        """
+        manager_id = df["manager_id"]
+        return cls.from_ids(
+            df["employee_id"].to_numpy(dtype=np.int64),
+            manager_id.to_numpy(dtype=np.int64, na_value=0),
+            manager_id.notna().to_numpy(),
+            **kwargs,
+        )
+
+    def too_deep(self, max_depth: int) -> np.ndarray:
+        """階層の深さが上限を超える行のマスクを返す。
+
+        循環に至る行（循環には含まれないが最上位の社員に達しない行）も含める。
+
+        Args:
+            max_depth: 階層の深さの上限
+
+        Returns:
+            np.ndarray: 上限を超える行のマスク
+        """
+        return (self.depth > max_depth) | ((self.depth < 0) & ~self.in_cycle)
+
+
+# 社員IDの範囲がこの倍率×件数以下の場合は、二分探索の代わりに直接参照表を使用する
+DENSE_LOOKUP_RATIO = 4
+
+
+def lookup_positions(ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """各値を持つ行の位置を求める（存在しない場合は-1、重複する場合は最初の行）。
+
+    社員IDが狭い範囲に密集している場合（連番の社員IDなど）は、IDから位置への
+    直接参照表を作成する。それ以外はソートした社員IDを、ソートした値の順に
+    二分探索する（大量の値をランダムな順序で探索するとキャッシュミスが支配的になる）。
+
+    Args:
+        ids: 各行の社員ID
+        values: 位置を求める社員ID
+
+    Returns:
+        np.ndarray: 各値を持つ行の位置
+    """
+    if len(ids) == 0:
+        return np.full(len(values), -1, dtype=np.int64)
+    low, high = int(ids.min()), int(ids.max())
+    if high - low < DENSE_LOOKUP_RATIO * len(ids):
+        # 逆順に書き込み、重複する社員IDは最初の行の位置を残す
+        table = np.full(high - low + 1, -1, dtype=np.int64)
+        table[ids[::-1] - low] = np.arange(len(ids) - 1, -1, -1)
+        in_range = (values >= low) & (values <= high)
+        positions = np.full(len(values), -1, dtype=np.int64)
+        positions[in_range] = table[values[in_range] - low]
+        return positions
+
+    order = np.argsort(ids)
+    sorted_ids = ids[order]
+    if (sorted_ids[1:] == sorted_ids[:-1]).any():
+        # 重複する社員IDは最初の行を参照するため、安定ソートで並べ直す
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+
+    # 値もソートしてから二分探索し、探索するメモリ上の位置を局所化する
+    value_order = np.argsort(values)
+    sorted_values = values[value_order]
+    positions = np.minimum(np.searchsorted(sorted_ids, sorted_values), len(ids) - 1)
+    found = sorted_ids[positions] == sorted_values
+    result = np.full(len(values), -1, dtype=np.int64)
+    result[value_order[found]] = order[positions[found]]
+    return result
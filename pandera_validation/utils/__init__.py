@@ -1,5 +1,66 @@
-"""ユーティリティ関数モジュール。"""
+"""ユーティリティ関数モジュール。
 
-from pandera_validation.utils.validation import validate_employee_data
+各モジュールはpandas・Panderaを読み込むため、各属性は最初に参照されたときに読み込む。
+"""
 
-__all__ = ["validate_employee_data"]
+from typing import TYPE_CHECKING
+
+from pandera_validation._lazy import attach
+
+if TYPE_CHECKING:
+    from pandera_validation.utils.aggregates import FrameAggregates
+    from pandera_validation.utils.batch import BatchReport, validate_employee_files
+    from pandera_validation.utils.errors import ValidationErrorReport
+    from pandera_validation.utils.fused import FusedSchema, compile_schema
+    from pandera_validation.utils.incremental import IncrementalValidator
+    from pandera_validation.utils.lazy import (
+        LazyValidationResult,
+        validate_employee_data_lazy,
+    )
+    from pandera_validation.utils.parallel import validate_employee_data_parallel
+    from pandera_validation.utils.readers import read_employee_csv, read_employee_file
+    from pandera_validation.utils.result_cache import ValidationResultCache
+    from pandera_validation.utils.sampling import (
+        SamplingOptions,
+        validate_employee_sample,
+    )
+    from pandera_validation.utils.service import ValidationService
+    from pandera_validation.utils.snapshot import load_employee_snapshot
+    from pandera_validation.utils.streaming import validate_employee_csv
+    from pandera_validation.utils.validation import (
+        EmployeeValidator,
+        clear_schema_cache,
+        get_employee_schema,
+        get_schema_for,
+        validate_employee_data,
+    )
+
+# 属性名と、その属性を定義するモジュールの対応
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "BatchReport": "pandera_validation.utils.batch",
+        "EmployeeValidator": "pandera_validation.utils.validation",
+        "FrameAggregates": "pandera_validation.utils.aggregates",
+        "FusedSchema": "pandera_validation.utils.fused",
+        "IncrementalValidator": "pandera_validation.utils.incremental",
+        "LazyValidationResult": "pandera_validation.utils.lazy",
+        "SamplingOptions": "pandera_validation.utils.sampling",
+        "ValidationErrorReport": "pandera_validation.utils.errors",
+        "ValidationResultCache": "pandera_validation.utils.result_cache",
+        "ValidationService": "pandera_validation.utils.service",
+        "clear_schema_cache": "pandera_validation.utils.validation",
+        "compile_schema": "pandera_validation.utils.fused",
+        "get_employee_schema": "pandera_validation.utils.validation",
+        "get_schema_for": "pandera_validation.utils.validation",
+        "load_employee_snapshot": "pandera_validation.utils.snapshot",
+        "read_employee_csv": "pandera_validation.utils.readers",
+        "read_employee_file": "pandera_validation.utils.readers",
+        "validate_employee_csv": "pandera_validation.utils.streaming",
+        "validate_employee_data": "pandera_validation.utils.validation",
+        "validate_employee_data_lazy": "pandera_validation.utils.lazy",
+        "validate_employee_data_parallel": "pandera_validation.utils.parallel",
+        "validate_employee_files": "pandera_validation.utils.batch",
+        "validate_employee_sample": "pandera_validation.utils.sampling",
+    },
+)
@@ -0,0 +1,283 @@
+"""データフレームレベルのルールを分割データで評価するための集計状態。"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandera_validation.schemas.columns import EMPLOYEE_SCHEMA_HASH, EMPLOYEE_STRUCTURE
+from pandera_validation.schemas.employee import (
+    MAX_HIERARCHY_DEPTH,
+    MIN_DEPARTMENT_AVG_SALARY,
+    MIN_MANAGER_SCORE,
+    department_salary_totals,
+)
+from pandera_validation.schemas.hierarchy import ManagerHierarchy, lookup_positions
+from pandera_validation.utils.errors import ValidationErrorReport
+
+# データフレームレベルのチェック名とエラーメッセージ（スキーマのチェックと同じ文言）
+FRAME_CHECK_ERRORS = {check.name: check.error for check in EMPLOYEE_STRUCTURE.checks}
+
+
+def _empty_ids() -> np.ndarray:
+    """空の社員ID配列を作成する。"""
+    return np.empty(0, dtype=np.int64)
+
+
+def _empty_lines() -> np.ndarray:
+    """空の社員IDと上司IDの組の配列を作成する。"""
+    return np.empty((0, 2), dtype=np.int64)
+
+
+@dataclass
+class FrameAggregates:
+    """行をまたぐルールの評価に必要な、マージ可能な集計状態。
+
+    チャンクやワーカーごとに作成した集計を ``merge`` で結合し、
+    ``find_errors`` でデータ全体に対するルールを評価する。
+    保持するのは社員ID・上司IDの配列と部署単位・管理職単位の小さな集計のみで、
+    行データそのものは保持しない。
+
+    Attributes:
+        record_count: 集計済みのレコード数
+        employee_ids: チャンクごとの社員ID配列（一意性チェック用）
+        manager_ids: 上司として参照された社員IDの一意な配列
+        reporting_lines: チャンクごとの、上司のいる社員の社員IDと上司IDの組の
+            配列（管理階層のチェック用）
+        low_score_ids: 評価スコアが管理職の下限未満の社員IDの一意な配列
+        department_salary_sum: 部署ごとの給与合計
+        department_count: 部署ごとの人数
+        age_sum: 年齢の合計（サマリー用）
+        salary_sum: 給与の合計（サマリー用）
+        score_sum: 評価スコアの合計（サマリー用）
+    """
+
+    record_count: int = 0
+    employee_ids: List[np.ndarray] = field(default_factory=list)
+    manager_ids: np.ndarray = field(default_factory=_empty_ids)
+    reporting_lines: List[np.ndarray] = field(default_factory=list)
+    low_score_ids: np.ndarray = field(default_factory=_empty_ids)
+    department_salary_sum: Dict[str, int] = field(default_factory=dict)
+    department_count: Dict[str, int] = field(default_factory=dict)
+    age_sum: float = 0.0
+    salary_sum: float = 0.0
+    score_sum: float = 0.0
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "FrameAggregates":
+        """行単位の検証を通過したデータフレームから集計状態を作成する。
+
+        Args:
+            df: 行単位の検証済み社員データ
+
+        Returns:
+            FrameAggregates: データフレームの集計状態
+        """
+        employee_ids = df["employee_id"].to_numpy(dtype=np.int64)
+        has_manager = df["manager_id"].notna().to_numpy()
+        manager_ids = df["manager_id"][has_manager].to_numpy(dtype=np.int64)
+        scores = df["performance_score"].to_numpy(dtype=np.float64)
+        # 部署コードごとの給与合計と人数（社員のいない部署は含めない）
+        departments, totals, counts = department_salary_totals(df)
+        present = np.flatnonzero(counts)
+        return cls(
+            record_count=len(df),
+            employee_ids=[employee_ids],
+            manager_ids=np.unique(manager_ids),
+            reporting_lines=[np.column_stack([employee_ids[has_manager], manager_ids])],
+            low_score_ids=np.unique(employee_ids[scores < MIN_MANAGER_SCORE]),
+            department_salary_sum={departments[i]: int(totals[i]) for i in present},
+            department_count={departments[i]: int(counts[i]) for i in present},
+            age_sum=float(df["age"].sum()),
+            salary_sum=float(df["salary"].sum()),
+            score_sum=float(scores.sum()),
+        )
+
+    def update(self, df: pd.DataFrame) -> "FrameAggregates":
+        """データフレームの集計を自身に加える。
+
+        Args:
+            df: 行単位の検証済み社員データ
+
+        Returns:
+            FrameAggregates: 更新後の自身
+        """
+        return self.merge(FrameAggregates.from_frame(df))
+
+    def merge(self, other: "FrameAggregates") -> "FrameAggregates":
+        """別の集計状態を自身に結合する。
+
+        Args:
+            other: 結合する集計状態
+
+        Returns:
+            FrameAggregates: 結合後の自身
+        """
+        self.record_count += other.record_count
+        self.employee_ids.extend(other.employee_ids)
+        self.manager_ids = np.union1d(self.manager_ids, other.manager_ids)
+        self.reporting_lines.extend(other.reporting_lines)
+        self.low_score_ids = np.union1d(self.low_score_ids, other.low_score_ids)
+        for dept, total in other.department_salary_sum.items():
+            self.department_salary_sum[dept] = (
+                self.department_salary_sum.get(dept, 0) + total
+            )
+        for dept, count in other.department_count.items():
+            self.department_count[dept] = self.department_count.get(dept, 0) + count
+        self.age_sum += other.age_sum
+        self.salary_sum += other.salary_sum
+        self.score_sum += other.score_sum
+        return self
+
+    def copy(self) -> "FrameAggregates":
+        """自身の複製を作成する（配列は不変として共有する）。"""
+        return replace(
+            self,
+            employee_ids=list(self.employee_ids),
+            reporting_lines=list(self.reporting_lines),
+            department_salary_sum=dict(self.department_salary_sum),
+            department_count=dict(self.department_count),
+        )
+
+    def all_employee_ids(self) -> np.ndarray:
+        """集計済みの全社員IDを1つの配列にまとめて返す。"""
+        if not self.employee_ids:
+            return _empty_ids()
+        if len(self.employee_ids) > 1:
+            self.employee_ids = [np.concatenate(self.employee_ids)]
+        return self.employee_ids[0]
+
+    def all_reporting_lines(self) -> np.ndarray:
+        """集計済みの社員IDと上司IDの組を1つの配列にまとめて返す。"""
+        if not self.reporting_lines:
+            return _empty_lines()
+        if len(self.reporting_lines) > 1:
+            self.reporting_lines = [np.concatenate(self.reporting_lines)]
+        return self.reporting_lines[0]
+
+    def hierarchy(self, unique_ids: np.ndarray) -> ManagerHierarchy:
+        """集計済みの社員IDと上司IDの組から管理階層を作成する。
+
+        Args:
+            unique_ids: 集計済みの全社員ID（ソート済みで一意）
+
+        Returns:
+            ManagerHierarchy: ``unique_ids`` の各社員を行とする管理階層
+        """
+        lines = self.all_reporting_lines()
+        rows = lookup_positions(unique_ids, lines[:, 0])
+        manager_ids = np.zeros(len(unique_ids), dtype=np.int64)
+        manager_ids[rows] = lines[:, 1]
+        has_manager = np.zeros(len(unique_ids), dtype=bool)
+        has_manager[rows] = True
+        return ManagerHierarchy.from_ids(unique_ids, manager_ids, has_manager)
+
+    def find_errors(
+        self,
+        duplicated: Optional[np.ndarray] = None,
+        managers: Optional[np.ndarray] = None,
+        hierarchy: Optional[ManagerHierarchy] = None,
+        hierarchy_ids: Optional[np.ndarray] = None,
+        schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+    ) -> Optional[ValidationErrorReport]:
+        """行をまたぐルールを評価し、違反内容を検証エラーとして返す。
+
+        スキーマの ``unique=True`` とデータフレームレベルのチェック
+        （管理階層、部署平均給与、管理職の評価スコア）を、集計状態のみから評価する。
+
+        Args:
+            duplicated: 重複している社員IDの配列（Noneの場合は全社員IDから算出）
+            managers: 社員として存在する上司IDの配列
+                （Noneの場合は全社員IDから算出）
+            hierarchy: 評価する管理階層（Noneの場合は全社員IDと上司IDの組から作成）
+            hierarchy_ids: ``hierarchy`` の各行の社員ID（エラーメッセージ用）
+            schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+        Returns:
+            Optional[ValidationErrorReport]: 違反ごとのメッセージを1行ずつ含む
+                検証エラー（違反がなければNone）
+        """
+        messages: List[str] = []
+        counts: Dict[Tuple[Optional[str], str], int] = {}
+        if duplicated is None or managers is None or hierarchy is None:
+            unique_ids, id_counts = np.unique(
+                self.all_employee_ids(), return_counts=True
+            )
+            if duplicated is None:
+                duplicated = unique_ids[id_counts > 1]
+            if managers is None:
+                managers = np.intersect1d(self.manager_ids, unique_ids)
+            if hierarchy is None:
+                hierarchy, hierarchy_ids = self.hierarchy(unique_ids), unique_ids
+
+        # 社員IDの一意性
+        if len(duplicated) > 0:
+            messages.append(
+                f"series 'employee_id' contains duplicate values: "
+                f"{duplicated[:10].tolist()}"
+            )
+            counts[("employee_id", "field_uniqueness")] = len(duplicated)
+
+        # 管理階層（上司の存在、循環、深さ）
+        for check, failed in (
+            ("manager_exists", hierarchy.missing),
+            ("no_manager_cycle", hierarchy.in_cycle),
+            ("hierarchy_depth", hierarchy.too_deep(MAX_HIERARCHY_DEPTH)),
+        ):
+            if failed.any():
+                messages.append(
+                    f"{FRAME_CHECK_ERRORS[check]}: {hierarchy_ids[failed][:10].tolist()}"
+                )
+                counts[(None, check)] = int(failed.sum())
+
+        # 各部署の平均給与
+        low_departments = {
+            dept: total / self.department_count[dept]
+            for dept, total in self.department_salary_sum.items()
+            if total < MIN_DEPARTMENT_AVG_SALARY * self.department_count[dept]
+        }
+        if low_departments:
+            messages.append(
+                f"{FRAME_CHECK_ERRORS['department_avg_salary']}: {low_departments}"
+            )
+            counts[(None, "department_avg_salary")] = len(low_departments)
+
+        # 管理職の評価スコア
+        # （スキーマのチェックと同様、管理職が1人もいない場合も違反とする）
+        low_managers = np.intersect1d(managers, self.low_score_ids)
+        if len(managers) == 0 or len(low_managers) > 0:
+            messages.append(
+                f"{FRAME_CHECK_ERRORS['manager_min_score']}: "
+                f"{low_managers[:10].tolist()}"
+            )
+            counts[(None, "manager_min_score")] = max(len(low_managers), 1)
+
+        if not messages:
+            return None
+        return ValidationErrorReport.from_counts(
+            "\n".join(messages), counts, schema_hash=schema_hash
+        )
+
+    def summary(
+        self, schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH
+    ) -> Dict[str, Any]:
+        """集計状態から検証結果のサマリー情報を作成する。
+
+        Args:
+            schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+        Returns:
+            Dict[str, Any]: ``validate_employee_data`` と同じキーを持つサマリー
+        """
+        count = self.record_count
+        return {
+            "record_count": count,
+            "departments": dict(
+                sorted(self.department_count.items(), key=lambda item: -item[1])
+            ),
+            "avg_age": self.age_sum / count if count else float("nan"),
+            "avg_salary": self.salary_sum / count if count else float("nan"),
+            "avg_score": self.score_sum / count if count else float("nan"),
+            "schema_hash": schema_hash,
+        }
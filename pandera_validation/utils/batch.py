@@ -0,0 +1,319 @@
+"""複数の社員データファイルをプロセスプールで並列に検証するバッチバリデーション。"""
+
+import functools
+import glob
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandera.errors import ParserError
+
+from pandera_validation.schemas.columns import EMPLOYEE_SCHEMA_HASH
+from pandera_validation.utils.errors import DEFAULT_MAX_EXAMPLES, ValidationErrorReport
+from pandera_validation.utils.preflight import preflight_check
+from pandera_validation.utils.readers import (
+    ARROW_SUFFIXES,
+    PARQUET_SUFFIXES,
+    _require_pyarrow,
+    is_columnar_file,
+    read_employee_csv,
+    read_employee_file,
+)
+from pandera_validation.utils.validation import validate_employee_data
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# ディレクトリを指定した場合に検証する拡張子
+FILE_SUFFIXES = frozenset({".csv"}) | PARQUET_SUFFIXES | ARROW_SUFFIXES
+
+
+@dataclass
+class FileResult:
+    """1つのファイルの検証結果。
+
+    Attributes:
+        path: ファイルのパス
+        success: ファイル単体の検証に成功したかどうか
+        seconds: 事前チェック・読み込み・検証にかかった時間（秒）
+        record_count: 読み込んだレコード数（読み込み前に失敗した場合はNone）
+        failure_count: 失敗ケースの件数
+        error: エラーメッセージ（成功した場合はNone）
+        duplicate_id_count: 他のファイルと重複する社員IDの数
+        employee_ids: ファイル内の社員ID（ファイル間の一意性を確認する場合のみ）
+    """
+
+    path: str
+    success: bool
+    seconds: float
+    record_count: Optional[int] = None
+    failure_count: int = 0
+    error: Optional[str] = None
+    duplicate_id_count: int = 0
+    employee_ids: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """社員IDを除く各属性を持つ辞書を返す。"""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name != "employee_ids"
+        }
+
+
+@dataclass
+class BatchReport:
+    """複数ファイルの検証結果をまとめたレポート。
+
+    Attributes:
+        files: ファイルごとの検証結果（入力の順序）
+        seconds: 全体の実行時間（秒）
+        duplicate_ids: 複数のファイルに含まれる社員ID
+            （ファイル間の一意性を確認しない場合はNone）
+    """
+
+    files: List[FileResult]
+    seconds: float
+    duplicate_ids: Optional[np.ndarray] = None
+
+    @property
+    def success(self) -> bool:
+        """すべてのファイルが検証に成功し、ファイル間で社員IDが重複していないかどうか。"""
+        return all(result.success for result in self.files) and (
+            self.duplicate_ids is None or len(self.duplicate_ids) == 0
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """ファイルごとの状態・実行時間・失敗件数を1行ずつ持つデータフレームを返す。"""
+        columns = [f.name for f in fields(FileResult) if f.name != "employee_ids"]
+        frame = pd.DataFrame(
+            [result.to_dict() for result in self.files], columns=columns
+        )
+        return frame.astype({"record_count": "Int64"})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """全体の結果とファイルごとの結果を持つ辞書を返す。
+
+        重複した社員IDは件数と先頭の ``DEFAULT_MAX_EXAMPLES`` 件のみを含める。
+        """
+        failed = [result for result in self.files if not result.success]
+        report = {
+            "success": self.success,
+            "file_count": len(self.files),
+            "failed_file_count": len(failed),
+            "record_count": sum(result.record_count or 0 for result in self.files),
+            "failure_count": sum(result.failure_count for result in self.files),
+            "seconds": self.seconds,
+            "schema_hash": EMPLOYEE_SCHEMA_HASH,
+        }
+        if self.duplicate_ids is not None:
+            report["duplicate_id_count"] = len(self.duplicate_ids)
+            report["duplicate_ids"] = self.duplicate_ids[:DEFAULT_MAX_EXAMPLES].tolist()
+        report["files"] = [result.to_dict() for result in self.files]
+        return report
+
+    def write(self, path: Union[str, Path]) -> None:
+        """レポートをファイルに保存する。
+
+        拡張子が ``.parquet`` の場合はファイルごとの結果（``to_frame``）を
+        Parquet形式で、それ以外は全体の結果を含むJSON（``to_dict``）で保存する。
+
+        Args:
+            path: 保存先のファイルパス
+        """
+        if Path(path).suffix.lower() in PARQUET_SUFFIXES:
+            _require_pyarrow()
+            self.to_frame().to_parquet(path, engine="pyarrow", index=False)
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def find_files(patterns: Iterable[Union[str, Path]]) -> List[str]:
+    """ディレクトリ・globパターン・ファイルパスから検証するファイルを求める。
+
+    ディレクトリはその直下のCSV・Parquet・Arrow IPCファイルを、globパターンは
+    一致するファイルを名前順に展開する。同じファイルは一度だけ含める。
+
+    Args:
+        patterns: ディレクトリ、globパターン、またはファイルのパス
+
+    Returns:
+        List[str]: 検証するファイルのパス
+    """
+    paths: Dict[str, None] = {}
+    for pattern in patterns:
+        pattern = str(pattern)
+        if os.path.isdir(pattern):
+            matches = [
+                str(path)
+                for path in sorted(Path(pattern).iterdir())
+                if path.is_file() and path.suffix.lower() in FILE_SUFFIXES
+            ]
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+        paths.update(dict.fromkeys(matches))
+    return list(paths)
+
+
+def validate_employee_file(
+    path: Union[str, Path], collect_ids: bool = False
+) -> FileResult:
+    """1つのファイルを事前チェック・読み込みし、検証する。
+
+    ワーカープロセスで実行されるため、例外を送出せずに結果として返す。
+
+    Args:
+        path: 検証するCSV・Parquet・Arrow IPCファイルのパス
+        collect_ids: Trueの場合、ファイル間の一意性の確認用に社員IDを結果に含める
+
+    Returns:
+        FileResult: ファイルの検証結果
+    """
+    start = time.perf_counter()
+    path = str(path)
+
+    def failed(error: str, failure_count: int = 1) -> FileResult:
+        return FileResult(
+            path=path,
+            success=False,
+            seconds=time.perf_counter() - start,
+            failure_count=failure_count,
+            error=error,
+        )
+
+    try:
+        # 列名とデータ型の事前チェック（構造が壊れていれば読み込まずに終了）
+        preflight = preflight_check(path)
+        if not preflight.ok:
+            return failed("\n".join(preflight.errors), len(preflight.errors))
+
+        if is_columnar_file(path):
+            df = read_employee_file(path)
+        else:
+            df = read_employee_csv(path)
+    except ParserError as e:
+        # 型変換できないセルは検証エラーとして扱う
+        return failed(str(e), len(e.failure_cases))
+    except Exception as e:
+        return failed(f"ファイルを読み込めません: {e}")
+
+    success, _, error_msg, _ = validate_employee_data(df)
+    employee_ids = _employee_ids(df) if collect_ids else None
+    if success:
+        failure_count = 0
+    elif isinstance(error_msg, ValidationErrorReport):
+        failure_count = error_msg.total
+    else:
+        failure_count = 1
+    return FileResult(
+        path=path,
+        success=success,
+        seconds=time.perf_counter() - start,
+        record_count=len(df),
+        failure_count=failure_count,
+        # プロセス間で受け渡すため、失敗ケースを持たない文字列にする
+        error=None if error_msg is None else str(error_msg),
+        employee_ids=employee_ids,
+    )
+
+
+def _employee_ids(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """ファイル内の社員ID（重複を除く）を返す（整数に変換できない場合はNone）。"""
+    if "employee_id" not in df.columns:
+        return None
+    try:
+        return np.unique(df["employee_id"].dropna().to_numpy(dtype=np.int64))
+    except (TypeError, ValueError):
+        return None
+
+
+def find_duplicate_ids(files: List[FileResult]) -> np.ndarray:
+    """複数のファイルに含まれる社員IDを求め、ファイルごとの重複数を設定する。
+
+    Args:
+        files: 社員IDを持つファイルごとの検証結果
+
+    Returns:
+        np.ndarray: 複数のファイルに含まれる社員ID（昇順）
+    """
+    arrays = [
+        result.employee_ids for result in files if result.employee_ids is not None
+    ]
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    # 各ファイルの社員IDは重複を除いてあるため、2回以上現れるIDがファイル間の重複
+    ids, counts = np.unique(np.concatenate(arrays), return_counts=True)
+    duplicate_ids = ids[counts > 1]
+    for result in files:
+        if result.employee_ids is not None:
+            result.duplicate_id_count = int(
+                np.isin(result.employee_ids, duplicate_ids, assume_unique=True).sum()
+            )
+    return duplicate_ids
+
+
+def validate_employee_files(
+    paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    check_unique_ids: bool = False,
+    executor: Optional[Executor] = None,
+) -> BatchReport:
+    """複数のファイルをワーカープロセスで並列に検証する。
+
+    各ファイルは ``validate_employee_file`` で事前チェック・読み込み・検証され、
+    同時に検証するファイル数は ``max_workers`` までとなる。
+
+    Args:
+        paths: 検証するファイルのパス（``find_files`` で展開したもの）
+        max_workers: 同時に検証するファイル数（Noneの場合はCPUコア数）
+        check_unique_ids: Trueの場合、社員IDがファイル間で重複していないことも確認する
+        executor: 再利用するエグゼキュータ（Noneの場合は呼び出しごとに作成）
+
+    Returns:
+        BatchReport: ファイルごとの検証結果をまとめたレポート
+    """
+    start = time.perf_counter()
+    paths = [str(path) for path in paths]
+    worker = functools.partial(validate_employee_file, collect_ids=check_unique_ids)
+
+    if executor is None and paths:
+        max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            files = list(pool.map(worker, paths))
+    elif paths:
+        files = list(executor.map(worker, paths))
+    else:
+        files = []
+
+    for result in files:
+        if result.success:
+            logger.info(f"{result.path}: 検証成功（{result.seconds:.2f}秒）")
+        else:
+            logger.error(
+                f"{result.path}: 検証失敗（{result.failure_count}件の失敗ケース）"
+            )
+
+    duplicate_ids = None
+    if check_unique_ids:
+        duplicate_ids = find_duplicate_ids(files)
+        if len(duplicate_ids):
+            logger.error(
+                f"{len(duplicate_ids)}件の社員IDが複数のファイルに含まれています: "
+                f"{duplicate_ids[:DEFAULT_MAX_EXAMPLES].tolist()}"
+            )
+        for result in files:
+            result.employee_ids = None
+
+    return BatchReport(
+        files=files, seconds=time.perf_counter() - start, duplicate_ids=duplicate_ids
+    )
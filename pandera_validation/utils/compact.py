@@ -0,0 +1,104 @@
+"""メモリ使用量を抑えるためのデータ型の変換とメモリ使用量のレポート。"""
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandera_validation.schemas.employee import employee_column_dtypes
+
+
+def _fits(series: pd.Series, dtype: str) -> bool:
+    """数値の列の値が整数型 ``dtype`` の範囲に収まるかどうか（NULL値は除く）。"""
+    if series.empty:
+        return True
+    info = np.iinfo(dtype.lower())
+    minimum, maximum = series.min(), series.max()
+    return pd.isna(minimum) or (minimum >= info.min and maximum <= info.max)
+
+
+def wide_columns(df: pd.DataFrame) -> Tuple[str, ...]:
+    """値が幅の狭い整数型に収まらない数値の列を求める。
+
+    これらの列は ``create_employee_schema(compact=True, wide_columns=...)`` で
+    定義どおりのデータ型（``int64``・``Int64``）のまま検証するため、
+    メモリ節約用のデータ型に変換しても検証結果は変わらない。
+
+    Args:
+        df: 社員データのデータフレーム
+
+    Returns:
+        Tuple[str, ...]: 幅の狭い整数型に収まらない列名
+    """
+    return tuple(
+        column
+        for column, dtype in employee_column_dtypes(compact=True).items()
+        if isinstance(dtype, str)
+        and dtype.lower().startswith("int")
+        and column in df.columns
+        and pd.api.types.is_numeric_dtype(df[column].dtype)
+        and not _fits(df[column], dtype)
+    )
+
+
+def to_compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """社員データを ``create_employee_schema(compact=True)`` のデータ型に変換する。
+
+    部署はカテゴリ型に、整数列は値が収まる場合のみ幅の狭い整数型に変換する。
+    値が収まらない列（``wide_columns``）や整数型でない列は変換せずに残すので、
+    値が切り捨てられることはない。
+    上司IDの変換はスキーマの型変換に任せる。
+
+    Args:
+        df: 変換する社員データのデータフレーム
+
+    Returns:
+        pd.DataFrame: 変換後のデータフレーム（変換しない列は入力と共有する）
+    """
+    compact_df = df.copy(deep=False)
+    for column, dtype in employee_column_dtypes(compact=True).items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if dtype == "category":
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                compact_df[column] = series.astype("category")
+        elif isinstance(dtype, str) and dtype.startswith("int"):
+            if not pd.api.types.is_integer_dtype(series.dtype):
+                continue
+            if _fits(series, dtype):
+                compact_df[column] = series.astype(dtype)
+    return compact_df
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> Dict[str, Any]:
+    """変換前後のデータフレームのメモリ使用量（バイト）を比較する。
+
+    文字列を含む列の使用量の計測は値ごとの走査が必要なため、
+    データ型が変わっていない列は変換前の計測値を再利用する。
+
+    Args:
+        before: 変換前のデータフレーム
+        after: 変換後のデータフレーム（値は変換前と同じであること）
+
+    Returns:
+        Dict[str, Any]: 全体と列ごとの変換前後のメモリ使用量
+    """
+    columns = {}
+    for column in after.columns:
+        after_bytes = None
+        if column in before.columns:
+            before_bytes = int(before[column].memory_usage(index=False, deep=True))
+            if before[column].dtype == after[column].dtype:
+                after_bytes = before_bytes
+        else:
+            before_bytes = 0
+        if after_bytes is None:
+            after_bytes = int(after[column].memory_usage(index=False, deep=True))
+        columns[column] = {"before": before_bytes, "after": after_bytes}
+
+    return {
+        "before_bytes": sum(usage["before"] for usage in columns.values()),
+        "after_bytes": sum(usage["after"] for usage in columns.values()),
+        "columns": columns,
+    }
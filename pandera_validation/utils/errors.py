@@ -0,0 +1,360 @@
+"""検証エラーの件数と先頭の失敗ケースだけを文字列にする構造化エラー。
+
+Panderaの ``str(SchemaError)`` はすべての失敗ケースを文字列に連結するため、
+失敗が数百万件あるとメッセージが数MBになり、ログ出力にも時間がかかる。
+``ValidationErrorReport`` はチェックの説明、列・チェックごとの失敗件数、
+先頭の失敗ケースだけを文字列にし、失敗ケースのデータフレームは
+必要になるまで文字列にしない。
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from pandera_validation.schemas.columns import EMPLOYEE_SCHEMA_HASH
+
+if TYPE_CHECKING:
+    import pandera as pa
+
+
+# エラーメッセージに含める失敗ケースの件数
+DEFAULT_MAX_EXAMPLES = 10
+
+# 失敗ケースのデータフレームの列
+FAILURE_CASE_COLUMNS = ["column", "check", "index", "failure_case"]
+
+
+def _check_label(error: "pa.errors.SchemaError") -> str:
+    """エラーの原因となったチェックの名前を返す。"""
+    from pandera.errors import SchemaErrorReason
+
+    if error.reason_code == SchemaErrorReason.WRONG_DATATYPE:
+        check = str(error.check)
+        return check if check.startswith("dtype(") else f"dtype('{check}')"
+    name = getattr(error.check, "name", None)
+    return name if name is not None else str(error.check)
+
+
+def _error_column(error: "pa.errors.SchemaError") -> Optional[str]:
+    """エラーの原因となった列名を返す（データフレームレベルのエラーはNone）。
+
+    型変換の失敗では ``column_name`` が設定されないため、列のスキーマの名前を使う。
+    """
+    if error.column_name is not None:
+        return error.column_name
+    from pandera import DataFrameSchema
+
+    if error.schema is not None and not isinstance(error.schema, DataFrameSchema):
+        return getattr(error.schema, "name", None)
+    return None
+
+
+def _message_header(error: "pa.errors.SchemaError") -> str:
+    """エラーの種類・チェック・スキーマ名から、失敗したチェックの説明を作成する。
+
+    ``str(error)`` は失敗ケースの一覧をすべて含むため使用せず、Panderaの
+    メッセージの先頭行と同じ形式の説明をエラーの属性から組み立てる。
+    """
+    from pandera.errors import SchemaErrorReason
+
+    reason = error.reason_code
+    column = _error_column(error)
+    check = error.check
+    if reason == SchemaErrorReason.WRONG_DATATYPE:
+        data = error.data
+        if isinstance(data, pd.DataFrame) and column in data:
+            data = data[column]
+        actual = getattr(data, "dtype", None)
+        expected = getattr(error.schema, "dtype", None)
+        return f"expected series '{column}' to have type {expected}, got {actual}"
+    if reason == SchemaErrorReason.DATATYPE_COERCION:
+        expected = getattr(error.schema, "dtype", None)
+        return f"Error while coercing '{column}' to type {expected}"
+    if reason == SchemaErrorReason.SERIES_CONTAINS_NULLS:
+        return f"non-nullable series '{column}' contains null values"
+    if reason == SchemaErrorReason.SERIES_CONTAINS_DUPLICATES:
+        return f"series '{column}' contains duplicate values"
+    if reason == SchemaErrorReason.COLUMN_NOT_IN_DATAFRAME:
+        return f"column '{error.failure_cases}' not in dataframe"
+
+    if column is not None:
+        target = f"Column '{column}'"
+    else:
+        target = f"DataFrameSchema '{getattr(error.schema, 'name', None)}'"
+    if not hasattr(check, "name"):
+        return f"{target} failed {check} ({reason.name.lower()})"
+    # チェックの番号は検証したスキーマ（列）のチェックの中での位置
+    checks = getattr(error.schema, "checks", None) or []
+    number = next((i for i, c in enumerate(checks) if c is check), None)
+    if isinstance(error.failure_cases, pd.DataFrame):
+        description = check.error if check.error is not None else check.name
+        return f"{target} failed element-wise validator number {number}: {description}"
+    return f"{target} failed series or dataframe validator {number}: {check}"
+
+
+class ValidationErrorReport(str):
+    """列・チェックごとの失敗件数と先頭の失敗ケースを持つ検証エラー。
+
+    文字列としての値は ``render()`` の結果（先頭 ``max_examples`` 件の失敗ケース
+    のみ）で、作成にかかる時間は失敗件数ではなく表示する件数に比例する。
+    ``str`` のサブクラスのため、エラーメッセージとしてそのまま扱える。
+
+    Attributes:
+        header: 失敗したチェックの説明
+        counts: ``(列名, チェック名)`` ごとの失敗件数
+            （データフレームレベルのチェックの列名はNone）
+        detail: データフレームレベルのチェックの失敗内容の説明（ない場合はNone）
+        max_examples: 文字列に含める失敗ケースの件数
+        schema_hash: 検証に使用したスキーマの定義のハッシュ（不明な場合はNone）
+    """
+
+    header: str
+    counts: Dict[Tuple[Optional[str], str], int]
+    detail: Optional[str]
+    max_examples: int
+    schema_hash: Optional[str]
+    _cases: Optional[pd.DataFrame]
+    _labels: Optional[Tuple[Optional[str], str]]
+
+    @classmethod
+    def from_schema_error(
+        cls,
+        error: "pa.errors.SchemaError",
+        max_examples: int = DEFAULT_MAX_EXAMPLES,
+        keep_failure_cases: bool = True,
+        schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+    ) -> "ValidationErrorReport":
+        """Panderaのスキーマエラーから作成する。
+
+        失敗ケースを持たないデータフレームレベルのチェック（部署平均給与など）は、
+        失敗内容の説明（該当する部署とその平均給与など）を加える。
+
+        Args:
+            error: Panderaのスキーマエラー
+            max_examples: 文字列に含める失敗ケースの件数
+            keep_failure_cases: Falseの場合、先頭 ``max_examples`` 件を除く
+                失敗ケースを保持しない（プロセス間で受け渡す場合など）
+            schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+        Returns:
+            ValidationErrorReport: 検証エラー
+        """
+        from pandera_validation.schemas.employee import FRAME_CHECK_DETAILS
+
+        column = _error_column(error)
+        check = _check_label(error)
+        cases = error.failure_cases
+        if isinstance(cases, pd.DataFrame):
+            # データフレームレベルのチェックの失敗ケースは {列名: 値} の辞書になる
+            count = len(cases)
+            if not keep_failure_cases:
+                cases = cases.head(max_examples)
+        else:
+            cases = None
+            count = 1
+
+        detail = None
+        describe = FRAME_CHECK_DETAILS.get(getattr(error.check, "name", None))
+        if describe is not None and isinstance(error.data, pd.DataFrame):
+            detail = describe(error.data)
+
+        return cls._create(
+            _message_header(error),
+            {(column, check): count},
+            cases=cases,
+            labels=(column, check),
+            detail=detail,
+            max_examples=max_examples,
+            schema_hash=schema_hash,
+        )
+
+    @classmethod
+    def from_failure_cases(
+        cls,
+        header: str,
+        failure_cases: pd.DataFrame,
+        max_examples: int = DEFAULT_MAX_EXAMPLES,
+        schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+    ) -> "ValidationErrorReport":
+        """列・チェック・行インデックス・値を持つ失敗ケースの一覧から作成する。
+
+        Args:
+            header: エラーの説明
+            failure_cases: ``FAILURE_CASE_COLUMNS`` の列を持つ失敗ケースの一覧
+            max_examples: 文字列に含める失敗ケースの件数
+            schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+        Returns:
+            ValidationErrorReport: 検証エラー
+        """
+        grouped = failure_cases.groupby(["column", "check"], dropna=False, sort=False)
+        counts = {
+            (None if pd.isna(column) else column, check): int(count)
+            for (column, check), count in grouped.size().items()
+        }
+        return cls._create(
+            header,
+            counts,
+            cases=failure_cases[FAILURE_CASE_COLUMNS],
+            max_examples=max_examples,
+            schema_hash=schema_hash,
+        )
+
+    @classmethod
+    def from_counts(
+        cls,
+        header: str,
+        counts: Dict[Tuple[Optional[str], str], int],
+        schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+    ) -> "ValidationErrorReport":
+        """失敗ケースを持たない、チェックごとの失敗件数のみから作成する。
+
+        分割したデータの集計状態から評価した行をまたぐルールの違反など、
+        行単位の失敗ケースを保持しないエラーに使用する。
+
+        Args:
+            header: エラーの説明
+            counts: ``(列名, チェック名)`` ごとの失敗件数
+            schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+        Returns:
+            ValidationErrorReport: 検証エラー
+        """
+        return cls._create(header, counts, schema_hash=schema_hash)
+
+    @classmethod
+    def _create(
+        cls,
+        header: str,
+        counts: Dict[Tuple[Optional[str], str], int],
+        cases: Optional[pd.DataFrame] = None,
+        labels: Optional[Tuple[Optional[str], str]] = None,
+        detail: Optional[str] = None,
+        max_examples: int = DEFAULT_MAX_EXAMPLES,
+        schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+    ) -> "ValidationErrorReport":
+        """各属性を設定し、先頭の失敗ケースを含む文字列として作成する。"""
+        text = _render(header, counts, cases, labels, detail, max_examples)
+        self = str.__new__(cls, text)
+        self.header = header
+        self.counts = counts
+        self.detail = detail
+        self.max_examples = max_examples
+        self.schema_hash = schema_hash
+        self._cases = cases
+        self._labels = labels
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書にする（失敗ケースは先頭 ``max_examples`` 件のみ）。"""
+        cases = None
+        if self._cases is not None:
+            cases = self._cases.head(self.max_examples).to_dict(orient="list")
+        return {
+            "header": self.header,
+            "counts": [
+                [column, check, n] for (column, check), n in self.counts.items()
+            ],
+            "cases": cases,
+            "labels": None if self._labels is None else list(self._labels),
+            "detail": self.detail,
+            "max_examples": self.max_examples,
+            "schema_hash": self.schema_hash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationErrorReport":
+        """``to_dict`` の辞書から作成する。"""
+        cases = data.get("cases")
+        labels = data.get("labels")
+        return cls._create(
+            data["header"],
+            {(column, check): n for column, check, n in data["counts"]},
+            cases=None if cases is None else pd.DataFrame(cases),
+            labels=None if labels is None else tuple(labels),
+            detail=data.get("detail"),
+            max_examples=data.get("max_examples", DEFAULT_MAX_EXAMPLES),
+            schema_hash=data.get("schema_hash"),
+        )
+
+    @property
+    def total(self) -> int:
+        """失敗件数の合計。"""
+        return sum(self.counts.values())
+
+    @property
+    def failure_cases(self) -> Optional[pd.DataFrame]:
+        """保持している失敗ケースの一覧（``FAILURE_CASE_COLUMNS`` の列を持つ）。
+
+        失敗ケースを持たないエラーの場合はNone。
+        """
+        if self._cases is None or self._labels is None:
+            return self._cases
+        column, check = self._labels
+        return self._cases.assign(column=column, check=check)[FAILURE_CASE_COLUMNS]
+
+    def examples(self, n: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """先頭の失敗ケースを返す。
+
+        Args:
+            n: 件数（Noneの場合は ``max_examples``）
+
+        Returns:
+            Optional[pd.DataFrame]: 先頭の失敗ケース（失敗ケースを持たない場合はNone）。
+                1つのチェックのエラーでは行インデックスと値の列のみを持つ
+        """
+        if self._cases is None:
+            return None
+        examples = self._cases.head(self.max_examples if n is None else n)
+        if self._labels is None:
+            return examples
+        return examples[["index", "failure_case"]]
+
+    def render(self, max_examples: Optional[int] = None) -> str:
+        """エラーメッセージを作成する。
+
+        Args:
+            max_examples: 含める失敗ケースの件数
+                （Noneの場合は保持しているすべての失敗ケース）
+
+        Returns:
+            str: チェックの説明、失敗件数、先頭の失敗ケースからなるメッセージ
+        """
+        return _render(
+            self.header,
+            self.counts,
+            self._cases,
+            self._labels,
+            self.detail,
+            max_examples,
+        )
+
+
+def _render(
+    header: str,
+    counts: Dict[Tuple[Optional[str], str], int],
+    cases: Optional[pd.DataFrame],
+    labels: Optional[Tuple[Optional[str], str]],
+    detail: Optional[str],
+    max_examples: Optional[int],
+) -> str:
+    """チェックの説明、失敗件数、先頭の失敗ケースからなるメッセージを作成する。"""
+    lines = [header]
+    if cases is not None:
+        total = sum(counts.values())
+        lines.append(f"失敗件数: {total}件")
+        if len(counts) > 1:
+            for (column, check), count in counts.items():
+                target = "データフレーム" if column is None else f"列 '{column}'"
+                lines.append(f"  {target} {check}: {count}件")
+        examples = cases if max_examples is None else cases.head(max_examples)
+        lines.append(f"失敗ケース（先頭{len(examples)}件）:")
+        for case in examples.itertuples(index=False):
+            # 1つのチェックのエラーでは列名を省略する
+            target = "" if labels is not None else f"{case.column} "
+            lines.append(f"  {target}行 {case.index}: {case.failure_case}")
+        if total > len(examples):
+            lines.append(f"  ...ほか{total - len(examples)}件")
+    if detail is not None:
+        lines.append(detail)
+    return "\n".join(lines)
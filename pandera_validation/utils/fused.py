@@ -0,0 +1,277 @@
+"""組み込みの値チェックを列ごとに1回の走査へ融合して評価する検証エンジン。
+
+``greater_than_or_equal_to``・``in_range``・``str_length``・``isin`` の組み込み
+チェックは、Panderaではチェックごとにブール値のSeriesを作成し、NULL値の判定と
+失敗ケースの抽出を行う。``FusedSchema`` はこれらのチェックを列ごとにまとめ、
+キャッシュに収まる大きさのブロック単位でNumPyの演算を順に適用して、
+列ごとに1つの失敗マスクを求める。すべての列で失敗がなければ、これらの
+チェックを除いたスキーマで残りの検証を行う。失敗がある場合は元のスキーマで
+検証し直すため、エラーメッセージを含めて元のスキーマと同じ結果になる。
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandera import Check, DataFrameSchema
+
+# 融合して評価できる組み込みチェック名
+FUSABLE_CHECKS = frozenset(
+    {"greater_than_or_equal_to", "in_range", "str_length", "isin"}
+)
+
+# 1回に評価する行数（一時配列がCPUキャッシュに収まる大きさ）
+BLOCK_SIZE = 1 << 16
+
+# ブロック内の失敗を失敗マスクに加える関数（ブロックの値、失敗マスクの対応部分）
+FailureOp = Callable[[np.ndarray, np.ndarray], None]
+
+# 保持する融合スキーマの最大件数
+FUSED_CACHE_MAXSIZE = 64
+
+# 構築済みの融合スキーマ（元のスキーマのidをキーとし、idの再利用と区別するため
+# 元のスキーマも保持する。DataFrameSchemaはハッシュ化できないためidを使用する）
+_fused_cache: "OrderedDict[int, Tuple[DataFrameSchema, FusedSchema]]" = OrderedDict()
+_fused_cache_lock = threading.Lock()
+
+
+def _is_fusable(check: Check) -> bool:
+    """チェックが融合して評価できる組み込みチェックかどうかを判定する。"""
+    return (
+        check.name in FUSABLE_CHECKS
+        and check.ignore_na
+        and not check.raise_warning
+        and not check.element_wise
+        and check.groupby is None
+    )
+
+
+def _range_op(
+    min_value: Optional[float],
+    max_value: Optional[float],
+    include_min: bool = True,
+    include_max: bool = True,
+) -> FailureOp:
+    """値が範囲外の行を失敗とする関数を作成する（NaNは比較が偽になり失敗としない）。"""
+    below = np.less if include_min else np.less_equal
+    above = np.greater if include_max else np.greater_equal
+
+    def op(block: np.ndarray, out: np.ndarray) -> None:
+        if min_value is not None:
+            out |= below(block, min_value)
+        if max_value is not None:
+            out |= above(block, max_value)
+
+    return op
+
+
+def _str_length_op(min_value: Optional[int], max_value: Optional[int]) -> FailureOp:
+    """文字列の長さが範囲外の行を失敗とする関数を作成する。
+
+    長さを持たない値（NULL値など）がある場合は ``TypeError`` を送出し、
+    呼び出し元で元のスキーマによる検証に切り替える。
+    """
+    check_lengths = _range_op(min_value, max_value)
+
+    def op(block: np.ndarray, out: np.ndarray) -> None:
+        lengths = np.fromiter(map(len, block), dtype=np.int64, count=len(block))
+        check_lengths(lengths, out)
+
+    return op
+
+
+def _isin_op(allowed_values: object) -> FailureOp:
+    """許可された値に含まれない行を失敗とする関数を作成する（NULL値は失敗としない）。"""
+
+    def op(block: np.ndarray, out: np.ndarray) -> None:
+        rejected = ~pd.Series(block, copy=False).isin(allowed_values).to_numpy()
+        if rejected.any():
+            rejected &= pd.notna(block)
+        out |= rejected
+
+    return op
+
+
+def _failure_op(check: Check, dtype: object) -> Optional[FailureOp]:
+    """列のデータ型に対してチェックを評価する関数を作成する（未対応の場合はNone）。
+
+    カテゴリ型の列はカテゴリのコードに対して評価するため、``isin`` 以外は未対応とする。
+    日付列は ``greater_than_or_equal_to`` と ``in_range`` のみに対応する。
+    pyarrowベースの列やNULL値を扱う拡張型の列も未対応とする。
+    """
+    stats = check.statistics
+    if isinstance(dtype, pd.CategoricalDtype):
+        if check.name != "isin":
+            return None
+        # コード-1（NULL値）は最後の要素を参照して失敗としない
+        rejected = np.append(~dtype.categories.isin(stats["allowed_values"]), False)
+
+        def op(block: np.ndarray, out: np.ndarray) -> None:
+            out |= rejected[block]
+
+        return op
+
+    if not isinstance(dtype, np.dtype):
+        return None
+    if dtype.kind == "M" and check.name in ("greater_than_or_equal_to", "in_range"):
+        # 日付列は境界値を列と同じ単位のdatetime64に変換して比較する（NaTは失敗としない）
+        stats = {
+            name: (
+                np.datetime64(value, np.datetime_data(dtype)[0])
+                if isinstance(value, pd.Timestamp)
+                else value
+            )
+            for name, value in stats.items()
+        }
+        numeric = True
+    else:
+        numeric = dtype.kind in "iuf"
+    if check.name == "greater_than_or_equal_to" and numeric:
+        return _range_op(stats["min_value"], None)
+    if check.name == "in_range" and numeric:
+        return _range_op(
+            stats["min_value"],
+            stats["max_value"],
+            include_min=stats.get("include_min", True),
+            include_max=stats.get("include_max", True),
+        )
+    if check.name == "str_length" and dtype.kind == "O":
+        return _str_length_op(stats.get("min_value"), stats.get("max_value"))
+    if check.name == "isin" and (numeric or dtype.kind == "O"):
+        return _isin_op(stats["allowed_values"])
+    return None
+
+
+def column_failure_mask(series: pd.Series, checks: List[Check]) -> Optional[np.ndarray]:
+    """列の組み込みチェックをブロック単位で評価し、失敗した行のマスクを返す。
+
+    Args:
+        series: 検証する列
+        checks: 融合して評価する組み込みチェック
+
+    Returns:
+        Optional[np.ndarray]: いずれかのチェックに失敗した行がTrueのマスク。
+            列のデータ型または値が未対応の場合はNone
+    """
+    ops = [_failure_op(check, series.dtype) for check in checks]
+    if any(op is None for op in ops):
+        return None
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.codes.to_numpy()
+    else:
+        values = series.to_numpy()
+
+    mask = np.zeros(len(values), dtype=bool)
+    try:
+        for start in range(0, len(values), BLOCK_SIZE):
+            block = values[start : start + BLOCK_SIZE]
+            out = mask[start : start + BLOCK_SIZE]
+            for op in ops:
+                op(block, out)
+    except TypeError:
+        return None
+    return mask
+
+
+class FusedSchema:
+    """組み込みの値チェックを列ごとに融合して評価するスキーマのラッパー。
+
+    元のスキーマから融合できるチェックを取り出し、それらを除いた残りの
+    スキーマを作成する。型変換を行う列のチェックは変換後の値に対して
+    評価されるため、融合しない。
+
+    Args:
+        schema: 元のスキーマ
+    """
+
+    def __init__(self, schema: DataFrameSchema) -> None:
+        self.schema = schema
+        self.column_checks: Dict[str, List[Check]] = {}
+        residual = copy.deepcopy(schema)
+        for name, column in residual.columns.items():
+            if schema.coerce or column.coerce or column.regex:
+                continue
+            fused = [check for check in column.checks if _is_fusable(check)]
+            if fused:
+                self.column_checks[name] = fused
+                column.checks = [
+                    check for check in column.checks if not _is_fusable(check)
+                ]
+        self.residual = residual
+
+    def failure_masks(self, df: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+        """融合したチェックを評価し、列ごとの失敗マスクを返す。
+
+        Args:
+            df: 検証するデータフレーム
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: 列名と失敗マスクの対応。
+                列が存在しない場合や、列のデータ型・値が未対応の場合はNone
+        """
+        if not all(name in df.columns for name in self.column_checks):
+            return None
+        masks = {}
+        for name, checks in self.column_checks.items():
+            mask = column_failure_mask(df[name], checks)
+            if mask is None:
+                return None
+            masks[name] = mask
+        return masks
+
+    def validate(self, df: pd.DataFrame, lazy: bool = False) -> pd.DataFrame:
+        """データフレームを検証する。
+
+        融合したチェックにすべての行が成功した場合は残りのスキーマで、
+        それ以外は元のスキーマで検証する。
+
+        Args:
+            df: 検証するデータフレーム
+            lazy: Trueの場合、すべてのエラーを集めてから ``SchemaErrors`` を送出する
+
+        Returns:
+            pd.DataFrame: 検証済みデータフレーム
+
+        Raises:
+            pa.errors.SchemaError: 検証に失敗した場合（``lazy=False``）
+            pa.errors.SchemaErrors: 検証に失敗した場合（``lazy=True``）
+        """
+        if self.column_checks:
+            masks = self.failure_masks(df)
+            if masks is None or any(mask.any() for mask in masks.values()):
+                return self.schema.validate(df, lazy=lazy)
+        return self.residual.validate(df, lazy=lazy)
+
+
+def compile_schema(schema: DataFrameSchema) -> FusedSchema:
+    """スキーマの融合スキーマを取得する（スキーマごとに一度だけ構築する）。
+
+    最近使用した ``FUSED_CACHE_MAXSIZE`` 件のスキーマの融合スキーマを保持する。
+
+    Args:
+        schema: 元のスキーマ
+
+    Returns:
+        FusedSchema: 融合スキーマ
+    """
+    with _fused_cache_lock:
+        entry = _fused_cache.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            _fused_cache.move_to_end(id(schema))
+            return entry[1]
+
+        fused = FusedSchema(schema)
+        _fused_cache[id(schema)] = (schema, fused)
+        _fused_cache.move_to_end(id(schema))
+        while len(_fused_cache) > FUSED_CACHE_MAXSIZE:
+            _fused_cache.popitem(last=False)
+    return fused
+
+
+def clear_fused_cache() -> None:
+    """構築済みの融合スキーマを破棄する。"""
+    with _fused_cache_lock:
+        _fused_cache.clear()
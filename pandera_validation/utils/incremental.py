@@ -0,0 +1,218 @@
+"""検証済みデータへの追加行のみを検証するインクリメンタルバリデーション。"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandera_validation.schemas.hierarchy import ManagerHierarchy
+from pandera_validation.utils.aggregates import FrameAggregates
+from pandera_validation.utils.errors import ValidationErrorReport
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.validation import (
+    ValidationResult,
+    _handle_exception,
+    _schema_hash,
+    get_schema_for,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 保存する状態ファイルのフォーマットバージョン
+STATE_FORMAT_VERSION = 2
+
+
+def _contains(sorted_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """ソート済み配列に各値が含まれるかを二分探索で判定する。"""
+    positions = np.searchsorted(sorted_ids, values)
+    found = positions < len(sorted_ids)
+    found[found] = sorted_ids[positions[found]] == values[found]
+    return found
+
+
+class IncrementalValidator:
+    """検証済みデータの集計状態を保持し、追加行のみを検証するバリデータ。
+
+    既存データの社員ID（ソート済み配列）と各社員の管理階層の深さ、
+    部署ごとの給与合計と人数、上司IDと評価スコアが基準未満の社員IDを
+    状態として保持する。追加行の上司が既存の社員の場合は、保持している
+    深さから追加行の深さを求めるため、既存データの管理階層は再評価しない。
+    ``validate_append`` は追加行を行単位で検証したうえで、状態と結合して
+    行をまたぐルールを評価するため、全体を再検証した場合と同じ結果になる。
+    検証に成功した場合のみ状態を更新する。
+
+    Args:
+        state: 初期状態（Noneの場合は空の状態から開始する）
+    """
+
+    def __init__(self, state: Optional[FrameAggregates] = None) -> None:
+        state = state.copy() if state is not None else FrameAggregates()
+        self._sorted_ids = np.unique(state.all_employee_ids())
+        self._depths = state.hierarchy(self._sorted_ids).depth
+        state.employee_ids = [self._sorted_ids]
+        self._state = state
+
+    @property
+    def state(self) -> FrameAggregates:
+        """検証済みデータの集計状態。"""
+        return self._state
+
+    @property
+    def record_count(self) -> int:
+        """検証済みのレコード数。"""
+        return self._state.record_count
+
+    def validate_append(self, delta: pd.DataFrame) -> ValidationResult:
+        """追加行を検証し、成功した場合は状態に取り込む。
+
+        Args:
+            delta: 追加する社員データのデータフレーム
+
+        Returns:
+            ValidationResult: ``validate_employee_data`` と同じ形式のタプル。
+                検証済みデータフレームは追加行のみ、サマリーは取り込み後の
+                全データに対するもの
+        """
+        try:
+            # Parquet・Arrow IPCから読み込んだ追加行はArrow型のスキーマで検証する
+            schema = get_schema_for(delta, row_level=True)
+            validated = compile_schema(schema).validate(delta)
+
+            delta_state = FrameAggregates.from_frame(validated)
+            delta_ids, counts = np.unique(
+                delta_state.all_employee_ids(), return_counts=True
+            )
+
+            # 追加行内および既存データとの社員IDの重複
+            duplicated = np.union1d(
+                delta_ids[counts > 1], delta_ids[_contains(self._sorted_ids, delta_ids)]
+            )
+
+            # 既存データと追加行を合わせた状態で行をまたぐルールを評価
+            candidate = self._state.copy().merge(delta_state)
+            manager_ids = candidate.manager_ids
+            managers = manager_ids[
+                _contains(self._sorted_ids, manager_ids)
+                | _contains(delta_ids, manager_ids)
+            ]
+            # 追加行の管理階層（既存データの社員を上司とする行は既存の深さに続ける）
+            hierarchy = ManagerHierarchy.from_frame(
+                validated, known_ids=self._sorted_ids, known_depths=self._depths
+            )
+            error_msg = candidate.find_errors(
+                duplicated=duplicated,
+                managers=managers,
+                hierarchy=hierarchy,
+                hierarchy_ids=validated["employee_id"].to_numpy(dtype=np.int64),
+                schema_hash=_schema_hash(schema),
+            )
+            if error_msg is not None:
+                logger.error(f"バリデーションエラー: {error_msg}")
+                return False, None, error_msg, None
+
+            # 状態の更新（ソート済みの社員ID配列に追加分を挿入）
+            positions = np.searchsorted(self._sorted_ids, delta_ids)
+            self._sorted_ids = np.insert(self._sorted_ids, positions, delta_ids)
+            order = np.argsort(validated["employee_id"].to_numpy(), kind="stable")
+            self._depths = np.insert(self._depths, positions, hierarchy.depth[order])
+            candidate.employee_ids = [self._sorted_ids]
+            self._state = candidate
+
+            logger.info(
+                f"バリデーション成功: {len(validated)}件の追加レコードが検証されました"
+                f"（累計{candidate.record_count}件）"
+            )
+            return (
+                True,
+                validated,
+                None,
+                candidate.summary(schema_hash=_schema_hash(schema)),
+            )
+
+        except pa.errors.SchemaError as e:
+            # スキーマエラー（失敗件数と先頭の失敗ケースのみをメッセージにする）
+            error_msg = ValidationErrorReport.from_schema_error(
+                e, schema_hash=_schema_hash(schema)
+            )
+            logger.error(f"バリデーションエラー: {error_msg}")
+            return False, None, error_msg, None
+
+        except Exception as e:
+            return _handle_exception(e)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """状態をファイルに保存する。
+
+        書き込み途中のファイルが残らないよう、一時ファイルに書き出してから置き換える。
+
+        Args:
+            path: 保存先のファイルパス（NumPyの ``.npz`` 形式）
+        """
+        state = self._state
+        departments = list(state.department_count)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                format_version=np.int64(STATE_FORMAT_VERSION),
+                record_count=np.int64(state.record_count),
+                employee_ids=self._sorted_ids,
+                manager_ids=state.manager_ids,
+                reporting_lines=state.all_reporting_lines(),
+                low_score_ids=state.low_score_ids,
+                departments=np.array(departments, dtype=str),
+                department_salary_sum=np.array(
+                    [state.department_salary_sum[dept] for dept in departments],
+                    dtype=np.int64,
+                ),
+                department_count=np.array(
+                    [state.department_count[dept] for dept in departments],
+                    dtype=np.int64,
+                ),
+                sums=np.array([state.age_sum, state.salary_sum, state.score_sum]),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IncrementalValidator":
+        """ファイルに保存した状態からバリデータを復元する。
+
+        Args:
+            path: ``save`` で保存したファイルのパス
+
+        Returns:
+            IncrementalValidator: 保存時の状態を持つバリデータ
+
+        Raises:
+            ValueError: フォーマットバージョンが一致しない場合
+        """
+        with np.load(path) as data:
+            version = int(data["format_version"])
+            if version != STATE_FORMAT_VERSION:
+                raise ValueError(
+                    f"状態ファイルのフォーマットバージョンが一致しません: {version}"
+                )
+            departments = data["departments"].tolist()
+            age_sum, salary_sum, score_sum = data["sums"].tolist()
+            state = FrameAggregates(
+                record_count=int(data["record_count"]),
+                employee_ids=[data["employee_ids"]],
+                manager_ids=data["manager_ids"],
+                reporting_lines=[data["reporting_lines"]],
+                low_score_ids=data["low_score_ids"],
+                department_salary_sum=dict(
+                    zip(departments, data["department_salary_sum"].tolist())
+                ),
+                department_count=dict(
+                    zip(departments, data["department_count"].tolist())
+                ),
+                age_sum=age_sum,
+                salary_sum=salary_sum,
+                score_sum=score_sum,
+            )
+        return cls(state)
@@ -0,0 +1,301 @@
+"""全エラーを1回の検証で収集し、有効な行と隔離する行に分割する遅延検証。"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+from pandera import Column, DataFrameSchema
+from pandera.errors import ParserError
+
+from pandera_validation.schemas.employee import (
+    MANAGER_ID_CHECKS,
+    MIN_DEPARTMENT_AVG_SALARY,
+    department_salary_means,
+    low_score_manager_rows,
+)
+from pandera_validation.utils.errors import (
+    DEFAULT_MAX_EXAMPLES,
+    FAILURE_CASE_COLUMNS,
+    ValidationErrorReport,
+)
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.validation import build_summary, get_schema_for
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LazyValidationResult:
+    """遅延検証の結果。
+
+    Attributes:
+        success: すべてのチェックを通過したかどうか
+        valid_df: 失敗ケースに該当しない行（型変換済み）
+        invalid_df: 失敗ケースに該当し、隔離された行
+        failure_cases: 列、チェック、行インデックス、値を持つ失敗ケースの一覧
+        summary: 有効な行のサマリー情報（有効な行がない場合はNone）
+    """
+
+    success: bool
+    valid_df: pd.DataFrame
+    invalid_df: pd.DataFrame
+    failure_cases: pd.DataFrame
+    summary: Optional[Dict[str, Any]]
+
+    def error_report(
+        self, max_examples: int = DEFAULT_MAX_EXAMPLES
+    ) -> Optional[ValidationErrorReport]:
+        """列・チェックごとの失敗件数と先頭の失敗ケースを持つ検証エラーを返す。
+
+        Args:
+            max_examples: 文字列に含める失敗ケースの件数
+
+        Returns:
+            Optional[ValidationErrorReport]: 検証エラー（成功した場合はNone）
+        """
+        if self.success:
+            return None
+        return ValidationErrorReport.from_failure_cases(
+            f"バリデーションエラー: {len(self.invalid_df)}件の行を隔離しました",
+            self.failure_cases,
+            max_examples=max_examples,
+        )
+
+
+def validate_employee_data_lazy(
+    df: pd.DataFrame, schema: Optional[DataFrameSchema] = None
+) -> LazyValidationResult:
+    """社員データを遅延モードで検証し、全失敗ケースと行の分割結果を返す。
+
+    最初のエラーで停止せず、1回の検証ですべての失敗ケースを収集する。
+    行インデックスを持つ失敗ケースはその行を、持たない失敗ケース
+    （データ型の不一致やデータフレームレベルのチェック）は原因となった行を
+    特定して隔離する。特定できない場合はすべての行を隔離する。
+    データフレームレベルのルールは入力全体に対して評価される。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+        schema: 使用するスキーマ（Noneの場合はデータ型に対応するキャッシュ済みの
+            社員データスキーマ）
+
+    Returns:
+        LazyValidationResult: 失敗ケースと有効・隔離行の分割結果
+    """
+    schema = schema if schema is not None else get_schema_for(df)
+    try:
+        validated_df = compile_schema(schema).validate(df, lazy=True)
+    except pa.errors.SchemaErrors as e:
+        failure_cases = _normalize_failure_cases(schema, df, e.failure_cases)
+        invalid_mask = df.index.isin(failure_cases["index"].dropna())
+        if failure_cases["index"].isna().any():
+            invalid_mask[:] = True
+
+        valid_df = _coerce_valid_rows(schema, df[~invalid_mask])
+        invalid_df = df[invalid_mask]
+        logger.error(
+            f"バリデーションエラー: {len(failure_cases)}件の失敗ケース、"
+            f"{len(invalid_df)}件の行を隔離しました"
+        )
+        return LazyValidationResult(
+            success=False,
+            valid_df=valid_df,
+            invalid_df=invalid_df,
+            failure_cases=failure_cases,
+            summary=build_summary(valid_df) if len(valid_df) else None,
+        )
+
+    logger.info(f"バリデーション成功: {len(validated_df)}件のレコードが検証されました")
+    return LazyValidationResult(
+        success=True,
+        valid_df=validated_df,
+        invalid_df=df.iloc[0:0],
+        failure_cases=pd.DataFrame(columns=FAILURE_CASE_COLUMNS),
+        summary=build_summary(validated_df),
+    )
+
+
+def _normalize_failure_cases(
+    schema: DataFrameSchema, df: pd.DataFrame, failure_cases: pd.DataFrame
+) -> pd.DataFrame:
+    """Panderaの失敗ケースを行単位の失敗ケースの一覧に変換する。"""
+    check_names = {check.error: check.name for check in schema.checks}
+    dtype_failed = set(
+        failure_cases.loc[
+            failure_cases["check"].astype(str).str.startswith("dtype("), "column"
+        ]
+    )
+    # 行インデックスを持つ列チェックの失敗ケースはそのまま使用する
+    is_simple = (failure_cases["schema_context"] != "DataFrameSchema") & failure_cases[
+        "index"
+    ].notna()
+    simple = failure_cases.loc[is_simple, FAILURE_CASE_COLUMNS]
+
+    rows = []
+    for case in failure_cases[~is_simple].itertuples(index=False):
+        column, check, index, value = (
+            case.column,
+            case.check,
+            case.index,
+            case.failure_case,
+        )
+
+        if case.schema_context == "DataFrameSchema":
+            check = check_names.get(check, check)
+            if isinstance(value, dict):
+                # 行単位のデータフレームレベルチェック（例: 上司IDの自己参照）
+                for column, cell in value.items():
+                    rows.append((column, check, index, cell))
+                continue
+            if index is None:
+                rows.extend(_attribute_frame_failure(df, check, value))
+                continue
+            column = None
+        elif index is None and check.startswith("dtype("):
+            rows.extend(_attribute_dtype_failure(schema, df, column, check, value))
+            continue
+        elif index is None and column in dtype_failed:
+            # データ型の不一致が原因で値チェック自体が実行できなかった場合
+            continue
+
+        rows.append((column, check, index, value))
+
+    # 空の一覧は結合後のデータ型の決定に影響するため、結合前に除く
+    frames = [
+        frame
+        for frame in (simple, pd.DataFrame(rows, columns=FAILURE_CASE_COLUMNS))
+        if len(frame)
+    ]
+    if not frames:
+        return pd.DataFrame(columns=FAILURE_CASE_COLUMNS)
+    # 同じ行・列・チェックの重複を除く（データ型と値チェックの重複報告など）
+    result = pd.concat(frames, ignore_index=True)
+    keys = result[["column", "check", "index"]].astype(str)
+    return result[~keys.duplicated()].reset_index(drop=True)
+
+
+def _attribute_frame_failure(df: pd.DataFrame, check: str, value: Any) -> list:
+    """行インデックスを持たないデータフレームレベルの失敗の原因行を特定する。"""
+    if check in MANAGER_ID_CHECKS and {"employee_id", "manager_id"} <= set(df):
+        # pyarrowベースの列ではPanderaが行単位の失敗ケースを集約できないため、
+        # チェックを再評価して原因行を求める
+        result = MANAGER_ID_CHECKS[check](df)
+        if result is True:
+            return []
+        is_valid = result["manager_id"]
+        target = df.loc[~is_valid, "manager_id"]
+        return [
+            ("manager_id", check, index, manager_id)
+            for index, manager_id in target.items()
+        ]
+    if check == "department_avg_salary" and {"department", "salary"} <= set(df):
+        means = department_salary_means(df)
+        low = means.index[~(means >= MIN_DEPARTMENT_AVG_SALARY)]
+        target = df[df["department"].isin(low)]
+        return [
+            ("department", check, index, dept)
+            for index, dept in target["department"].items()
+        ]
+    if check == "manager_min_score" and {
+        "employee_id",
+        "manager_id",
+        "performance_score",
+    } <= set(df):
+        low = low_score_manager_rows(df)
+        if low is not None and len(low):
+            target = df.iloc[low]
+            return [
+                ("performance_score", check, index, score)
+                for index, score in target["performance_score"].items()
+            ]
+    return [(None, check, None, value)]
+
+
+def _attribute_dtype_failure(
+    schema: DataFrameSchema,
+    df: pd.DataFrame,
+    column: str,
+    check: str,
+    value: Any,
+) -> list:
+    """列全体のデータ型の失敗について、型変換できない値を持つ行を特定する。
+
+    型変換で例外にならなくても値が変わる行（整数列への小数の切り捨てや
+    桁あふれなど）も失敗とし、有効な行に変更された値が残らないようにする。
+    """
+    series = df[column]
+    dtype = schema.columns[column].dtype
+    failed = np.zeros(len(series), dtype=bool)
+    rows = []
+    try:
+        coerced = dtype.try_coerce(series)
+    except ParserError as e:
+        rows = [
+            (column, check, index, cell)
+            for index, cell in zip(
+                e.failure_cases["index"], e.failure_cases["failure_case"]
+            )
+        ]
+        failed = series.index.isin(e.failure_cases["index"])
+        try:
+            coerced = dtype.try_coerce(series[~failed])
+        except Exception:
+            return [(column, check, None, value)]
+    except Exception:
+        return [(column, check, None, value)]
+
+    remaining = series[~failed]
+    changed = _changed_by_coercion(remaining, coerced)
+    rows.extend(
+        (column, check, index, cell) for index, cell in remaining[changed].items()
+    )
+    if not rows:
+        return [(column, check, None, value)]
+    # 元の列では型の不一致で値チェックが実行できないため、変換できた値で評価する
+    return rows + _check_coerced_values(schema.columns[column], coerced[~changed])
+
+
+def _check_coerced_values(column: Column, coerced: pd.Series) -> list:
+    """型変換できた値で列のチェックを評価し、失敗した行を返す。"""
+    try:
+        column.validate(coerced.to_frame(column.name), lazy=True)
+    except pa.errors.SchemaErrors as e:
+        return [
+            (column.name, case.check, case.index, case.failure_case)
+            for case in e.failure_cases.itertuples(index=False)
+        ]
+    return []
+
+
+def _changed_by_coercion(original: pd.Series, coerced: pd.Series) -> np.ndarray:
+    """整数型への変換で値が変わる行（小数部の切り捨てや桁あふれ）のマスクを返す。"""
+    if not pd.api.types.is_integer_dtype(coerced.dtype):
+        return np.zeros(len(original), dtype=bool)
+    numeric = pd.to_numeric(original, errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    values = coerced.to_numpy(dtype=np.float64, na_value=np.nan)
+    return ~np.isnan(numeric) & (numeric != values)
+
+
+def _coerce_valid_rows(schema: DataFrameSchema, valid_df: pd.DataFrame) -> pd.DataFrame:
+    """有効な行の各列をスキーマのデータ型に変換する。
+
+    型変換できない値が残る列（原因行を特定できなかった場合など）は
+    元のデータ型のままとし、それ以外の例外はログに記録する。
+    """
+    valid_df = valid_df.copy()
+    for name, column in schema.columns.items():
+        if name not in valid_df or column.dtype is None:
+            continue
+        coercer = Column(column.dtype, name=name, coerce=True)
+        try:
+            valid_df[name] = coercer.coerce_dtype(valid_df[name])
+        except (pa.errors.SchemaError, pa.errors.SchemaErrors):
+            continue
+        except Exception:
+            logger.exception(f"列 '{name}' の型変換で予期しないエラーが発生しました")
+    return valid_df
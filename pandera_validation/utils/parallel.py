@@ -0,0 +1,136 @@
+"""プロセスプールを使った社員データの並列バリデーション。"""
+
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandera_validation.utils.aggregates import FrameAggregates
+from pandera_validation.utils.errors import ValidationErrorReport
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.validation import (
+    ValidationResult,
+    _handle_exception,
+    _schema_hash,
+    get_schema_for,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# ワーカーの処理結果（エラーメッセージ、検証済みデータ、集計状態）
+PartitionResult = Tuple[
+    Optional[str], Optional[pd.DataFrame], Optional[FrameAggregates]
+]
+
+
+def _validate_partition(partition: pd.DataFrame) -> PartitionResult:
+    """ワーカープロセスで1つのパーティションを行単位で検証する。
+
+    スキーマはワーカー内のキャッシュから取得するため、
+    プロセスごとに一度だけ構築される。
+
+    Args:
+        partition: 検証するデータフレームの一部
+
+    Returns:
+        PartitionResult: エラーメッセージ（成功時はNone）、検証済みデータ、
+            行をまたぐルール評価用の集計状態
+    """
+    schema = get_schema_for(partition, row_level=True)
+    try:
+        validated = compile_schema(schema).validate(partition)
+    except pa.errors.SchemaError as e:
+        # プロセス間で受け渡すため、先頭の失敗ケースのみを保持する
+        return (
+            ValidationErrorReport.from_schema_error(
+                e, keep_failure_cases=False, schema_hash=_schema_hash(schema)
+            ),
+            None,
+            None,
+        )
+    return None, validated, FrameAggregates.from_frame(validated)
+
+
+def split_frame(df: pd.DataFrame, n_partitions: int) -> List[pd.DataFrame]:
+    """データフレームを行方向にほぼ均等なパーティションへ分割する。
+
+    Args:
+        df: 分割するデータフレーム
+        n_partitions: パーティション数
+
+    Returns:
+        List[pd.DataFrame]: 空でないパーティションのリスト
+    """
+    bounds = np.linspace(0, len(df), num=max(n_partitions, 1) + 1, dtype=int)
+    return [
+        df.iloc[start:stop]
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
+
+
+def validate_employee_data_parallel(
+    df: pd.DataFrame,
+    max_workers: Optional[int] = None,
+    n_partitions: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> ValidationResult:
+    """社員データを複数プロセスで分割して検証する。
+
+    各ワーカーは行単位のチェックを実行して ``FrameAggregates`` を返し、
+    親プロセスがそれらを結合して社員IDの一意性と
+    データフレームレベルのルールを評価する。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+        max_workers: ワーカープロセス数（Noneの場合はCPUコア数）
+        n_partitions: 分割数（Noneの場合はワーカー数と同じ）
+        executor: 再利用するエグゼキュータ（Noneの場合は呼び出しごとに作成）
+
+    Returns:
+        ValidationResult: ``validate_employee_data`` と同じ形式のタプル
+    """
+    try:
+        schema = get_schema_for(df, row_level=True)
+        max_workers = max_workers or os.cpu_count() or 1
+        partitions = split_frame(df, n_partitions or max_workers)
+
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_validate_partition, partitions))
+        else:
+            results = list(executor.map(_validate_partition, partitions))
+
+        # 行単位のエラーは、先頭のパーティションのものを報告する
+        for error_msg, _, _ in results:
+            if error_msg is not None:
+                logger.error(f"バリデーションエラー: {error_msg}")
+                return False, None, error_msg, None
+
+        # パーティションごとの集計を結合して行をまたぐルールを評価
+        aggregates = FrameAggregates()
+        for _, _, partial in results:
+            aggregates.merge(partial)
+
+        error_msg = aggregates.find_errors(schema_hash=_schema_hash(schema))
+        if error_msg is not None:
+            logger.error(f"バリデーションエラー: {error_msg}")
+            return False, None, error_msg, None
+
+        if results:
+            validated_df = pd.concat([validated for _, validated, _ in results])
+        else:
+            validated_df = schema.validate(df)
+        summary = aggregates.summary(schema_hash=_schema_hash(schema))
+        logger.info(
+            f"バリデーション成功: {summary['record_count']}件のレコードが検証されました"
+        )
+        return True, validated_df, None, summary
+
+    except Exception as e:
+        return _handle_exception(e)
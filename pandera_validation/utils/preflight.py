@@ -0,0 +1,220 @@
+"""値のチェックの前に列名・列の順序・データ型だけを確認する構造の事前チェック。
+
+CSVはヘッダーと先頭の数行だけを、Parquet・Arrow IPCはファイルに保存された
+スキーマ情報だけを読み込むため、データ全体を読み込む前に構造の壊れた入力を
+数ミリ秒で検出できる。
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from pandera_validation.schemas.columns import EMPLOYEE_STRUCTURE, FrameStructure
+from pandera_validation.utils.readers import (
+    ARROW_SUFFIXES,
+    PARQUET_SUFFIXES,
+    _require_pyarrow,
+    csv_read_options,
+    find_malformed_cells,
+)
+
+if TYPE_CHECKING:
+    from pandera import DataFrameSchema
+
+
+# CSVのデータ型の確認に使用する先頭の行数
+DEFAULT_SAMPLE_ROWS = 100
+
+
+@dataclass
+class PreflightResult:
+    """構造の事前チェックの結果。
+
+    Attributes:
+        columns: 入力の列名（ファイル内の順序）
+        errors: 検出した構造のエラー
+    """
+
+    columns: List[str]
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """構造のエラーがないかどうか。"""
+        return not self.errors
+
+
+def preflight_check(
+    path: Union[str, Path],
+    schema: Optional[Union["DataFrameSchema", FrameStructure]] = None,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    ordered: Optional[bool] = None,
+) -> PreflightResult:
+    """ファイルの列名・列の順序・データ型をスキーマと照合する。
+
+    Args:
+        path: 確認するCSV・Parquet・Arrow IPCファイルのパス
+        schema: 使用するスキーマまたは構造（Noneの場合は社員データの構造
+            ``EMPLOYEE_STRUCTURE`` を使用し、Panderaを読み込まない）
+        sample_rows: CSVのデータ型の確認に使用する先頭の行数
+        ordered: Trueの場合、列の順序がスキーマと一致することを確認する
+            （Noneの場合はスキーマの ``ordered`` に従う）
+
+    Returns:
+        PreflightResult: 入力の列名と検出した構造のエラー
+    """
+    schema = schema if schema is not None else EMPLOYEE_STRUCTURE
+    ordered = schema.ordered if ordered is None else ordered
+    suffix = Path(path).suffix.lower()
+
+    if suffix in PARQUET_SUFFIXES or suffix in ARROW_SUFFIXES:
+        _require_pyarrow()
+        arrow_schema = _read_arrow_schema(path, suffix)
+        columns = [
+            name for name in arrow_schema.names if not name.startswith("__index_level_")
+        ]
+        result = PreflightResult(columns=columns)
+        _check_columns(result, schema, ordered)
+        _check_arrow_types(result, schema, arrow_schema)
+    else:
+        columns = list(pd.read_csv(path, nrows=0).columns)
+        result = PreflightResult(columns=columns)
+        _check_columns(result, schema, ordered)
+        _check_csv_sample(result, schema, path, sample_rows)
+    return result
+
+
+def _read_arrow_schema(path: Union[str, Path], suffix: str) -> Any:
+    """Parquet・Arrow IPC・Featherファイルのスキーマ情報だけを読み込む。"""
+    if suffix in PARQUET_SUFFIXES:
+        import pyarrow.parquet
+
+        return pyarrow.parquet.read_schema(path)
+
+    import pyarrow
+    import pyarrow.ipc
+    from pyarrow import feather
+
+    # Arrow IPCファイル（Feather V2）はフッターのスキーマ情報のみを読み込む
+    try:
+        with pyarrow.ipc.open_file(path) as reader:
+            return reader.schema
+    except pyarrow.ArrowInvalid:
+        pass
+    # Arrow IPCストリーム形式は先頭のスキーマのメッセージのみを読み込む
+    try:
+        with pyarrow.ipc.open_stream(path) as reader:
+            return reader.schema
+    except pyarrow.ArrowInvalid:
+        pass
+    # Feather V1はメモリマップして読み込む（列のデータはコピーされない）
+    return feather.read_table(path, memory_map=True).schema
+
+
+def _check_columns(
+    result: PreflightResult,
+    schema: Union["DataFrameSchema", FrameStructure],
+    ordered: bool,
+) -> None:
+    """必須の列の有無と列の順序を確認する。"""
+    present = set(result.columns)
+    for name, column in schema.columns.items():
+        if column.required and name not in present:
+            result.errors.append(f"列 '{name}' がありません")
+
+    if ordered:
+        expected = [name for name in schema.columns if name in present]
+        actual = [name for name in result.columns if name in schema.columns]
+        if actual != expected:
+            result.errors.append(
+                f"列の順序がスキーマと一致しません: {actual}（期待: {expected}）"
+            )
+
+
+def _expected_kind(column_dtype: Any) -> str:
+    """スキーマの列のデータ型の種類（int, float, str, datetime）を返す。"""
+    name = str(column_dtype).lower()
+    if name.startswith(("datetime", "timestamp")):
+        return "datetime"
+    if name.startswith(("int", "uint")):
+        return "int"
+    if name.startswith(("float", "double")):
+        return "float"
+    return "str"
+
+
+def _arrow_kind(arrow_type: Any) -> str:
+    """Arrowのデータ型の種類（int, float, str, datetime, null）を返す。"""
+    import pyarrow
+
+    if pyarrow.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pyarrow.types.is_integer(arrow_type):
+        return "int"
+    if pyarrow.types.is_floating(arrow_type):
+        return "float"
+    if pyarrow.types.is_timestamp(arrow_type) or pyarrow.types.is_date(arrow_type):
+        return "datetime"
+    if pyarrow.types.is_null(arrow_type):
+        return "null"
+    if pyarrow.types.is_string(arrow_type) or pyarrow.types.is_large_string(arrow_type):
+        return "str"
+    return str(arrow_type)
+
+
+def _check_arrow_types(
+    result: PreflightResult,
+    schema: Union["DataFrameSchema", FrameStructure],
+    arrow_schema: Any,
+) -> None:
+    """Parquet・Arrow IPCのスキーマ情報の各列のデータ型を確認する。"""
+    for name, column in schema.columns.items():
+        if name not in arrow_schema.names or column.dtype is None:
+            continue
+        expected = _expected_kind(column.dtype)
+        actual = _arrow_kind(arrow_schema.field(name).type)
+        if actual == expected or (actual == "null" and column.nullable):
+            continue
+        # 整数列は浮動小数点数から型変換でき、浮動小数点数列は整数を受け付ける
+        if expected == "int" and actual == "float" and column.coerce:
+            continue
+        if expected == "float" and actual == "int":
+            continue
+        result.errors.append(
+            f"列 '{name}' のデータ型が一致しません: "
+            f"{arrow_schema.field(name).type}（期待: {column.dtype}）"
+        )
+
+
+def _check_csv_sample(
+    result: PreflightResult,
+    schema: Union["DataFrameSchema", FrameStructure],
+    path: Union[str, Path],
+    sample_rows: int,
+) -> None:
+    """CSVの先頭の行がスキーマのデータ型に変換できることを確認する。"""
+    options = csv_read_options(schema, header=result.columns, engine="c")
+    failure_cases = find_malformed_cells(
+        path, options["dtype"], options["date_columns"], nrows=sample_rows
+    )
+    for (column, check), cases in failure_cases.groupby(
+        ["column", "check"], sort=False
+    ):
+        if check == "not_nullable":
+            result.errors.append(
+                f"列 '{column}' にNULL値があります"
+                f"（先頭{sample_rows}行中{len(cases)}件）"
+            )
+            continue
+        values = _format_values(cases["failure_case"])
+        result.errors.append(
+            f"列 '{column}' の値をデータ型 {schema.columns[column].dtype} に"
+            f"変換できません（先頭{sample_rows}行中{len(cases)}件）: {values}"
+        )
+
+
+def _format_values(values: Sequence[Any], limit: int = 3) -> str:
+    """エラーメッセージ用に先頭の値を列挙する。"""
+    return ", ".join(repr(value) for value in list(values)[:limit])
@@ -0,0 +1,173 @@
+"""スキーマの各チェックの実行時間を計測するプロファイリング。"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandera import Check, DataFrameSchema
+from pandera.engines.pandas_engine import Engine
+
+
+def _count_failures(result: Any) -> int:
+    """データ型チェックの結果（ブール値または要素ごとの結果）から失敗件数を数える。"""
+    if isinstance(result, (bool, np.bool_)):
+        return int(not result)
+    return int((~np.asarray(result, dtype=bool)).sum())
+
+
+def _check_label(check: Check) -> str:
+    """チェックの表示名を返す。"""
+    if check.name and check.name != "<lambda>":
+        return check.name
+    return check.error or str(check)
+
+
+class CheckProfiler:
+    """チェックごとの実行時間、処理行数、失敗件数を記録する。"""
+
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def record(
+        self,
+        kind: str,
+        column: Optional[str],
+        check: str,
+        seconds: float,
+        rows: int,
+        failures: int,
+    ) -> None:
+        """1つのチェックの計測結果を記録する。"""
+        self.records.append(
+            {
+                "kind": kind,
+                "column": column,
+                "check": check,
+                "seconds": seconds,
+                "rows": rows,
+                "failures": failures,
+            }
+        )
+
+    @property
+    def failed(self) -> bool:
+        """失敗したチェックがあるかどうか。"""
+        return any(record["failures"] for record in self.records)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """計測結果をサマリー用の辞書に変換する。"""
+        return {
+            "total_seconds": sum(record["seconds"] for record in self.records),
+            "checks": self.records,
+        }
+
+
+def _run_check(check: Check, check_obj: Any) -> int:
+    """Panderaのチェックを実行し、失敗件数を返す。
+
+    チェック関数自体が例外を送出した場合は、全行を失敗として数える。
+    """
+    try:
+        result = check(check_obj)
+    except Exception:
+        return len(check_obj)
+    if result.check_passed:
+        return 0
+    if result.failure_cases is None:
+        return 1
+    return max(len(result.failure_cases), 1)
+
+
+def profile_validation(
+    schema: DataFrameSchema, df: pd.DataFrame
+) -> Tuple[Optional[pd.DataFrame], CheckProfiler]:
+    """スキーマのチェックを1つずつ計測しながら実行する。
+
+    列ごとに型変換、データ型、NULL、一意性、値チェックを順に実行し、
+    最後にデータフレームレベルのチェックを実行する。各チェックには
+    Panderaの ``DataType`` と ``Check`` オブジェクトをそのまま使用する。
+    失敗を検出した場合は検証済みデータフレームの代わりにNoneを返すので、
+    呼び出し側で ``schema.validate`` を実行してエラー内容を取得する。
+
+    Args:
+        schema: 検証に使用するスキーマ
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], CheckProfiler]:
+            検証済みデータフレーム（失敗時はNone）とチェックごとの計測結果
+    """
+    type(schema).register_default_backends(type(df))
+    profiler = CheckProfiler()
+    rows = len(df)
+    validated_df = df
+    timer = time.perf_counter
+
+    for name, column in schema.columns.items():
+        if name not in df.columns:
+            profiler.record("column", name, "column_in_dataframe", 0.0, rows, rows)
+            return None, profiler
+        series = df[name]
+
+        if column.coerce and column.dtype is not None:
+            start = timer()
+            try:
+                series = column.dtype.try_coerce(series)
+                failures = 0
+            except Exception:
+                failures = rows
+            profiler.record("dtype", name, "coerce", timer() - start, rows, failures)
+            if failures:
+                return None, profiler
+            if validated_df is df:
+                validated_df = df.copy(deep=False)
+            validated_df[name] = series
+
+        if column.dtype is not None:
+            start = timer()
+            result = column.dtype.check(Engine.dtype(series.dtype), series)
+            profiler.record(
+                "dtype",
+                name,
+                f"dtype('{column.dtype}')",
+                timer() - start,
+                rows,
+                _count_failures(result),
+            )
+
+        if not column.nullable:
+            start = timer()
+            failures = int(series.isna().sum())
+            profiler.record(
+                "column", name, "not_nullable", timer() - start, rows, failures
+            )
+
+        if column.unique:
+            start = timer()
+            failures = int(series.duplicated(keep=False).sum())
+            profiler.record("column", name, "unique", timer() - start, rows, failures)
+
+        if profiler.failed:
+            return None, profiler
+
+        for check in column.checks:
+            start = timer()
+            failures = _run_check(check, series)
+            profiler.record(
+                "column", name, _check_label(check), timer() - start, rows, failures
+            )
+
+    if profiler.failed:
+        return None, profiler
+
+    for check in schema.checks:
+        start = timer()
+        failures = _run_check(check, validated_df)
+        profiler.record(
+            "frame", None, _check_label(check), timer() - start, rows, failures
+        )
+
+    if profiler.failed:
+        return None, profiler
+    return validated_df, profiler
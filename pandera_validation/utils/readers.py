@@ -0,0 +1,423 @@
+"""CSV・Parquet・Arrow IPC（Feather）形式の社員データの読み込み。
+
+Parquet・Arrow IPCは、pyarrowで読み込んだ列を ``pd.ArrowDtype`` のまま保持し、
+NumPyのオブジェクト列への変換や ``pd.to_datetime`` による日付変換を行わずに検証へ渡す。
+CSVは、スキーマから作成したデータ型を指定して読み込み時に型変換する。
+pyarrowは任意の依存パッケージで、Parquet・Arrow IPCの読み込みにのみ必要となる
+（CSVの読み込みではインストールされていれば高速なpyarrowエンジンを使用する）。
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from pandera_validation.schemas.columns import EMPLOYEE_STRUCTURE, FrameStructure
+from pandera_validation.utils.errors import FAILURE_CASE_COLUMNS
+
+if TYPE_CHECKING:
+    from pandera import DataFrameSchema
+
+
+# Parquet形式として扱う拡張子
+PARQUET_SUFFIXES = frozenset({".parquet", ".pq"})
+
+# Arrow IPC（Feather）形式として扱う拡張子
+ARROW_SUFFIXES = frozenset({".feather", ".arrow", ".ipc"})
+
+# エラーメッセージに含める型変換できないセルの最大件数
+MAX_REPORTED_CELLS = 10
+
+# 浮動小数点数として読み込んだ値を整数に変換しても値が変わらない絶対値の上限
+MAX_EXACT_INTEGER = 2**53
+
+# int64型で表せる値の範囲の上限（この値以上は桁あふれとする）
+INT64_LIMIT = 2**63
+
+
+def _has_pyarrow() -> bool:
+    """pyarrowがインストールされているかどうか。"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _require_pyarrow() -> None:
+    """pyarrowがインストールされていることを確認する。"""
+    if not _has_pyarrow():
+        raise ImportError(
+            "Parquet・Arrow IPC形式の読み込みにはpyarrowが必要です"
+            "（pip install pyarrow）"
+        )
+
+
+def read_employee_parquet(
+    path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Parquetファイルをpyarrowベースのデータ型のまま読み込む。
+
+    Args:
+        path: Parquetファイルのパス
+        columns: 読み込む列（Noneの場合はすべての列）
+
+    Returns:
+        pd.DataFrame: ``pd.ArrowDtype`` の列を持つ社員データ
+    """
+    _require_pyarrow()
+    return pd.read_parquet(
+        path, columns=columns, engine="pyarrow", dtype_backend="pyarrow"
+    )
+
+
+def read_employee_arrow(
+    path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Arrow IPC・Featherファイルをpyarrowベースのデータ型のまま読み込む。
+
+    ファイルをメモリマップして読み込むため、圧縮されていないファイルでは
+    列のデータをコピーせず、ファイルの大きさによらず数ミリ秒で開ける
+    （データはチェックで参照されたときにページ単位で読み込まれる）。
+    Arrow IPCファイル（Feather V2）とFeather V1のほか、ストリーム形式にも対応する。
+
+    Args:
+        path: Arrow IPC・Featherファイルのパス
+        columns: 読み込む列（Noneの場合はすべての列）
+
+    Returns:
+        pd.DataFrame: ``pd.ArrowDtype`` の列を持つ社員データ
+    """
+    _require_pyarrow()
+    import pyarrow
+    import pyarrow.ipc
+    from pyarrow import feather
+
+    try:
+        table = feather.read_table(path, columns=columns, memory_map=True)
+    except pyarrow.ArrowInvalid:
+        # Arrow IPCのストリーム形式（Featherとしては読み込めない）
+        with pyarrow.ipc.open_stream(pyarrow.memory_map(str(path))) as reader:
+            table = reader.read_all()
+        if columns is not None:
+            table = table.select(columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def is_columnar_file(path: Union[str, Path]) -> bool:
+    """Parquet・Arrow IPC形式のファイルかどうかを拡張子から判定する。"""
+    suffix = Path(path).suffix.lower()
+    return suffix in PARQUET_SUFFIXES or suffix in ARROW_SUFFIXES
+
+
+def read_employee_file(
+    path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """拡張子に応じてParquetまたはArrow IPCファイルを読み込む。
+
+    Args:
+        path: 読み込むファイルのパス
+        columns: 読み込む列（Noneの場合はすべての列）
+
+    Returns:
+        pd.DataFrame: ``pd.ArrowDtype`` の列を持つ社員データ
+
+    Raises:
+        ValueError: 未対応の拡張子の場合
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return read_employee_parquet(path, columns=columns)
+    if suffix in ARROW_SUFFIXES:
+        return read_employee_arrow(path, columns=columns)
+    raise ValueError(f"未対応のファイル形式です: {path}")
+
+
+def _csv_dtype(column_dtype: Any, nullable: bool) -> Any:
+    """スキーマの列のデータ型から、CSVの読み込み時に指定するデータ型を求める。"""
+    name = str(column_dtype)
+    if name in ("str", "object"):
+        return object
+    if name == "category":
+        return "category"
+    if name.lower().startswith(("int", "uint")):
+        # 欠損値を含む整数列は浮動小数点数として読み込み、スキーマで型変換する
+        # （NULL許容の整数型で読み込むより高速）
+        return "float64" if nullable or name[0].isupper() else "int64"
+    if name.startswith("float"):
+        return "float64"
+    return object
+
+
+def csv_read_options(
+    schema: Optional[Union["DataFrameSchema", FrameStructure]] = None,
+    header: Optional[Sequence[str]] = None,
+    engine: Optional[str] = None,
+) -> Dict[str, Any]:
+    """スキーマから ``pd.read_csv`` の引数を作成する。
+
+    スキーマの列のみを ``usecols`` で読み込み、各列のデータ型を ``dtype`` に
+    指定する。日付列はpyarrowエンジンでは ``dtype`` で読み込み時に変換し、
+    Cエンジンでは読み込み直後にISO 8601形式として一括で変換する。
+
+    Args:
+        schema: 使用するスキーマまたは構造（Noneの場合は社員データの構造
+            ``EMPLOYEE_STRUCTURE``）
+        header: CSVの列名（指定した場合、CSVに存在する列のみを読み込む）
+        engine: 使用するCSVエンジン（Noneの場合はpyarrowがあればpyarrow、
+            なければC）
+
+    Returns:
+        Dict[str, Any]: ``pd.read_csv`` に渡すキーワード引数。日付列は
+            ``date_columns`` キーに含まれるので、渡す前に取り除くこと
+    """
+    schema = schema if schema is not None else EMPLOYEE_STRUCTURE
+    engine = engine or ("pyarrow" if _has_pyarrow() else "c")
+    usecols, dtype, date_columns = [], {}, []
+    for name, column in schema.columns.items():
+        if header is not None and name not in header:
+            continue
+        usecols.append(name)
+        if str(column.dtype).startswith("datetime64"):
+            date_columns.append(name)
+            if engine == "pyarrow":
+                dtype[name] = "datetime64[ns]"
+            else:
+                dtype[name] = object
+        else:
+            dtype[name] = _csv_dtype(column.dtype, column.nullable)
+    return {
+        "engine": engine,
+        "usecols": usecols,
+        "dtype": dtype,
+        "date_columns": date_columns,
+    }
+
+
+def read_employee_csv(
+    path: Union[str, Path],
+    schema: Optional[Union["DataFrameSchema", FrameStructure]] = None,
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    """スキーマのデータ型でCSVファイルを読み込む。
+
+    ``csv_read_options`` で作成した引数で読み込み、日付を含む各列を
+    読み込み時に型変換する。整数列はエンジンによらず浮動小数点数として読み込み、
+    小数部を持つ値や桁あふれした値を切り捨てずに型変換できないセルとする。
+    型変換できないセルがある場合は、列全体をオブジェクト型として読み込む代わりに、
+    該当するセルを失敗ケースとして ``ParserError`` を送出する。CSVに存在しない列は
+    読み込まず、スキーマの検証時に列の欠落として報告される。
+
+    Args:
+        path: 読み込むCSVファイルのパス
+        schema: 使用するスキーマまたは構造（Noneの場合は社員データの構造
+            ``EMPLOYEE_STRUCTURE``）
+        engine: 使用するCSVエンジン（Noneの場合はpyarrowがあればpyarrow、
+            なければC）
+
+    Returns:
+        pd.DataFrame: スキーマのデータ型で読み込んだ社員データ
+
+    Raises:
+        ParserError: 型変換できないセルがある場合。``failure_cases`` 属性に
+            列、チェック、行インデックス、値を持つ失敗ケースの一覧を持つ
+    """
+    schema = schema if schema is not None else EMPLOYEE_STRUCTURE
+    header = pd.read_csv(path, nrows=0).columns
+    options = csv_read_options(schema, header=header, engine=engine)
+    date_columns = options.pop("date_columns")
+    dtype = options.pop("dtype")
+    try:
+        df = pd.read_csv(path, dtype=_read_dtype(dtype), **options)
+    except (ValueError, TypeError) as e:
+        _raise_malformed(path, dtype, date_columns, e)
+    return _convert_csv_frame(df, path, dtype, date_columns)
+
+
+def iter_employee_csv(
+    path: Union[str, Path],
+    chunksize: int,
+    schema: Optional[Union["DataFrameSchema", FrameStructure]] = None,
+) -> Iterator[pd.DataFrame]:
+    """スキーマのデータ型でCSVファイルをチャンク単位で読み込む。
+
+    ``read_employee_csv`` と同じデータ型・日付の変換を各チャンクに適用するため、
+    チャンクを連結した結果はファイル全体を読み込んだ場合と同じになる
+    （pyarrowエンジンはチャンク単位の読み込みに対応しないため、Cエンジンを使用する）。
+
+    Args:
+        path: 読み込むCSVファイルのパス
+        chunksize: 1チャンクあたりの行数
+        schema: 使用するスキーマまたは構造（Noneの場合は社員データの構造
+            ``EMPLOYEE_STRUCTURE``）
+
+    Yields:
+        pd.DataFrame: ファイル全体での行番号をインデックスとするチャンク
+
+    Raises:
+        ParserError: 型変換できないセルがある場合
+    """
+    schema = schema if schema is not None else EMPLOYEE_STRUCTURE
+    header = pd.read_csv(path, nrows=0).columns
+    options = csv_read_options(schema, header=header, engine="c")
+    date_columns = options.pop("date_columns")
+    dtype = options.pop("dtype")
+    reader = pd.read_csv(path, dtype=_read_dtype(dtype), chunksize=chunksize, **options)
+    start = 0
+    while True:
+        try:
+            chunk = next(reader)
+        except StopIteration:
+            return
+        except (ValueError, TypeError) as e:
+            _raise_malformed(path, dtype, date_columns, e, start=start)
+        yield _convert_csv_frame(chunk, path, dtype, date_columns, start=start)
+        start += len(chunk)
+
+
+def _read_dtype(dtype: Dict[str, Any]) -> Dict[str, Any]:
+    """読み込み時のデータ型（整数列は切り捨てを避けるため浮動小数点数）を返す。"""
+    return {
+        name: "float64" if target == "int64" else target
+        for name, target in dtype.items()
+    }
+
+
+def _convert_csv_frame(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    dtype: Dict[str, Any],
+    date_columns: Sequence[str],
+    start: int = 0,
+) -> pd.DataFrame:
+    """読み込んだ列を日付・整数に変換する（変換できないセルはParserError）。"""
+    try:
+        for name in date_columns:
+            if not pd.api.types.is_datetime64_dtype(df[name]):
+                df[name] = pd.to_datetime(df[name], format="ISO8601")
+        inexact = []
+        for name, target in dtype.items():
+            if target != "int64":
+                continue
+            values = df[name].to_numpy(dtype=np.float64)
+            if (np.abs(values) < MAX_EXACT_INTEGER).all() and (values % 1 == 0).all():
+                df[name] = values.astype(np.int64)
+            else:
+                inexact.append(name)
+        if inexact:
+            # NULL値・小数・2**53以上の値を含む列は文字列から正確に変換する
+            raw = _read_raw_rows(path, inexact, start, len(df))
+            for name in inexact:
+                values = pd.to_numeric(raw[name])
+                if values.dtype != np.int64:
+                    raise ValueError(f"列 '{name}' を整数に変換できません")
+                df[name] = values.to_numpy()
+    except (ValueError, TypeError, OverflowError) as e:
+        _raise_malformed(path, dtype, date_columns, e, start=start, nrows=len(df))
+    return df
+
+
+def _read_raw_rows(
+    path: Union[str, Path], columns: List[str], start: int, nrows: Optional[int]
+) -> pd.DataFrame:
+    """指定した行の範囲の列を文字列として読み込む（インデックスはファイルでの行番号）。"""
+    raw = pd.read_csv(
+        path,
+        usecols=columns,
+        dtype=str,
+        skiprows=range(1, start + 1) if start else None,
+        nrows=nrows,
+    )
+    raw.index = raw.index + start
+    return raw
+
+
+def _raise_malformed(
+    path: Union[str, Path],
+    dtype: Dict[str, Any],
+    date_columns: Sequence[str],
+    error: Exception,
+    start: int = 0,
+    nrows: Optional[int] = None,
+) -> None:
+    """型変換できないセルを探して ``ParserError`` を送出する（見つからなければ元の例外）。"""
+    failure_cases = find_malformed_cells(
+        path, dtype, date_columns, nrows=nrows, start=start
+    )
+    if failure_cases.empty:
+        raise error
+    from pandera.errors import ParserError
+
+    raise ParserError(_malformed_message(failure_cases), failure_cases) from error
+
+
+def find_malformed_cells(
+    path: Union[str, Path],
+    dtype: Dict[str, Any],
+    date_columns: Sequence[str],
+    nrows: Optional[int] = None,
+    start: int = 0,
+) -> pd.DataFrame:
+    """CSVファイルを文字列として読み込み、指定したデータ型に変換できないセルを探す。
+
+    整数列では、小数部を持つ値とint64型の範囲を超える値も変換できないセルとする。
+
+    Args:
+        path: 読み込むCSVファイルのパス
+        dtype: 列名と読み込み時のデータ型の対応
+        date_columns: 日付として変換する列
+        nrows: 読み込む行数（Noneの場合はすべての行）
+        start: 読み込みを開始するデータ行の番号
+
+    Returns:
+        pd.DataFrame: 列、チェック、行インデックス、値を持つ失敗ケースの一覧
+    """
+    raw = _read_raw_rows(path, list(dtype), start, nrows)
+    frames = []
+    for name, target in dtype.items():
+        values = raw[name]
+        if name in date_columns:
+            converted = pd.to_datetime(values, format="ISO8601", errors="coerce")
+            check = "dtype('datetime64[ns]')"
+        elif target in ("int64", "float64"):
+            converted = pd.to_numeric(values, errors="coerce")
+            check = f"dtype('{target}')"
+        else:
+            continue
+
+        malformed = values.notna() & converted.isna()
+        if target == "int64":
+            malformed |= values.notna() & (converted % 1 != 0).fillna(False)
+            malformed |= values.notna() & (converted.abs() >= INT64_LIMIT).fillna(False)
+            missing = values.isna()
+            if missing.any():
+                frames.append(_failure_frame(name, "not_nullable", values[missing]))
+        if malformed.any():
+            frames.append(_failure_frame(name, check, values[malformed]))
+
+    if not frames:
+        return pd.DataFrame(columns=FAILURE_CASE_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _failure_frame(column: str, check: str, values: pd.Series) -> pd.DataFrame:
+    """1つの列の失敗ケースの一覧を作成する。"""
+    return pd.DataFrame(
+        {
+            "column": column,
+            "check": check,
+            "index": values.index.to_numpy(dtype=np.int64),
+            "failure_case": values.to_numpy(dtype=object),
+        },
+        columns=FAILURE_CASE_COLUMNS,
+    )
+
+
+def _malformed_message(failure_cases: pd.DataFrame) -> str:
+    """型変換できないセルのエラーメッセージを作成する。"""
+    cells = ", ".join(
+        f"{case.column}[{case.index}]={case.failure_case!r}"
+        for case in failure_cases.head(MAX_REPORTED_CELLS).itertuples(index=False)
+    )
+    return f"{len(failure_cases)}件のセルを型変換できませんでした: {cells}"
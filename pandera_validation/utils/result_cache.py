@@ -0,0 +1,191 @@
+"""データの内容のハッシュをキーとして検証結果を再利用する結果キャッシュ。"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import pandas as pd
+
+from pandera_validation.schemas.columns import EMPLOYEE_SCHEMA_HASH, SCHEMA_VERSION
+from pandera_validation.utils.errors import ValidationErrorReport
+
+# キャッシュする検証結果（検証結果のブール値、エラーメッセージ、サマリー）
+CachedResult = Tuple[bool, Optional[str], Optional[Dict[str, Any]]]
+
+# メモリ上に保持する検証結果のデフォルトの件数
+DEFAULT_MAXSIZE = 128
+
+# ファイルのハッシュを求めるときに一度に読み込むバイト数
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """データフレームの内容のハッシュを求める。
+
+    列ごとに ``pd.util.hash_pandas_object`` で各行のハッシュ値を求め、
+    列名・データ型・インデックスと合わせて1つのダイジェストにまとめる。
+
+    Args:
+        df: ハッシュを求めるデータフレーム
+
+    Returns:
+        str: 16進数のハッシュ文字列
+
+    Raises:
+        TypeError: リストなどハッシュ化できない値を持つ列がある場合
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(df)).encode())
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for name in df.columns:
+        series = df[name]
+        digest.update(f"{name}\0{series.dtype}\0".encode())
+        digest.update(
+            pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes()
+        )
+    return digest.hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """ファイルの内容のハッシュを求める。
+
+    Args:
+        path: ハッシュを求めるファイルのパス
+
+    Returns:
+        str: 16進数のハッシュ文字列
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def make_cache_key(content_hash: str, **options: Any) -> str:
+    """内容のハッシュ、スキーマのバージョンとハッシュ、検証オプションからキーを作成する。
+
+    スキーマの定義を変更するとハッシュが変わるため、バージョンを更新し忘れた場合も
+    変更前の検証結果は再利用されない。
+
+    Args:
+        content_hash: データフレームまたはファイルの内容のハッシュ
+        **options: 検証結果に影響する検証オプション
+
+    Returns:
+        str: キャッシュのキー
+    """
+    params = ",".join(f"{name}={options[name]!r}" for name in sorted(options))
+    return f"v{SCHEMA_VERSION}:{EMPLOYEE_SCHEMA_HASH}:{content_hash}:{params}"
+
+
+class ValidationResultCache:
+    """検証結果をLRU方式でメモリに保持し、任意でSQLiteファイルに保存するキャッシュ。
+
+    検証済みデータフレームは保持せず、検証結果のブール値、エラーメッセージ、
+    サマリーのみを保持する。``path`` を指定した場合、保存した結果は
+    プロセスをまたいで再利用できる。複数スレッドから安全に使用できる。
+
+    Args:
+        maxsize: メモリ上に保持する検証結果の最大件数
+        path: 検証結果を保存するSQLiteファイルのパス（Noneの場合はメモリのみ）
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_MAXSIZE, path: Optional[Union[str, Path]] = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(str(path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS validation_results ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """キーに対応する検証結果を返す（存在しない場合はNone）。"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            elif self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT result FROM validation_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    payload = row[0]
+                    self._remember(key, payload)
+
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        success, error_msg, summary = json.loads(payload)
+        if isinstance(error_msg, dict):
+            error_msg = ValidationErrorReport.from_dict(error_msg)
+        return success, error_msg, summary
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """検証結果を保存する。
+
+        エラーメッセージが ``ValidationErrorReport`` の場合は各属性と先頭の
+        失敗ケースを保存し、``get`` で同じ文字列・属性のエラーとして復元する。
+        """
+        success, error_msg, summary = result
+        if isinstance(error_msg, ValidationErrorReport):
+            error_msg = error_msg.to_dict()
+        payload = json.dumps(
+            [success, error_msg, summary], ensure_ascii=False, default=_to_json
+        )
+        with self._lock:
+            self._remember(key, payload)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO validation_results (key, result) "
+                    "VALUES (?, ?)",
+                    (key, payload),
+                )
+                self._connection.commit()
+
+    def clear(self) -> None:
+        """保持しているすべての検証結果を破棄する。"""
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM validation_results")
+                self._connection.commit()
+
+    def close(self) -> None:
+        """SQLiteファイルとの接続を閉じる。"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, payload: str) -> None:
+        """メモリ上に検証結果を追加し、最大件数を超えた古い結果を破棄する。"""
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _to_json(value: Any) -> Any:
+    """JSONに変換できない値（NumPyのスカラーなど）を変換する。"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
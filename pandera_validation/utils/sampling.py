@@ -0,0 +1,371 @@
+"""大規模な入力の一部の行だけを検証し、失敗率を信頼区間付きで推定する標本検証。"""
+
+import logging
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandera import DataFrameSchema
+from pandera.errors import ParserError
+
+from pandera_validation.schemas.employee import (
+    MAX_HIERARCHY_DEPTH,
+    MIN_MANAGER_SCORE,
+    ROW_LEVEL_CHECKS,
+)
+from pandera_validation.schemas.hierarchy import ManagerHierarchy
+from pandera_validation.utils.lazy import validate_employee_data_lazy
+from pandera_validation.utils.validation import ValidationResult, get_schema_for
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 標本の抽出方法
+SAMPLING_METHODS = ("head", "tail", "random", "stratified")
+
+# 標本からは判定できない行をまたぐルールと、その理由
+UNDECIDABLE_RULES = {
+    "unique(employee_id)": "標本外の行との重複は検出できません",
+    "manager_exists": "上司として参照される社員が標本に含まれるとは限りません",
+    "no_manager_cycle": "循環をたどる社員がすべて標本に含まれるとは限りません",
+    "hierarchy_depth": "上位の上司が標本に含まれるとは限りません",
+    "department_avg_salary": "部署平均給与は全行の給与から求める必要があります",
+    "manager_min_score": "上司として参照される社員が標本に含まれるとは限りません",
+}
+
+
+@dataclass
+class SamplingOptions:
+    """標本検証の設定。
+
+    Attributes:
+        method: 抽出方法（head, tail, random, stratified）。stratifiedは部署ごとの
+            行数に比例して各部署から無作為に抽出する
+        size: 標本の行数
+        confidence: 信頼区間の信頼水準
+        seed: 無作為抽出の乱数シード
+    """
+
+    method: str = "random"
+    size: int = 10_000
+    confidence: float = 0.95
+    seed: int = 0
+
+
+def draw_sample(df: pd.DataFrame, options: SamplingOptions) -> pd.DataFrame:
+    """設定に従ってデータフレームから標本を抽出する。
+
+    Args:
+        df: 抽出元の社員データのデータフレーム
+        options: 標本検証の設定
+
+    Returns:
+        pd.DataFrame: 抽出した行（元のインデックスを保持する）
+
+    Raises:
+        ValueError: 未対応の抽出方法を指定した場合
+    """
+    codes = _department_codes(df) if options.method == "stratified" else None
+    return df.iloc[_sample_positions(len(df), options, codes)]
+
+
+def _department_codes(df: pd.DataFrame) -> np.ndarray:
+    """層化抽出の層となる部署のコード（NULLも1つの層とする）を求める。"""
+    codes, _ = pd.factorize(df["department"], use_na_sentinel=False)
+    return codes
+
+
+def _sample_positions(
+    n_rows: int, options: SamplingOptions, codes: Optional[np.ndarray]
+) -> np.ndarray:
+    """標本とする行の位置を昇順で返す。"""
+    if options.method not in SAMPLING_METHODS:
+        raise ValueError(f"未対応の抽出方法です: {options.method}")
+    size = min(options.size, n_rows)
+    if options.method == "head":
+        return np.arange(size)
+    if options.method == "tail":
+        return np.arange(n_rows - size, n_rows)
+
+    rng = np.random.default_rng(options.seed)
+    if options.method == "random":
+        positions = rng.choice(n_rows, size=size, replace=False)
+    else:
+        positions = _stratified_positions(codes, size, rng)
+    return np.sort(positions)
+
+
+def _stratified_positions(
+    codes: np.ndarray, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """部署ごとの行数に比例して、各部署から少なくとも1行を無作為に抽出する。
+
+    丸めと各部署の最低1行により割り当ての合計が ``size`` を超える場合は、
+    割り当ての多い部署から1行ずつ減らす。
+    """
+    counts = np.bincount(codes)
+    allocation = np.minimum(
+        counts, np.maximum(1, np.round(size * counts / counts.sum()).astype(int))
+    )
+    for _ in range(allocation.sum() - size):
+        allocation[np.argmax(allocation)] -= 1
+    order = np.argsort(codes, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    return np.concatenate(
+        [
+            order[start + rng.choice(count, size=n, replace=False)]
+            for start, count, n in zip(starts, counts, allocation)
+        ]
+    )
+
+
+def _wilson_interval(failures: int, n: int, z: float) -> Tuple[float, float]:
+    """二項比率のWilsonスコア信頼区間を求める。"""
+    if n == 0:
+        return 0.0, 1.0
+    p = failures / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    # 失敗が0件・全件の場合は丸め誤差を除いて区間の端を0・1とする
+    low = 0.0 if failures == 0 else max(0.0, center - half)
+    high = 1.0 if failures == n else min(1.0, center + half)
+    return low, high
+
+
+def _stratified_interval(
+    failed: np.ndarray,
+    codes: np.ndarray,
+    population_counts: np.ndarray,
+    z: float,
+) -> Tuple[float, float, float]:
+    """層化抽出の失敗率の推定値と正規近似の信頼区間を求める。"""
+    n_strata = len(population_counts)
+    sample_counts = np.bincount(codes, minlength=n_strata)
+    failures = np.bincount(codes, weights=failed, minlength=n_strata)
+    weights = population_counts / population_counts.sum()
+    sampled = sample_counts > 0
+    p_h = np.zeros(n_strata)
+    p_h[sampled] = failures[sampled] / sample_counts[sampled]
+    estimate = float((weights * p_h).sum())
+    # 有限母集団修正を含む層ごとの分散
+    fpc = np.ones(n_strata)
+    fpc[sampled] = 1 - sample_counts[sampled] / population_counts[sampled]
+    variance = np.zeros(n_strata)
+    variance[sampled] = (
+        weights[sampled] ** 2
+        * p_h[sampled]
+        * (1 - p_h[sampled])
+        / sample_counts[sampled]
+        * fpc[sampled]
+    )
+    half = z * math.sqrt(variance.sum())
+    return estimate, max(0.0, estimate - half), min(1.0, estimate + half)
+
+
+def validate_employee_sample(
+    df: pd.DataFrame, options: Optional[SamplingOptions] = None
+) -> ValidationResult:
+    """社員データの標本だけを検証し、チェックごとの失敗率を推定する。
+
+    標本を行単位のスキーマ（列チェックと行ごとに評価できるデータフレームレベルの
+    チェック）で遅延検証し、チェックごとの失敗率と信頼区間を求める。
+    random・stratifiedの標本では信頼区間は母集団の失敗率の推定となるが、
+    head・tailの標本は無作為ではないため、信頼区間は参考値となる。
+    行をまたぐルールは標本から違反が確定した場合のみ失敗とし、
+    それ以外は判定できなかったルールとしてサマリーに記録する。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+        options: 標本検証の設定（Noneの場合は10000行の無作為抽出）
+
+    Returns:
+        ValidationResult: ``validate_employee_data`` と同じ形式のタプル。
+            検証済みデータフレームは常にNone。サマリーの値は標本の有効な行から
+            求めた推定値で、``sampling`` キーに失敗率の推定と判定できなかった
+            ルールを持つ
+
+    Raises:
+        ValueError: 信頼水準が0より大きく1未満でない場合、
+            または未対応の抽出方法を指定した場合
+    """
+    options = options if options is not None else SamplingOptions()
+    if not 0 < options.confidence < 1:
+        raise ValueError(
+            f"信頼水準は0より大きく1未満である必要があります: {options.confidence}"
+        )
+    codes = _department_codes(df) if options.method == "stratified" else None
+    positions = _sample_positions(len(df), options, codes)
+    sample = df.iloc[positions]
+    schema = get_schema_for(df, row_level=True)
+    result = validate_employee_data_lazy(sample, schema=schema)
+
+    estimator = _RateEstimator(
+        population_size=len(df),
+        z=NormalDist().inv_cdf((1 + options.confidence) / 2),
+        strata=None if codes is None else (codes[positions], np.bincount(codes)),
+    )
+    checks = _estimate_failure_rates(sample, result.failure_cases, estimator)
+    failed_rules, undecided_rules = _frame_rules(
+        _typed_sample(schema, sample, result.failure_cases)
+    )
+    invalid_rows = sample.index.isin(result.invalid_df.index)
+
+    sampling = {
+        "method": options.method,
+        "sample_size": len(sample),
+        "population_size": len(df),
+        "confidence": options.confidence,
+        "representative": options.method in ("random", "stratified"),
+        "invalid_rows": int(invalid_rows.sum()),
+        "invalid_row_rate": estimator.estimate(invalid_rows),
+        "checks": checks,
+        "failed_rules": failed_rules,
+        "undecided_rules": undecided_rules,
+    }
+    logger.info(
+        f"標本検証: {len(sample)}/{len(df)}行中{sampling['invalid_rows']}行が失敗、"
+        f"判定できなかったルール: {', '.join(r['rule'] for r in undecided_rules)}"
+    )
+
+    summary = result.summary or {}
+    summary["sampling"] = sampling
+    if checks or failed_rules:
+        messages = [
+            f"{c['column']} {c['check']}: 推定失敗率 {c['rate']:.2%}"
+            f"（{options.confidence:.0%}信頼区間 "
+            f"{c['ci_low']:.2%}〜{c['ci_high']:.2%}）"
+            for c in checks
+        ]
+        messages += [f"{r['rule']}: {r['reason']}" for r in failed_rules]
+        error_msg = "\n".join(messages)
+        logger.error(f"バリデーションエラー（標本）: {error_msg}")
+        return False, None, error_msg, summary
+    return True, None, None, summary
+
+
+@dataclass
+class _RateEstimator:
+    """標本の失敗した行のマスクから母集団の失敗率と信頼区間を推定する。
+
+    Attributes:
+        population_size: 母集団の行数
+        z: 信頼水準に対応する標準正規分布の分位点
+        strata: 層化抽出の場合、標本の各行の層のコードと層ごとの母集団の行数
+    """
+
+    population_size: int
+    z: float
+    strata: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def estimate(self, failed: np.ndarray) -> Dict[str, float]:
+        """失敗率の推定値と信頼区間を求める。"""
+        if self.strata is not None:
+            codes, population_counts = self.strata
+            rate, low, high = _stratified_interval(
+                failed.astype(np.float64), codes, population_counts, self.z
+            )
+        else:
+            n = len(failed)
+            failures = int(failed.sum())
+            rate = failures / n if n else 0.0
+            if n == self.population_size:
+                low, high = rate, rate
+            else:
+                low, high = _wilson_interval(failures, n, self.z)
+        return {"rate": rate, "ci_low": low, "ci_high": high}
+
+
+def _estimate_failure_rates(
+    sample: pd.DataFrame, failure_cases: pd.DataFrame, estimator: _RateEstimator
+) -> List[Dict[str, Any]]:
+    """チェックごとの失敗件数から失敗率の推定値と信頼区間を求める。"""
+    checks = []
+    for (column, check), cases in failure_cases.groupby(
+        ["column", "check"], sort=False, dropna=False
+    ):
+        index = cases["index"]
+        if index.isna().any():
+            failed = np.ones(len(sample), dtype=bool)
+        else:
+            failed = sample.index.isin(index)
+        checks.append(
+            {
+                "column": None if pd.isna(column) else column,
+                "check": check,
+                "failures": int(failed.sum()),
+                **estimator.estimate(failed),
+            }
+        )
+    return checks
+
+
+def _typed_sample(
+    schema: DataFrameSchema, sample: pd.DataFrame, failure_cases: pd.DataFrame
+) -> pd.DataFrame:
+    """行をまたぐルールの判定用に、標本をスキーマのデータ型に変換する。
+
+    型変換できない（または変換で値が変わる）セルを持つ行は除き、残りの行を変換する。
+    それでも変換できない列は除くため、その列を使うルールは判定できないルールとなる。
+    """
+    is_dtype = failure_cases["check"].astype(str).str.startswith("dtype(")
+    typed = sample[~sample.index.isin(failure_cases.loc[is_dtype, "index"].dropna())]
+    typed = typed.copy()
+    for name, column in schema.columns.items():
+        if name not in typed or column.dtype is None:
+            continue
+        try:
+            typed[name] = column.dtype.try_coerce(typed[name])
+        except (ParserError, TypeError, ValueError):
+            typed = typed.drop(columns=name)
+    return typed
+
+
+def _frame_rules(
+    sample: pd.DataFrame,
+) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """行をまたぐルールを、標本から違反が確定したものと判定できないものに分ける。"""
+    failed, undecided = [], []
+    for rule, reason in UNDECIDABLE_RULES.items():
+        if rule in ROW_LEVEL_CHECKS:
+            continue
+        violation = _sample_violation(sample, rule)
+        if violation:
+            failed.append({"rule": rule, "reason": violation})
+        else:
+            undecided.append({"rule": rule, "reason": reason})
+    return failed, undecided
+
+
+def _sample_violation(sample: pd.DataFrame, rule: str) -> Optional[str]:
+    """標本の行だけで違反が確定する場合、その内容を返す。"""
+    if rule == "unique(employee_id)" and "employee_id" in sample:
+        duplicated = sample["employee_id"].duplicated()
+        if duplicated.any():
+            return f"標本内で社員IDが{int(duplicated.sum())}件重複しています"
+    if rule in ("no_manager_cycle", "hierarchy_depth") and {
+        "employee_id",
+        "manager_id",
+    } <= set(sample):
+        # 標本内だけでたどれる循環・深さの超過は、母集団でも違反となる
+        hierarchy = ManagerHierarchy.from_frame(sample)
+        if rule == "no_manager_cycle" and hierarchy.in_cycle.any():
+            return (
+                f"標本内の{int(hierarchy.in_cycle.sum())}名が管理階層の循環に含まれます"
+            )
+        deep = hierarchy.depth > MAX_HIERARCHY_DEPTH
+        if rule == "hierarchy_depth" and deep.any():
+            return f"標本内の{int(deep.sum())}名の管理階層の深さが上限を超えています"
+    if rule == "manager_min_score" and {
+        "employee_id",
+        "manager_id",
+        "performance_score",
+    } <= set(sample):
+        is_manager = sample["employee_id"].isin(sample["manager_id"].dropna())
+        low = is_manager & (sample["performance_score"] < MIN_MANAGER_SCORE)
+        if low.any():
+            return f"標本内の管理職{int(low.sum())}名の評価スコアが基準未満です"
+    return None
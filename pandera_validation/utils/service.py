@@ -0,0 +1,483 @@
+"""小さな検証リクエストをまとめて検証するasyncioベースのHTTP/JSONサービス。
+
+同時に届いたリクエストをマイクロバッチにまとめ、1つのデータフレームとして
+キャッシュ済みの行単位スキーマで検証してから、リクエストごとの結果に分配する。
+行をまたぐルール（社員IDの一意性、管理階層、部署平均給与、管理職の評価スコア）は
+リクエストごとに評価するため、各リクエストの結果は ``validate_employee_data``
+を個別に呼び出した場合と同じになる。
+
+エンドポイント:
+    POST /validate: 社員レコードのリスト（または ``{"records": [...]}``）を検証する
+    GET /health: サービスの状態とバッチの統計を返す
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandera_validation.schemas.employee import (
+    MAX_HIERARCHY_DEPTH,
+    MIN_DEPARTMENT_AVG_SALARY,
+    MIN_MANAGER_SCORE,
+    department_codes,
+)
+from pandera_validation.schemas.hierarchy import ManagerHierarchy
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.lazy import validate_employee_data_lazy
+from pandera_validation.utils.result_cache import _to_json
+from pandera_validation.utils.validation import (
+    build_summary,
+    get_employee_schema,
+    validate_employee_data,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 1つのマイクロバッチにまとめるリクエストのデフォルトの最大件数
+DEFAULT_MAX_BATCH_SIZE = 64
+
+# 最初のリクエストが届いてから後続のリクエストを待つデフォルトの最大時間（秒）
+DEFAULT_MAX_WAIT = 0.002
+
+# リクエストボディの最大サイズ（バイト）
+MAX_BODY_BYTES = 16 << 20
+
+# HTTPステータスコードと理由句
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+def records_to_frame(records: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """JSONの社員レコードのリストをデータフレームに変換する。
+
+    入社日はISO 8601形式の文字列として日付に変換し、変換できない値はNULLとする
+    （スキーマの検証でNULL値のエラーとして報告される）。
+
+    Args:
+        records: 列名と値の辞書のリスト
+
+    Returns:
+        pd.DataFrame: 社員データのデータフレーム
+    """
+    df = pd.DataFrame.from_records(records)
+    if "join_date" in df.columns:
+        df["join_date"] = pd.to_datetime(
+            df["join_date"], format="ISO8601", errors="coerce"
+        )
+    return df
+
+
+def _result_payload(
+    success: bool, error_msg: Optional[str], summary: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """リクエストごとの検証結果をJSONで返す形式に変換する。"""
+    return {"success": success, "error": error_msg, "summary": summary}
+
+
+def validate_batch(
+    payloads: Sequence[Sequence[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """複数のリクエストのレコードを1つのデータフレームとしてまとめて検証する。
+
+    データ型はまとめた列の値全体から推論されるため、列ごとの値の型の組み合わせが
+    同じリクエストごとにまとめる（個別に変換した場合と同じデータ型になる）。
+    まとめたデータフレームを行単位のスキーマで1回だけ検証し、行をまたぐルールは
+    リクエストの番号をキーとした集計でリクエストごとに評価する。
+    いずれかのチェックに失敗したリクエストだけを ``validate_employee_data`` で
+    個別に検証し直し、個別に呼び出した場合と同じエラーメッセージを返す。
+
+    Args:
+        payloads: リクエストごとの社員レコードのリスト
+
+    Returns:
+        List[Dict[str, Any]]: リクエストと同じ順序の検証結果
+            （``success``、``error``、``summary`` キーを持つ辞書）
+    """
+    groups: Dict[Tuple, List[int]] = {}
+    for i, records in enumerate(payloads):
+        groups.setdefault(_type_signature(records), []).append(i)
+
+    results: List[Dict[str, Any]] = [{}] * len(payloads)
+    for members in groups.values():
+        group = _validate_group([payloads[i] for i in members])
+        for i, result in zip(members, group):
+            results[i] = result
+    return results
+
+
+def _type_signature(records: Sequence[Dict[str, Any]]) -> Tuple:
+    """列名と、その列の値の型の集合の組（データ型の推論結果を決める）を返す。"""
+    names = sorted({name for record in records for name in record})
+    return tuple(
+        (name, frozenset(type(record.get(name)) for record in records))
+        for name in names
+    )
+
+
+def _validate_group(
+    payloads: Sequence[Sequence[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """値の型の組み合わせが同じリクエストをまとめて検証する。"""
+    if len(payloads) == 1:
+        # 1件だけの場合はまとめずに個別に検証する
+        success, _, error_msg, summary = validate_employee_data(
+            records_to_frame(payloads[0])
+        )
+        return [_result_payload(success, error_msg, summary)]
+
+    sizes = np.array([len(records) for records in payloads], dtype=np.int64)
+    failed = sizes == 0
+    validated = pd.DataFrame()
+    requests = np.repeat(np.arange(len(payloads)), sizes)
+    if len(requests) > 0:
+        batch = records_to_frame([record for records in payloads for record in records])
+        validated, invalid_rows = _validate_rows(batch)
+        failed[requests[invalid_rows]] = True
+
+        # 行単位のチェックを通過したリクエストについて行をまたぐルールを評価する
+        passed = ~failed[requests]
+        validated, requests = validated[passed[~invalid_rows]], requests[passed]
+        failed |= _failed_frame_rules(validated, requests, len(payloads))
+
+    results = []
+    offsets = np.searchsorted(requests, np.arange(len(payloads) + 1))
+    for i, records in enumerate(payloads):
+        if failed[i]:
+            success, _, error_msg, summary = validate_employee_data(
+                records_to_frame(records)
+            )
+            results.append(_result_payload(success, error_msg, summary))
+        else:
+            summary = build_summary(validated.iloc[offsets[i] : offsets[i + 1]])
+            results.append(_result_payload(True, None, summary))
+    return results
+
+
+def _validate_rows(batch: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+    """まとめたデータフレームを行単位のスキーマで検証する。
+
+    Returns:
+        Tuple[pd.DataFrame, np.ndarray]: 失敗ケースに該当しない行の検証済みデータと、
+            失敗ケースに該当する行のマスク
+    """
+    schema = get_employee_schema(row_level=True)
+    try:
+        return compile_schema(schema).validate(batch), np.zeros(len(batch), dtype=bool)
+    except pa.errors.SchemaError:
+        pass
+    # 失敗した場合のみ遅延検証で原因の行を特定する
+    result = validate_employee_data_lazy(batch, schema=schema)
+    if result.failure_cases["check"].astype(str).str.startswith("dtype(").any():
+        # 値の型の組み合わせが同じリクエストは個別に検証しても同じデータ型となり、
+        # 型変換で値が変わらない行も含めてすべてデータ型のチェックに失敗する
+        return batch.iloc[0:0], np.ones(len(batch), dtype=bool)
+    return result.valid_df, batch.index.isin(result.invalid_df.index)
+
+
+def _failed_frame_rules(
+    df: pd.DataFrame, requests: np.ndarray, n_requests: int
+) -> np.ndarray:
+    """行をまたぐルールをリクエストごとに評価し、違反したリクエストのマスクを返す。"""
+    # 社員IDの一意性（同じリクエスト内の重複のみを違反とする）
+    keys = pd.DataFrame({"request": requests, "employee_id": df["employee_id"].values})
+    failed = np.zeros(n_requests, dtype=bool)
+    failed[requests[keys.duplicated(keep=False).to_numpy()]] = True
+
+    # 部署平均給与（リクエストと部署の組ごとの平均）
+    codes, departments = department_codes(df["department"])
+    groups = requests * len(departments) + codes
+    counts = np.bincount(groups, minlength=n_requests * len(departments))
+    totals = np.bincount(
+        groups,
+        weights=df["salary"].to_numpy(dtype=np.float64),
+        minlength=n_requests * len(departments),
+    )
+    low = (counts > 0) & (totals < MIN_DEPARTMENT_AVG_SALARY * counts)
+    failed |= low.reshape(n_requests, -1).any(axis=1)
+
+    # 管理階層（同じリクエスト内の社員IDのみを上司として参照する）
+    hierarchy = ManagerHierarchy.from_frame(df, groups=requests)
+    invalid = (
+        hierarchy.missing | hierarchy.in_cycle | hierarchy.too_deep(MAX_HIERARCHY_DEPTH)
+    )
+    failed |= np.bincount(requests[invalid], minlength=n_requests) > 0
+
+    # 管理職の評価スコア（同じリクエスト内で上司として参照された社員が対象。
+    # スキーマのチェックと同様、管理職が1人もいない場合も違反とする）
+    is_manager = hierarchy.referenced
+    low_score = is_manager & (df["performance_score"].to_numpy() < MIN_MANAGER_SCORE)
+    failed |= np.bincount(requests[is_manager], minlength=n_requests) == 0
+    failed |= np.bincount(requests[low_score], minlength=n_requests) > 0
+    return failed
+
+
+@dataclass
+class _PendingRequest:
+    """マイクロバッチへの追加を待つリクエスト。"""
+
+    records: List[Dict[str, Any]]
+    future: "asyncio.Future[Dict[str, Any]]"
+
+
+class MicroBatcher:
+    """同時に届いた検証リクエストをマイクロバッチにまとめて検証する。
+
+    最初のリクエストが届いてから ``max_wait`` 秒の間、または ``max_batch_size``
+    件に達するまで後続のリクエストを待ち、まとめて ``validate_batch`` で検証する。
+    検証はイベントループを止めないよう別スレッドで実行し、その間に届いた
+    リクエストは次のバッチにまとめられる。
+
+    Args:
+        max_batch_size: 1つのバッチにまとめるリクエストの最大件数
+        max_wait: 後続のリクエストを待つ最大時間（秒）
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self.batch_count = 0
+        self.request_count = 0
+        self._queue: "asyncio.Queue[_PendingRequest]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """バッチを処理するタスクを開始する。"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """バッチを処理するタスクを停止する。"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """リクエストをバッチに追加し、検証結果を待つ。
+
+        Args:
+            records: 検証する社員レコードのリスト
+
+        Returns:
+            Dict[str, Any]: ``success``、``error``、``summary`` キーを持つ検証結果
+        """
+        await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(records, future))
+        return await future
+
+    async def _run(self) -> None:
+        """キューからリクエストを取り出してバッチごとに検証する。"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+
+            self.batch_count += 1
+            self.request_count += len(batch)
+            try:
+                results = await loop.run_in_executor(
+                    None, validate_batch, [pending.records for pending in batch]
+                )
+            except Exception as e:
+                logger.error(
+                    f"バッチの検証中にエラーが発生しました: {e}", exc_info=True
+                )
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+            for pending, result in zip(batch, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+
+
+class ValidationService:
+    """マイクロバッチで社員データを検証するHTTP/JSONサービス。
+
+    標準ライブラリの ``asyncio.start_server`` で、Keep-Aliveに対応した
+    最小限のHTTP/1.1を処理する。
+
+    Args:
+        host: 待ち受けるホスト
+        port: 待ち受けるポート（0の場合は空いているポートを使用する）
+        max_batch_size: 1つのバッチにまとめるリクエストの最大件数
+        max_wait: 後続のリクエストを待つ最大時間（秒）
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(max_batch_size=max_batch_size, max_wait=max_wait)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """サービスを開始する（``port=0`` の場合は割り当てられたポートを設定する）。"""
+        # 最初のリクエストでスキーマを構築しないよう、事前に取得しておく
+        get_employee_schema()
+        get_employee_schema(row_level=True)
+        await self.batcher.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"検証サービスを開始しました: http://{self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """サービスを停止する。"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        """サービスを開始し、停止されるまで待ち受ける。"""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """1つの接続でリクエストを順に処理する。"""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError as e:
+                    # 次のリクエストの境界が分からないため、応答して接続を閉じる
+                    _write_response(writer, 400, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                # 大きすぎるボディは途中までしか読み込んでいないため、接続を閉じる
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close" and status != 413
+                )
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes
+    ) -> Tuple[int, Dict[str, Any]]:
+        """リクエストを処理し、ステータスコードとレスポンスを返す。"""
+        if path == "/health":
+            return 200, {
+                "status": "ok",
+                "batches": self.batcher.batch_count,
+                "requests": self.batcher.request_count,
+            }
+        if path != "/validate":
+            return 404, {"error": f"見つかりません: {path}"}
+        if method != "POST":
+            return 405, {"error": "POSTメソッドを使用してください"}
+        if len(body) > MAX_BODY_BYTES:
+            return 413, {"error": "リクエストボディが大きすぎます"}
+
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            return 400, {"error": f"JSONを解析できません: {e}"}
+        records = data.get("records") if isinstance(data, dict) else data
+        if not isinstance(records, list) or not all(
+            isinstance(record, dict) for record in records
+        ):
+            return 400, {"error": "社員レコードのリストを指定してください"}
+        return 200, await self.batcher.submit(records)
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """HTTPリクエストを1件読み込む（接続が閉じられた場合はNone）。
+
+    ボディは ``MAX_BODY_BYTES`` を1バイト超えるところまでしか読み込まない。
+
+    Raises:
+        ValueError: リクエスト行または ``Content-Length`` ヘッダーが不正な場合
+    """
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    parts = request_line.decode("latin-1").split(" ", 2)
+    if len(parts) != 3:
+        raise ValueError(f"不正なリクエスト行です: {request_line.strip()!r}")
+    method, path, _ = parts
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    content_length = headers.get("content-length", "0")
+    if not (content_length.isascii() and content_length.isdigit()):
+        raise ValueError(f"不正なContent-Lengthです: {content_length!r}")
+    length = min(int(content_length), MAX_BODY_BYTES + 1)
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def _write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    payload: Dict[str, Any],
+    keep_alive: bool,
+) -> None:
+    """JSONのHTTPレスポンスを書き込む。"""
+    body = json.dumps(payload, ensure_ascii=False, default=_to_json).encode()
+    head = (
+        f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
@@ -0,0 +1,121 @@
+"""CSV・Parquetの社員データを一度だけ変換し、メモリマップで開く列指向キャッシュ。
+
+同じスナップショットを複数のスキーマで繰り返し検証する場合、CSVを読み込むたびに
+解析とメモリの確保が発生する。``load_employee_snapshot`` は初回に読み込んだデータを
+非圧縮のArrow IPCファイルに保存し、以降はそのファイルをメモリマップして
+``pd.ArrowDtype`` の列としてコピーせずに開くため、検証ではチェックの実行時間のみが
+かかる。キャッシュには元のファイルの大きさと更新時刻を記録し、元のファイルが
+変更された場合は作り直す。
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from pandera_validation.utils.readers import (
+    _require_pyarrow,
+    is_columnar_file,
+    read_employee_arrow,
+    read_employee_csv,
+    read_employee_file,
+)
+
+# 元のファイルの情報を記録するArrowスキーマのメタデータのキー
+SOURCE_METADATA_KEY = b"pandera_validation.source"
+
+
+def _source_info(source: Union[str, Path]) -> bytes:
+    """元のファイルの大きさと更新時刻を記録用の文字列にする。"""
+    stat = os.stat(source)
+    return json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}).encode()
+
+
+def default_snapshot_path(source: Union[str, Path]) -> Path:
+    """元のファイルに対応するキャッシュのパス（``employees.csv.arrow`` など）を返す。"""
+    source = Path(source)
+    return source.with_name(f"{source.name}.arrow")
+
+
+def write_employee_snapshot(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    source: Optional[Union[str, Path]] = None,
+) -> None:
+    """社員データを非圧縮のArrow IPCファイルに保存する。
+
+    書き込み途中のファイルが残らないよう、一時ファイルに書き出してから置き換える。
+
+    Args:
+        df: 保存する社員データ
+        path: 保存先のファイルパス
+        source: 変換元のファイル（指定した場合は大きさと更新時刻を記録する）
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    from pyarrow import feather
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if source is not None:
+        metadata = dict(table.schema.metadata or {})
+        metadata[SOURCE_METADATA_KEY] = _source_info(source)
+        table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def is_snapshot_current(source: Union[str, Path], path: Union[str, Path]) -> bool:
+    """キャッシュが存在し、元のファイルから変更されていないかどうかを判定する。
+
+    Args:
+        source: 変換元のファイル
+        path: キャッシュのファイルパス
+
+    Returns:
+        bool: キャッシュに記録した元のファイルの大きさと更新時刻が一致する場合True
+    """
+    if not os.path.exists(path):
+        return False
+    _require_pyarrow()
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(str(path)) as f:
+            schema = pa.ipc.open_file(f).schema
+    except pa.ArrowInvalid:
+        return False
+    recorded = (schema.metadata or {}).get(SOURCE_METADATA_KEY)
+    return recorded == _source_info(source)
+
+
+def load_employee_snapshot(
+    source: Union[str, Path], path: Optional[Union[str, Path]] = None
+) -> pd.DataFrame:
+    """列指向キャッシュを使って社員データを読み込む。
+
+    キャッシュがないか元のファイルが変更されている場合は、元のファイルを
+    読み込んでキャッシュを作成する。初回も作成したキャッシュから読み込むため、
+    何回目の実行でも同じデータ型（``pd.ArrowDtype``）のデータフレームになる。
+
+    Args:
+        source: 変換元のCSV・Parquetファイル
+        path: キャッシュのファイルパス（Noneの場合は ``default_snapshot_path``）
+
+    Returns:
+        pd.DataFrame: メモリマップしたキャッシュの ``pd.ArrowDtype`` の列を持つ社員データ
+
+    Raises:
+        ParserError: CSVに型変換できないセルがある場合
+    """
+    path = default_snapshot_path(source) if path is None else path
+    if not is_snapshot_current(source, path):
+        if is_columnar_file(source):
+            df = read_employee_file(source)
+        else:
+            df = read_employee_csv(source)
+        write_employee_snapshot(df, path, source=source)
+    return read_employee_arrow(path)
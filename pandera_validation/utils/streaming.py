@@ -0,0 +1,92 @@
+"""CSVファイルをチャンク単位で読み込みながら検証するストリーミング検証。"""
+
+import logging
+from pathlib import Path
+from typing import Union
+
+import pandera as pa
+
+from pandera_validation.utils.aggregates import FrameAggregates
+from pandera_validation.utils.errors import ValidationErrorReport
+from pandera_validation.utils.fused import compile_schema
+from pandera_validation.utils.preflight import preflight_check
+from pandera_validation.utils.readers import iter_employee_csv
+from pandera_validation.utils.validation import (
+    ValidationResult,
+    _handle_exception,
+    _schema_hash,
+    get_employee_schema,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# デフォルトのチャンクサイズ（行数）
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def validate_employee_csv(
+    path: Union[str, Path], chunksize: int = DEFAULT_CHUNKSIZE
+) -> ValidationResult:
+    """社員データのCSVファイルをチャンク単位で検証する。
+
+    最初にヘッダーと先頭の行で列名とデータ型を確認し（``preflight_check``）、
+    構造が壊れている場合はファイル全体を読み込まずに失敗を返す。
+    各チャンクを行単位のスキーマで検証し、行をまたぐルール
+    （社員IDの一意性、部署平均給与、管理職の評価スコア）は
+    ``FrameAggregates`` の集計状態で最後に評価する。メモリ使用量は
+    チャンクサイズと集計状態の大きさに比例し、ファイル全体を
+    データフレームとして保持しない。
+
+    Args:
+        path: 検証するCSVファイルのパス
+        chunksize: 1チャンクあたりの行数
+
+    Returns:
+        ValidationResult: ``validate_employee_data`` と同じ形式のタプル。
+            データ全体を保持しないため、検証済みデータフレームは常にNone
+    """
+    try:
+        schema = get_employee_schema(row_level=True)
+
+        # 列名とデータ型の事前チェック（構造が壊れていれば読み込み前に終了）
+        preflight = preflight_check(path, schema=schema)
+        if not preflight.ok:
+            error_msg = "\n".join(preflight.errors)
+            logger.error(f"構造チェックエラー: {error_msg}")
+            return False, None, error_msg, None
+
+        aggregates = FrameAggregates()
+
+        # ファイル全体の読み込み（read_employee_csv）と同じデータ型で各チャンクを読み込む
+        for chunk in iter_employee_csv(path, chunksize, schema=schema):
+            validated_chunk = compile_schema(schema).validate(chunk)
+            aggregates.update(validated_chunk)
+
+        # 行をまたぐルールの評価
+        error_msg = aggregates.find_errors(schema_hash=_schema_hash(schema))
+        if error_msg is not None:
+            logger.error(f"バリデーションエラー: {error_msg}")
+            return False, None, error_msg, None
+
+        summary = aggregates.summary(schema_hash=_schema_hash(schema))
+        logger.info(
+            f"バリデーション成功: {summary['record_count']}件のレコードが検証されました"
+        )
+        return True, None, None, summary
+
+    except pa.errors.SchemaError as e:
+        # スキーマエラー（失敗件数と先頭の失敗ケースのみをメッセージにする）
+        error_msg = ValidationErrorReport.from_schema_error(
+            e, schema_hash=_schema_hash(schema)
+        )
+        logger.error(f"バリデーションエラー: {error_msg}")
+        return False, None, error_msg, None
+
+    except pa.errors.ParserError as e:
+        # 型変換できないセルは、ファイル全体を読み込む場合と同じく検証エラーとする
+        logger.error(f"バリデーションエラー: {e}")
+        return False, None, str(e), None
+
+    except Exception as e:
+        return _handle_exception(e)
@@ -1,73 +1,474 @@
 """データバリデーション実行のためのユーティリティ関数。"""
 
+import json
 import logging
-from typing import Tuple, Optional, Dict, Any
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import pandera as pa
+from pandera import DataFrameSchema
 
 from pandera_validation.schemas import create_employee_schema
+from pandera_validation.schemas.columns import EMPLOYEE_SCHEMA_HASH
+from pandera_validation.utils.compact import (
+    memory_report,
+    to_compact_frame,
+    wide_columns,
+)
+from pandera_validation.utils.errors import ValidationErrorReport
+from pandera_validation.utils.fused import clear_fused_cache, compile_schema
+from pandera_validation.utils.profiling import profile_validation
+from pandera_validation.utils.result_cache import (
+    ValidationResultCache,
+    hash_frame,
+    make_cache_key,
+)
+
+if TYPE_CHECKING:
+    from pandera_validation.utils.sampling import SamplingOptions
 
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# バリデーション結果の型
+ValidationResult = Tuple[
+    bool, Optional[pd.DataFrame], Optional[str], Optional[Dict[str, Any]]
+]
+
+# 構築済みスキーマのキャッシュ（スキーマ生成関数とパラメータをキーとする）
+_schema_cache: Dict[Hashable, DataFrameSchema] = {}
+_schema_cache_lock = threading.Lock()
+
+
+def get_employee_schema(**params: Any) -> DataFrameSchema:
+    """キャッシュ済みの社員データスキーマを取得する。
+
+    初回呼び出し時のみ ``create_employee_schema`` でスキーマを構築し、
+    以降は同じインスタンスを返す。キャッシュはスキーマ生成関数と
+    パラメータの組をキーとし、複数スレッドから安全に呼び出せる。
+
+    Args:
+        **params: スキーマ生成関数に渡すパラメータ（``structure`` に
+            ``load_schema_artifact`` で読み込んだ定義を渡した場合は、
+            定義の内容が同じであれば同じインスタンスを返す）
+
+    Returns:
+        DataFrameSchema: 社員データ検証用のPanderaスキーマ
+    """
+    factory = create_employee_schema
+    key = (factory, tuple(sorted(params.items())))
+    schema = _schema_cache.get(key)
+    if schema is None:
+        with _schema_cache_lock:
+            schema = _schema_cache.get(key)
+            if schema is None:
+                schema = factory(**params)
+                _schema_cache[key] = schema
+    return schema
+
+
+def clear_schema_cache() -> None:
+    """スキーマキャッシュを破棄する。
+
+    スキーマ定義を変更した場合など、次回の取得時に再構築させたいときに呼び出す。
+    """
+    with _schema_cache_lock:
+        _schema_cache.clear()
+    clear_fused_cache()
+
+
+def infer_dtype_backend(df: pd.DataFrame) -> Optional[str]:
+    """データフレームの列のデータ型から、対応するスキーマのバックエンドを判定する。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+
+    Returns:
+        Optional[str]: いずれかの列が ``pd.ArrowDtype`` の場合は ``"pyarrow"``、
+            それ以外はNone
+    """
+    if any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        return "pyarrow"
+    return None
+
+
+def get_schema_for(df: pd.DataFrame, **params: Any) -> DataFrameSchema:
+    """データフレームのデータ型に対応するキャッシュ済みスキーマを取得する。
+
+    pyarrowベースの列を持つデータフレームにはArrow型のスキーマを返すため、
+    Parquet・Arrow IPCから読み込んだデータを変換せずに検証できる。
+
+    Args:
+        df: 検証する社員データのデータフレーム
+        **params: スキーマ生成関数に渡す追加のパラメータ
+
+    Returns:
+        DataFrameSchema: 社員データ検証用のPanderaスキーマ
+    """
+    dtype_backend = infer_dtype_backend(df)
+    if dtype_backend is not None:
+        params["dtype_backend"] = dtype_backend
+    return get_employee_schema(**params)
+
+
+class EmployeeValidator:
+    """構築済みスキーマを保持して繰り返し検証を行うバリデータ。
+
+    スキーマは生成時に一度だけ取得され、``validate`` の呼び出しごとに
+    再構築されない。インスタンスは状態を変更しないため、スレッド間で共有できる。
+
+    Args:
+        schema: 使用するスキーマ（Noneの場合はキャッシュ済みの社員データスキーマ）
+    """
+
+    def __init__(self, schema: Optional[DataFrameSchema] = None) -> None:
+        self._schema = schema if schema is not None else get_employee_schema()
+
+    @property
+    def schema(self) -> DataFrameSchema:
+        """検証に使用するスキーマ。"""
+        return self._schema
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        profile: bool = False,
+        detailed_summary: bool = False,
+    ) -> ValidationResult:
+        """社員データのバリデーションを実行し、結果を返す。
+
+        Args:
+            df: 検証する社員データのデータフレーム
+            profile: Trueの場合、チェックごとの実行時間を計測する
+            detailed_summary: Trueの場合、部署別統計と年齢の四分位数をサマリーに含める
+
+        Returns:
+            ValidationResult: ``validate_employee_data`` と同じ形式のタプル
+        """
+        try:
+            return _run_validation(
+                self._schema, df, profile=profile, detailed_summary=detailed_summary
+            )
+        except Exception as e:
+            return _handle_exception(e)
+
 
 def validate_employee_data(
     df: pd.DataFrame,
-) -> Tuple[bool, Optional[pd.DataFrame], Optional[str], Optional[Dict[str, Any]]]:
+    profile: bool = False,
+    detailed_summary: bool = False,
+    compact: bool = False,
+    sample: Optional["SamplingOptions"] = None,
+    cache: Optional[ValidationResultCache] = None,
+) -> ValidationResult:
     """社員データのバリデーションを実行し、結果を返す関数。
 
+    pyarrowベースの列（``pd.ArrowDtype``）を持つデータフレームは、
+    Arrow型のスキーマで変換せずに検証する。
+
     Args:
         df: 検証する社員データのデータフレーム
+        profile: Trueの場合、列チェック・データ型チェック・データフレームレベルの
+            チェックごとに実行時間、処理行数、失敗件数を計測し、サマリーの
+            ``profile`` キーと構造化ログに出力する
+        detailed_summary: Trueの場合、部署別の給与・評価スコアの統計と
+            年齢の四分位数をサマリーに含める
+        compact: Trueの場合、部署をカテゴリ型、整数列を（値が収まる場合のみ）
+            幅の狭い整数型に変換して検証し、変換後のデータフレームを返す。変換前後のメモリ使用量を
+            サマリーの ``memory`` キーと構造化ログに出力する
+        sample: 指定した場合、全行ではなく標本だけを検証し、チェックごとの
+            失敗率を信頼区間付きで推定する（``validate_employee_sample`` を参照）。
+            検証済みデータフレームは返さない
+        cache: 指定した場合、データの内容のハッシュとスキーマのバージョン、
+            検証オプションをキーとして検証結果を再利用する。同じ内容のデータでは
+            チェックを実行せず、保存済みの結果を返す（検証済みデータフレームは
+            型変換のみで作成する）。``profile=True`` の場合は使用しない
 
     Returns:
         Tuple[bool, Optional[pd.DataFrame], Optional[str], Optional[Dict[str, Any]]]:
             - 検証結果のブール値
             - 検証済みデータフレームまたはNone
-            - エラーメッセージまたはNone
+            - エラーメッセージまたはNone（スキーマエラーの場合は失敗件数と先頭の
+              失敗ケースを持つ ``ValidationErrorReport``）
             - 検証結果のサマリー情報またはNone
     """
     try:
-        # スキーマの取得
-        schema = create_employee_schema()
+        content_hash = None
+        if cache is not None and not profile:
+            content_hash = _content_hash(df)
+        if content_hash is None:
+            return _dispatch_validation(
+                df,
+                profile=profile,
+                detailed_summary=detailed_summary,
+                compact=compact,
+                sample=sample,
+            )
+
+        # 内容が同じデータの検証結果があれば、チェックを実行せずに再利用する
+        key = make_cache_key(
+            content_hash,
+            detailed_summary=detailed_summary,
+            compact=compact,
+            sample=sample,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("キャッシュ済みの検証結果を使用します")
+            return _cached_result(df, cached, compact=compact, sample=sample)
+
+        result = _dispatch_validation(
+            df, detailed_summary=detailed_summary, compact=compact, sample=sample
+        )
+        success, _, error_msg, summary = result
+        cache.put(key, (success, error_msg, summary))
+        return result
+    except Exception as e:
+        return _handle_exception(e)
+
+
+def _content_hash(df: pd.DataFrame) -> Optional[str]:
+    """キャッシュのキーに使用する内容のハッシュを求める（求められない場合はNone）。"""
+    try:
+        return hash_frame(df)
+    except (TypeError, ValueError) as e:
+        # リストなどハッシュ化できない値を持つ列がある場合は、キャッシュを使用しない
+        logger.warning(
+            f"データのハッシュを求められないため、キャッシュを使用しません: {e}"
+        )
+        return None
+
+
+def _dispatch_validation(
+    df: pd.DataFrame,
+    profile: bool = False,
+    detailed_summary: bool = False,
+    compact: bool = False,
+    sample: Optional["SamplingOptions"] = None,
+) -> ValidationResult:
+    """検証オプションに応じた方法でバリデーションを実行する。"""
+    if sample is not None:
+        # 標本検証は遅延検証を使用するため、循環インポートを避けてここで読み込む
+        from pandera_validation.utils.sampling import validate_employee_sample
+
+        return validate_employee_sample(df, sample)
+
+    if compact:
+        return _run_compact_validation(
+            df, profile=profile, detailed_summary=detailed_summary
+        )
+
+    # スキーマの取得（データ型に対応するキャッシュ済みのものを再利用）
+    schema = get_schema_for(df)
+    return _run_validation(
+        schema, df, profile=profile, detailed_summary=detailed_summary
+    )
+
+
+def _cached_result(
+    df: pd.DataFrame,
+    cached: Tuple[bool, Optional[str], Optional[Dict[str, Any]]],
+    compact: bool = False,
+    sample: Optional["SamplingOptions"] = None,
+) -> ValidationResult:
+    """キャッシュ済みの検証結果に、型変換のみで作成した検証済みデータを加える。"""
+    success, error_msg, summary = cached
+    if not success or sample is not None:
+        return success, None, error_msg, summary
+
+    if compact:
+        schema = get_employee_schema(compact=True, wide_columns=wide_columns(df))
+        df = to_compact_frame(df)
+    else:
+        schema = get_schema_for(df)
 
-        # バリデーション実行
-        validated_df = schema.validate(df)
+    # 検証済みデータフレームは、入力に型変換を適用したものと同じになる
+    validated_df = df.copy(deep=False)
+    for name, column in schema.columns.items():
+        if column.coerce and column.dtype is not None and name in df.columns:
+            validated_df[name] = column.dtype.try_coerce(df[name])
+    return success, validated_df, error_msg, summary
+
+
+def _run_validation(
+    schema: DataFrameSchema,
+    df: pd.DataFrame,
+    profile: bool = False,
+    detailed_summary: bool = False,
+) -> ValidationResult:
+    """スキーマでバリデーションを実行し、成功結果を組み立てる。"""
+    try:
+        if profile:
+            # チェックごとに計測しながら実行
+            validated_df, profiler = profile_validation(schema, df)
+            profile_info = profiler.to_dict()
+            logger.info(
+                json.dumps(
+                    {"event": "validation_profile", **profile_info},
+                    ensure_ascii=False,
+                )
+            )
+            if validated_df is None:
+                # 失敗時はPanderaのエラー内容を取得するため通常の検証を実行
+                validated_df = schema.validate(df)
+        else:
+            # バリデーション実行（組み込みの値チェックは列ごとに融合して評価）
+            validated_df = compile_schema(schema).validate(df)
 
         # 成功ログ
         logger.info(
             f"バリデーション成功: {len(validated_df)}件のレコードが検証されました"
         )
 
-        # 検証結果のサマリー情報を作成
-        summary = {
-            "record_count": len(validated_df),
-            "departments": validated_df["department"].value_counts().to_dict(),
-            "avg_age": validated_df["age"].mean(),
-            "avg_salary": validated_df["salary"].mean(),
-            "avg_score": validated_df["performance_score"].mean(),
-        }
-
-        # 部署ごとの人数集計
-        dept_counts = validated_df.groupby("department").size()
-        logger.info(f"部署別人数: {dept_counts.to_dict()}")
+        # 検証結果のサマリー情報を作成（使用したスキーマのハッシュを記録）
+        summary = build_summary(
+            validated_df, detailed=detailed_summary, schema_hash=_schema_hash(schema)
+        )
+        if profile:
+            summary["profile"] = profile_info
 
         # 成功結果を返す
         return True, validated_df, None, summary
 
     except pa.errors.SchemaError as e:
-        # スキーマエラー
-        error_msg = str(e)
+        # スキーマエラー（失敗件数と先頭の失敗ケースのみをメッセージにする）
+        error_msg = ValidationErrorReport.from_schema_error(
+            e, schema_hash=_schema_hash(schema)
+        )
         logger.error(f"バリデーションエラー: {error_msg}")
 
         # 失敗結果を返す
         return False, None, error_msg, None
 
-    except Exception as e:
-        # その他の例外
-        error_msg = f"予期しないエラーが発生しました: {str(e)}"
-        logger.error(error_msg, exc_info=True)
 
-        # 失敗結果を返す
-        return False, None, error_msg, None
+def _run_compact_validation(
+    df: pd.DataFrame,
+    profile: bool = False,
+    detailed_summary: bool = False,
+) -> ValidationResult:
+    """メモリ節約用のデータ型に変換して検証し、メモリ使用量をサマリーに加える。"""
+    # 幅の狭い整数型に収まらない列は定義どおりのデータ型で検証する
+    schema = get_employee_schema(compact=True, wide_columns=wide_columns(df))
+    result = _run_validation(
+        schema, to_compact_frame(df), profile=profile, detailed_summary=detailed_summary
+    )
+    success, validated_df, _, summary = result
+    if success:
+        memory = memory_report(df, validated_df)
+        logger.info(
+            json.dumps({"event": "memory_report", **memory}, ensure_ascii=False)
+        )
+        summary["memory"] = memory
+    return result
+
+
+def _schema_hash(schema: DataFrameSchema) -> Optional[str]:
+    """スキーマの ``metadata`` に記録された定義のハッシュを返す（ない場合はNone）。"""
+    return (schema.metadata or {}).get("schema_hash")
+
+
+def build_summary(
+    validated_df: pd.DataFrame,
+    detailed: bool = False,
+    schema_hash: Optional[str] = EMPLOYEE_SCHEMA_HASH,
+) -> Dict[str, Any]:
+    """検証済みデータからサマリー情報を作成する。
+
+    部署コードを一度だけ求め、部署ごとの人数と年齢・給与・評価スコアの合計を
+    ``np.bincount`` でまとめて集計する。全体の平均は部署ごとの合計から求めるため、
+    データの走査は列ごとに1回で済む。
+
+    Args:
+        validated_df: 検証済みの社員データ
+        detailed: Trueの場合、部署別の給与・評価スコアの統計と
+            年齢の四分位数をサマリーに追加する
+        schema_hash: 検証に使用したスキーマの定義のハッシュ
+
+    Returns:
+        Dict[str, Any]: レコード数、部署別人数、平均年齢・給与・評価スコア、
+            スキーマのハッシュ
+    """
+    record_count = len(validated_df)
+    codes, departments = pd.factorize(validated_df["department"], sort=True)
+    n_departments = len(departments)
+
+    # 部署ごとの人数と各列の合計を1回の集計で求める
+    counts = np.bincount(codes, minlength=n_departments)
+    sums = {
+        column: np.bincount(
+            codes,
+            weights=validated_df[column].to_numpy(dtype=np.float64),
+            minlength=n_departments,
+        )
+        for column in ("age", "salary", "performance_score")
+    }
+
+    def overall_mean(column: str) -> float:
+        return sums[column].sum() / record_count if record_count else float("nan")
+
+    dept_counts = dict(zip(departments.tolist(), counts.tolist()))
+    summary = {
+        "record_count": record_count,
+        "departments": dict(
+            sorted(dept_counts.items(), key=lambda item: item[1], reverse=True)
+        ),
+        "avg_age": overall_mean("age"),
+        "avg_salary": overall_mean("salary"),
+        "avg_score": overall_mean("performance_score"),
+        "schema_hash": schema_hash,
+    }
+
+    if detailed:
+        summary["department_stats"] = _department_stats(
+            validated_df, codes, departments, counts, sums
+        )
+        summary["age_quantiles"] = _quantiles(validated_df["age"])
+
+    # 部署ごとの人数集計
+    logger.info(f"部署別人数: {dept_counts}")
+
+    return summary
+
+
+def _department_stats(
+    validated_df: pd.DataFrame,
+    codes: np.ndarray,
+    departments: pd.Index,
+    counts: np.ndarray,
+    sums: Dict[str, np.ndarray],
+) -> Dict[str, Dict[str, float]]:
+    """部署ごとの給与・評価スコアの平均・最小・最大を求める。"""
+    stats: Dict[str, Dict[str, float]] = {}
+    n_departments = len(departments)
+    for column, label in (("salary", "salary"), ("performance_score", "score")):
+        values = validated_df[column].to_numpy(dtype=np.float64)
+        minimum = np.full(n_departments, np.inf)
+        maximum = np.full(n_departments, -np.inf)
+        np.minimum.at(minimum, codes, values)
+        np.maximum.at(maximum, codes, values)
+        for i, dept in enumerate(departments.tolist()):
+            dept_stats = stats.setdefault(dept, {"count": int(counts[i])})
+            dept_stats[f"avg_{label}"] = float(sums[column][i] / counts[i])
+            dept_stats[f"min_{label}"] = float(minimum[i])
+            dept_stats[f"max_{label}"] = float(maximum[i])
+    return stats
+
+
+def _quantiles(series: pd.Series) -> Dict[str, float]:
+    """四分位数を求める。"""
+    if series.empty:
+        return {}
+    values = np.quantile(series.to_numpy(dtype=np.float64), [0.25, 0.5, 0.75])
+    return {"q25": float(values[0]), "q50": float(values[1]), "q75": float(values[2])}
+
+
+def _handle_exception(e: Exception) -> ValidationResult:
+    """予期しない例外を失敗結果に変換する。"""
+    error_msg = f"予期しないエラーが発生しました: {str(e)}"
+    logger.error(error_msg, exc_info=True)
+
+    # 失敗結果を返す
+    return False, None, error_msg, None
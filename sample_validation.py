@@ -1,16 +1,17 @@
 #!/usr/bin/env python
-"""Panderaバリデーションのサンプル実行スクリプト。"""
+"""Panderaバリデーションのサンプル実行スクリプト。
 
+``--help`` や引数の誤りで終了する場合にpandas・Panderaを読み込まないよう、
+これらのモジュールは使用する関数の中で読み込む。
+"""
+
+import argparse
 import json
 import logging
 import sys
+from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-
-from pandera_validation.utils import validate_employee_data
-
-
 # ロギングの設定
 logging.basicConfig(
     level=logging.INFO,
@@ -20,21 +21,44 @@ logging.basicConfig(
 logger = logging.getLogger("sample_validation")
 
 
-def load_sample_data(file_path=None):
-    """サンプルデータをCSVから読み込むか、デフォルトデータを生成する。
+def load_sample_data(file_path=None, snapshot=False):
+    """サンプルデータをファイルから読み込むか、デフォルトデータを生成する。
+
+    CSVファイルはスキーマのデータ型で読み込み時に型変換し、Parquet・Arrow IPC
+    （Feather）ファイルはpyarrowベースのデータ型のまま読み込む。
 
     Args:
-        file_path: 読み込むCSVファイルのパス（Noneの場合はデフォルトデータを生成）
+        file_path: 読み込むCSV・Parquet・Arrow IPCファイルのパス
+            （Noneの場合はデフォルトデータを生成）
+        snapshot: Trueの場合、CSV・Parquetファイルを列指向キャッシュ
+            （``<ファイル名>.arrow``）に変換し、メモリマップして読み込む
 
     Returns:
         pd.DataFrame: 読み込んだ社員データ
+
+    Raises:
+        ParserError: CSVに型変換できないセルがある場合
     """
+    import pandas as pd
+
+    from pandera_validation.utils.readers import (
+        is_columnar_file,
+        read_employee_csv,
+        read_employee_file,
+    )
+    from pandera_validation.utils.snapshot import load_employee_snapshot
+
+    if snapshot and file_path and Path(file_path).exists():
+        logger.info(f"ファイル {file_path} の列指向キャッシュからデータを読み込みます")
+        return load_employee_snapshot(file_path)
+
+    if file_path and Path(file_path).exists() and is_columnar_file(file_path):
+        logger.info(f"ファイル {file_path} からpyarrowベースのデータを読み込みます")
+        return read_employee_file(file_path)
+
     if file_path and Path(file_path).exists():
         logger.info(f"CSVファイル {file_path} からデータを読み込みます")
-        df = pd.read_csv(file_path)
-        if "join_date" in df.columns:
-            df["join_date"] = pd.to_datetime(df["join_date"])
-        return df
+        return read_employee_csv(file_path)
 
     logger.info("デフォルトサンプルデータを生成します")
     data = {
@@ -58,13 +82,67 @@ def load_sample_data(file_path=None):
     return df
 
 
-def main():
-    """メインの実行関数。"""
-    # コマンドライン引数からCSVファイルパスを取得（指定がなければNone）
-    file_path = sys.argv[1] if len(sys.argv) > 1 else None
+def parse_args(argv=None):
+    """コマンドライン引数を解析する。"""
+    parser = argparse.ArgumentParser(description="社員データのバリデーションを実行する")
+    parser.add_argument(
+        "file_path",
+        nargs="?",
+        default=None,
+        help="読み込むCSV・Parquet・Arrow IPCファイルのパス（省略時はデフォルトデータを生成）",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="指定した行数ずつCSVを読み込んで検証する（メモリ使用量を抑える）",
+    )
+    parser.add_argument(
+        "--sample",
+        choices=["head", "tail", "random", "stratified"],
+        default=None,
+        help="全行ではなく標本だけを検証し、失敗率を推定する（抽出方法を指定）",
+    )
+    parser.add_argument("--sample-size", type=int, default=10_000, help="標本の行数")
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="CSV・Parquetを列指向キャッシュに変換し、次回以降はメモリマップして読み込む",
+    )
+    return parser.parse_args(argv)
+
+
+def load_and_validate(file_path=None, sample=None, snapshot=False):
+    """データを事前チェック・読み込みし、バリデーションを実行する。
+
+    Args:
+        file_path: 読み込むファイルのパス（Noneの場合はデフォルトデータを生成）
+        sample: 標本検証の設定（Noneの場合は全行を検証）
+        snapshot: Trueの場合、列指向キャッシュを使って読み込む
+
+    Returns:
+        Tuple: ``validate_employee_data`` と同じ形式の検証結果
+    """
+    from pandera.errors import ParserError
+
+    from pandera_validation.utils import validate_employee_data
+    from pandera_validation.utils.preflight import preflight_check
+
+    # 列名とデータ型の事前チェック（構造が壊れていれば読み込まずに終了）
+    if file_path and Path(file_path).exists():
+        preflight = preflight_check(file_path)
+        if not preflight.ok:
+            error_msg = "\n".join(preflight.errors)
+            logger.error(f"構造チェックエラー: {error_msg}")
+            return False, None, error_msg, None
 
     # サンプルデータの読み込み
-    employee_df = load_sample_data(file_path)
+    try:
+        employee_df = load_sample_data(file_path, snapshot=snapshot)
+    except ParserError as e:
+        # 型変換できないセルは検証エラーとして扱う
+        logger.error(f"バリデーションエラー: {e}")
+        return False, None, str(e), None
 
     # データの概要表示
     print("\n=== 検証対象データの概要 ===")
@@ -75,15 +153,38 @@ def main():
 
     # バリデーション実行
     print("\n=== バリデーション実行 ===")
-    success, validated_df, error_msg, summary = validate_employee_data(employee_df)
+    return validate_employee_data(employee_df, sample=sample)
+
+
+def main():
+    """メインの実行関数。"""
+    args = parse_args()
+    file_path = args.file_path
+
+    from pandera_validation.utils import SamplingOptions, validate_employee_csv
+
+    if args.chunksize and file_path:
+        # チャンク単位のストリーミング検証
+        print("\n=== バリデーション実行（ストリーミング） ===")
+        success, validated_df, error_msg, summary = validate_employee_csv(
+            file_path, chunksize=args.chunksize
+        )
+    else:
+        sample = None
+        if args.sample:
+            sample = SamplingOptions(method=args.sample, size=args.sample_size)
+        success, validated_df, error_msg, summary = load_and_validate(
+            file_path, sample=sample, snapshot=args.snapshot
+        )
 
     if success:
         print("✅ 検証成功！データは有効です。")
         print(f"レコード数: {summary['record_count']}")
 
         # 検証後のデータをCSVに保存
-        validated_df.to_csv("validated_employees.csv", index=False)
-        print("検証済みデータを 'validated_employees.csv' に保存しました")
+        if validated_df is not None:
+            validated_df.to_csv("validated_employees.csv", index=False)
+            print("検証済みデータを 'validated_employees.csv' に保存しました")
 
         # データサマリーを表示
         print("\n=== データサマリー ===")
@@ -102,7 +203,7 @@ def main():
         # エラーログをJSONに保存
         with open("validation_errors.json", "w", encoding="utf-8") as f:
             json.dump(
-                {"timestamp": pd.Timestamp.now().isoformat(), "error": error_msg},
+                {"timestamp": datetime.now().isoformat(), "error": error_msg},
                 f,
                 ensure_ascii=False,
                 indent=2,
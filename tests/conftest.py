@@ -1,7 +1,7 @@
 """pytestのための共通テストフィクスチャ。"""
 
-import pytest
 import pandas as pd
+import pytest
 
 
 @pytest.fixture
@@ -64,6 +64,22 @@ def self_manager_df(valid_employee_df):
     return df
 
 
+@pytest.fixture
+def dangling_manager_df(valid_employee_df):
+    """存在しない社員IDを上司とする社員データを生成するフィクスチャ。"""
+    df = valid_employee_df.copy()
+    df.at[0, "manager_id"] = 9999  # 存在しない社員ID
+    return df
+
+
+@pytest.fixture
+def manager_cycle_df(valid_employee_df):
+    """管理階層に循環がある社員データを生成するフィクスチャ。"""
+    df = valid_employee_df.copy()
+    df.at[2, "manager_id"] = 1004  # 1003→1004→1002→1003 の循環
+    return df
+
+
 @pytest.fixture
 def invalid_department_df(valid_employee_df):
     """存在しない部署名の社員データを生成するフィクスチャ。"""
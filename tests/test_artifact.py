@@ -0,0 +1,118 @@
+"""スキーマの定義のアーティファクトとスキーマのハッシュのテスト。"""
+
+import dataclasses
+import json
+
+import pytest
+
+import employee_schema
+from pandera_validation.schemas import (
+    EMPLOYEE_STRUCTURE,
+    create_employee_schema,
+    export_schema_artifact,
+    load_schema_artifact,
+    schema_hash,
+)
+from pandera_validation.schemas.columns import FrameStructure
+from pandera_validation.utils import validate_employee_data
+from pandera_validation.utils.validation import EmployeeValidator, get_employee_schema
+
+
+@pytest.fixture(params=["json", "yaml"])
+def artifact_path(request, tmp_path):
+    """JSONまたはYAMLのアーティファクトのパス。"""
+    if request.param == "yaml":
+        pytest.importorskip("yaml")
+    return tmp_path / f"employee_schema.{request.param}"
+
+
+class TestSchemaArtifact:
+    """スキーマのアーティファクトのテストクラス。"""
+
+    def test_round_trip(self, artifact_path):
+        """保存したアーティファクトから同じ定義を読み込めることを確認。"""
+        saved_hash = export_schema_artifact(artifact_path)
+
+        structure = load_schema_artifact(artifact_path)
+
+        assert saved_hash == schema_hash()
+        assert structure == EMPLOYEE_STRUCTURE
+        assert schema_hash(structure) == schema_hash()
+        assert load_schema_artifact(artifact_path) is structure
+
+    def test_modified_artifact(self, tmp_path):
+        """記録したハッシュと内容が一致しないアーティファクトを拒否することを確認。"""
+        path = tmp_path / "employee_schema.json"
+        export_schema_artifact(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["columns"]["age"]["checks"][0]["options"]["max_value"] = 70
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="ハッシュ"):
+            load_schema_artifact(path)
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "valid_employee_df",
+            "invalid_age_df",
+            "early_join_date_df",
+            "self_manager_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+        ],
+    )
+    def test_same_verdict_as_builtin(self, request, tmp_path, fixture_name):
+        """アーティファクトから構築したスキーマの検証結果が一致することを確認。"""
+        path = tmp_path / "employee_schema.json"
+        export_schema_artifact(path)
+        df = request.getfixturevalue(fixture_name)
+
+        schema = get_employee_schema(structure=load_schema_artifact(path))
+        expected, _, expected_error, _ = validate_employee_data(df)
+        success, _, error_msg, _ = EmployeeValidator(schema).validate(df)
+
+        assert schema is get_employee_schema(structure=load_schema_artifact(path))
+        assert success is expected
+        assert error_msg == expected_error
+
+    def test_unknown_frame_check(self):
+        """登録されていないデータフレームレベルのチェック名をエラーとすることを確認。"""
+        checks = EMPLOYEE_STRUCTURE.checks + (
+            dataclasses.replace(EMPLOYEE_STRUCTURE.checks[0], name="no_such_check"),
+        )
+        structure = dataclasses.replace(EMPLOYEE_STRUCTURE, checks=checks)
+
+        with pytest.raises(ValueError, match="no_such_check"):
+            create_employee_schema(structure=structure)
+
+
+class TestSchemaHash:
+    """スキーマのハッシュのテストクラス。"""
+
+    def test_changes_with_definition(self):
+        """定義を変更するとハッシュが変わることを確認。"""
+        changed = dataclasses.replace(EMPLOYEE_STRUCTURE, ordered=True)
+
+        assert len(schema_hash()) == 16
+        assert schema_hash(changed) != schema_hash()
+        assert isinstance(hash(changed), int)
+
+    def test_recorded_in_results(self, valid_employee_df, invalid_salary_df):
+        """検証結果のサマリーとエラーにスキーマのハッシュが記録されることを確認。"""
+        _, _, _, summary = validate_employee_data(valid_employee_df)
+        compact_summary = validate_employee_data(valid_employee_df, compact=True)[3]
+        _, _, error_msg, _ = validate_employee_data(invalid_salary_df)
+
+        assert create_employee_schema().metadata == {
+            "schema_version": EMPLOYEE_STRUCTURE.version,
+            "schema_hash": schema_hash(),
+        }
+        assert summary["schema_hash"] == schema_hash()
+        assert compact_summary["schema_hash"] == schema_hash()
+        assert error_msg.schema_hash == schema_hash()
+
+    def test_single_definition(self):
+        """ルートのスクリプト用のスキーマがパッケージの定義と同じであることを確認。"""
+        assert employee_schema.create_employee_schema is create_employee_schema
+        assert isinstance(EMPLOYEE_STRUCTURE, FrameStructure)
@@ -0,0 +1,120 @@
+"""複数ファイルのバッチバリデーションのテスト。"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from pandera_validation.utils import validate_employee_files
+from pandera_validation.utils.batch import find_files, validate_employee_file
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """テスト間で共有するプロセスプール。"""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture
+def branch_dir(tmp_path, valid_employee_df, invalid_salary_df):
+    """成功するファイル2つと失敗するファイル1つを持つディレクトリ。"""
+    valid_employee_df.to_csv(tmp_path / "branch_a.csv", index=False)
+    other = valid_employee_df.copy()
+    other["employee_id"] += 100
+    other["manager_id"] += 100
+    other.to_csv(tmp_path / "branch_b.csv", index=False)
+    invalid_salary_df.to_csv(tmp_path / "branch_c.csv", index=False)
+    (tmp_path / "notes.txt").write_text("対象外")
+    return tmp_path
+
+
+class TestFindFiles:
+    """検証するファイルの展開のテストクラス。"""
+
+    def test_directory_and_glob(self, branch_dir):
+        """ディレクトリとglobパターンを展開し、重複を除くことを確認。"""
+        paths = find_files([branch_dir, str(branch_dir / "branch_[ab].csv")])
+
+        assert [path.rsplit("/", 1)[-1] for path in paths] == [
+            "branch_a.csv",
+            "branch_b.csv",
+            "branch_c.csv",
+        ]
+
+
+class TestBatchValidation:
+    """バッチバリデーションのテストクラス。"""
+
+    def test_per_file_status(self, branch_dir, executor):
+        """ファイルごとの状態と失敗件数を入力の順序で報告することを確認。"""
+        report = validate_employee_files(find_files([branch_dir]), executor=executor)
+
+        frame = report.to_frame()
+        assert report.success is False
+        assert frame["success"].tolist() == [True, True, False]
+        assert frame["record_count"].tolist() == [5, 5, 5]
+        assert frame["failure_count"].tolist() == [0, 0, 1]
+        assert "salary" in frame.loc[2, "error"]
+        assert (frame["seconds"] > 0).all()
+
+    def test_cross_file_unique_ids(self, tmp_path, valid_employee_df, executor):
+        """社員IDがファイル間で重複している場合に失敗とすることを確認。"""
+        valid_employee_df.to_csv(tmp_path / "a.csv", index=False)
+        # 社員1002と、その上司の社員1003だけを持つ別のファイル
+        valid_employee_df.iloc[1:3].to_csv(tmp_path / "b.csv", index=False)
+        paths = find_files([tmp_path])
+
+        unchecked = validate_employee_files(paths, executor=executor)
+        report = validate_employee_files(
+            paths, check_unique_ids=True, executor=executor
+        )
+
+        assert unchecked.success is True
+        assert report.success is False
+        assert report.duplicate_ids.tolist() == [1002, 1003]
+        assert [result.duplicate_id_count for result in report.files] == [2, 2]
+        assert all(result.employee_ids is None for result in report.files)
+
+    def test_same_verdict_as_single_file(self, tmp_path, request):
+        """1つのファイルの検証結果が ``validate_employee_data`` と一致することを確認。"""
+        df = request.getfixturevalue("low_manager_score_df")
+        path = tmp_path / "branch.csv"
+        df.to_csv(path, index=False)
+
+        result = validate_employee_file(path)
+
+        assert result.success is False
+        assert "管理職の評価スコアは3.5以上である必要があります" in result.error
+
+    def test_unreadable_file(self, tmp_path, missing_column_df):
+        """構造の壊れたファイルは読み込まずに失敗とすることを確認。"""
+        path = tmp_path / "broken.csv"
+        missing_column_df.to_csv(path, index=False)
+
+        result = validate_employee_file(path)
+
+        assert result.success is False
+        assert result.record_count is None
+        assert "salary" in result.error
+
+    def test_write_report(self, branch_dir, executor, tmp_path):
+        """JSONとParquetのレポートを保存できることを確認。"""
+        report = validate_employee_files(
+            find_files([branch_dir]), check_unique_ids=True, executor=executor
+        )
+
+        report.write(tmp_path / "report.json")
+        with open(tmp_path / "report.json", encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["file_count"] == 3
+        assert saved["failed_file_count"] == 1
+        assert saved["duplicate_id_count"] == 5  # branch_aとbranch_cの社員ID
+        assert [entry["success"] for entry in saved["files"]] == [True, True, False]
+
+        pytest.importorskip("pyarrow")
+        report.write(tmp_path / "report.parquet")
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(tmp_path / "report.parquet"), report.to_frame()
+        )
@@ -0,0 +1,42 @@
+"""ベンチマーク用合成データ生成のテスト。"""
+
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.utils import validate_employee_data
+
+
+class TestGenerateEmployeeData:
+    """合成データ生成のテストクラス。"""
+
+    @pytest.mark.parametrize("manager_skew", [0.0, 1.5])
+    def test_valid_data_passes(self, manager_skew):
+        """不正値を含まない合成データがすべてのチェックを通過することを確認。"""
+        df = generate_employee_data(2000, manager_skew=manager_skew, seed=1)
+
+        success, _, error_msg, summary = validate_employee_data(df)
+
+        assert success is True, error_msg
+        assert summary["record_count"] == 2000
+
+    def test_invalid_rate(self):
+        """不正値の割合を指定すると検証に失敗することを確認。"""
+        df = generate_employee_data(2000, invalid_rate=0.05, seed=1)
+
+        success, _, _, _ = validate_employee_data(df)
+
+        assert success is False
+
+    def test_department_weights(self):
+        """部署の出現比率が反映されることを確認。"""
+        df = generate_employee_data(1000, department_weights={"IT": 3, "HR": 1})
+
+        assert set(df["department"]) == {"IT", "HR"}
+        assert (df["department"] == "IT").sum() > (df["department"] == "HR").sum()
+
+    def test_deterministic(self):
+        """同じシードからは同じデータが生成されることを確認。"""
+        first = generate_employee_data(100, invalid_rate=0.1, seed=7)
+        second = generate_employee_data(100, invalid_rate=0.1, seed=7)
+
+        assert first.equals(second)
@@ -0,0 +1,122 @@
+"""メモリ節約用のデータ型での検証のテスト。"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.utils import validate_employee_data
+from pandera_validation.utils.compact import memory_report, to_compact_frame
+
+
+class TestCompactValidation:
+    """メモリ節約モードのテストクラス。"""
+
+    def test_valid_data(self, valid_employee_df):
+        """カテゴリ型の部署と幅の狭い整数型の列が返されることを確認。"""
+        success, validated_df, error_msg, summary = validate_employee_data(
+            valid_employee_df, compact=True
+        )
+
+        assert success is True, error_msg
+        assert isinstance(validated_df["department"].dtype, pd.CategoricalDtype)
+        assert validated_df["age"].dtype == np.int8
+        assert validated_df["salary"].dtype == np.int32
+        assert validated_df["employee_id"].dtype == np.int32
+        assert validated_df["manager_id"].dtype == "Int32"
+        assert summary["departments"] == {
+            "IT": 2,
+            "HR": 1,
+            "Finance": 1,
+            "Marketing": 1,
+        }
+
+    def test_same_summary_as_default(self, valid_employee_df):
+        """通常モードと同じサマリーになることを確認。"""
+        _, _, _, summary = validate_employee_data(
+            valid_employee_df, detailed_summary=True
+        )
+        _, _, _, compact_summary = validate_employee_data(
+            valid_employee_df, detailed_summary=True, compact=True
+        )
+
+        compact_summary.pop("memory")
+        assert compact_summary == summary
+
+    def test_memory_report(self):
+        """変換前後のメモリ使用量がサマリーに含まれ、使用量が減ることを確認。"""
+        df = generate_employee_data(1000)
+
+        _, _, _, summary = validate_employee_data(df, compact=True)
+
+        memory = summary["memory"]
+        assert memory["after_bytes"] < memory["before_bytes"]
+        assert memory["columns"]["age"]["after"] == len(df)
+        assert memory["columns"]["name"]["after"] == memory["columns"]["name"]["before"]
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "invalid_age_df",
+            "invalid_salary_df",
+            "duplicate_id_df",
+            "self_manager_df",
+            "invalid_department_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+            "early_join_date_df",
+            "missing_column_df",
+        ],
+    )
+    def test_invalid_data(self, request, fixture_name):
+        """不正なデータは通常モードと同様に検証に失敗することを確認。"""
+        df = request.getfixturevalue(fixture_name)
+
+        success, validated_df, error_msg, _ = validate_employee_data(df, compact=True)
+
+        assert success is False
+        assert validated_df is None
+        assert error_msg is not None
+
+    def test_out_of_range_values_are_not_truncated(self, valid_employee_df):
+        """幅の狭い整数型に収まらない値は変換されずにエラーになることを確認。"""
+        df = valid_employee_df.copy()
+        df.at[0, "age"] = 300
+
+        compact_df = to_compact_frame(df)
+        success, _, error_msg, _ = validate_employee_data(df, compact=True)
+
+        assert compact_df["age"].dtype == np.int64
+        assert compact_df.at[0, "age"] == 300
+        assert success is False
+        assert "age" in error_msg
+
+    def test_large_ids_keep_verdict(self, valid_employee_df):
+        """int32に収まらない社員IDでも通常モードと同じ検証結果になることを確認。"""
+        df = valid_employee_df.copy()
+        offset = 3_000_000_000
+        df["employee_id"] += offset
+        df["manager_id"] += offset
+
+        expected, _, _, _ = validate_employee_data(df)
+        success, validated_df, error_msg, _ = validate_employee_data(df, compact=True)
+
+        assert expected is True
+        assert success is True, error_msg
+        assert validated_df["employee_id"].dtype == np.int64
+        assert validated_df["manager_id"].dtype == "Int64"
+        assert validated_df["age"].dtype == np.int8
+        assert validated_df["employee_id"].tolist() == df["employee_id"].tolist()
+
+    def test_memory_report_columns(self):
+        """列ごとのメモリ使用量が比較されることを確認。"""
+        before = pd.DataFrame({"a": np.arange(10, dtype=np.int64)})
+        after = before.astype(np.int8)
+
+        report = memory_report(before, after)
+
+        assert report == {
+            "before_bytes": 80,
+            "after_bytes": 10,
+            "columns": {"a": {"before": 80, "after": 10}},
+        }
@@ -1,11 +1,23 @@
 """社員データバリデーションのテスト。"""
 
-import pytest
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pandera as pa
+import pytest
 
-from pandera_validation.schemas import create_employee_schema
-from pandera_validation.utils import validate_employee_data
+from pandera_validation.schemas import (
+    check_department_avg_salary,
+    check_manager_min_score,
+    check_manager_not_self,
+    create_employee_schema,
+)
+from pandera_validation.utils import (
+    EmployeeValidator,
+    clear_schema_cache,
+    get_employee_schema,
+    validate_employee_data,
+)
 
 
 class TestEmployeeSchema:
@@ -51,7 +63,11 @@ class TestEmployeeSchema:
 
         # エラーメッセージに特定の文言が含まれているか確認
         assert "employee_id" in str(excinfo.value)
-        assert "unique" in str(excinfo.value)
+        assert "duplicate values" in str(excinfo.value)
+        assert (
+            excinfo.value.reason_code
+            == pa.errors.SchemaErrorReason.SERIES_CONTAINS_DUPLICATES
+        )
 
     def test_column_relationship_error(self, self_manager_df):
         """上司IDが自分自身の場合、SchemaErrorが発生することを確認。"""
@@ -116,6 +132,102 @@ class TestEmployeeSchema:
         # エラーメッセージに特定の文言が含まれているか確認
         assert "salary" in str(excinfo.value)
 
+    def test_manager_check_is_null_aware(self, self_manager_df):
+        """上司IDチェックがNULLを許容し、自分自身を指す行のみ失敗とすることを確認。"""
+        df = self_manager_df.copy()
+        df["manager_id"] = df["manager_id"].astype("Int64")
+        result = check_manager_not_self(df)
+
+        assert result.shape == df.shape
+        assert result["manager_id"].tolist() == [True, False, True, True, True]
+        assert result.drop(columns="manager_id").all().all()
+
+    def test_manager_check_failure_cases(self, self_manager_df):
+        """上司IDチェックの失敗ケースとして該当行の値が報告されることを確認。"""
+        schema = create_employee_schema()
+        with pytest.raises(pa.errors.SchemaErrors) as excinfo:
+            schema.validate(self_manager_df, lazy=True)
+
+        failure_cases = excinfo.value.failure_cases
+        failure_cases = failure_cases[
+            failure_cases["check"] == "上司IDは自分自身のIDと異なる必要があります"
+        ]
+        assert failure_cases["index"].tolist() == [1]
+        assert failure_cases["failure_case"].tolist() == [{"manager_id": 1002}]
+
+    @pytest.mark.parametrize(
+        "departments",
+        [
+            ["IT", "HR", "IT", "Sales", "HR", "IT"],
+            ["IT", "Legal", "IT", "Sales", None, "Legal"],
+        ],
+    )
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_department_check_matches_groupby(self, departments, categorical):
+        """部署平均給与チェックがgroupbyによる平均と同じ判定になることを確認。"""
+        df = pd.DataFrame(
+            {
+                "department": departments,
+                "salary": [250000, 400000, 320000, 280000, 350000, 260000],
+            }
+        )
+        if categorical:
+            df["department"] = df["department"].astype("category")
+
+        result = check_department_avg_salary(df)
+
+        expected = df.groupby("department", observed=True)["salary"].mean() >= 300000
+        assert result.to_dict() == expected.to_dict()
+
+    @pytest.mark.parametrize(
+        "manager_id, score",
+        [
+            ([None, 1001, 1001, 1002, 1002], [4.0, 3.6, 3.0, 2.0, 1.0]),
+            ([None, 1001, 1001, 1002, 1002], [4.0, 3.4, 3.0, 2.0, 1.0]),
+            ([None, 1001, 1003, 1003, 1003], [None, 3.6, 4.0, 3.9, 1.0]),
+            ([1001, 1001, None, None, None], [3.6, 1.0, 1.0, 1.0, 1.0]),
+            ([None, None, None, None, None], [4.0, 4.0, 4.0, 4.0, 4.0]),
+            ([None, 1001, None, None, None], [None, 4.0, 4.0, 4.0, 4.0]),
+        ],
+    )
+    def test_manager_score_check_matches_isin(self, manager_id, score):
+        """管理職の評価スコアチェックがisinとminによる判定と一致することを確認。"""
+        df = pd.DataFrame(
+            {
+                "employee_id": [1001, 1002, 1003, 1004, 1005],
+                "manager_id": pd.array(manager_id, dtype="Int64"),
+                "performance_score": pd.array(score, dtype=float),
+            }
+        )
+        is_manager = df["employee_id"].isin(df["manager_id"].dropna())
+        expected = df[is_manager]["performance_score"].min() >= 3.5
+
+        result = check_manager_min_score(df)
+
+        if isinstance(result, pd.DataFrame):
+            assert not expected
+            low = df[is_manager & (df["performance_score"] < 3.5)]
+            assert df.index[~result["performance_score"]].equals(low.index)
+            assert result.drop(columns="performance_score").all().all()
+        else:
+            assert result == expected
+
+    def test_manager_score_names_managers(self, low_manager_score_df):
+        """管理職の評価スコアのエラーメッセージに該当する管理職が含まれることを確認。"""
+        success, _, error_msg, _ = validate_employee_data(low_manager_score_df)
+
+        assert success is False
+        assert "管理職の評価スコアは3.5以上である必要があります" in error_msg
+        assert "{1003: 3.3}" in error_msg
+
+    def test_department_check_names_departments(self, low_avg_salary_df):
+        """部署平均給与のエラーメッセージに該当部署と平均給与が含まれることを確認。"""
+        success, _, error_msg, _ = validate_employee_data(low_avg_salary_df)
+
+        assert success is False
+        assert "department_avg_salary" in error_msg
+        assert "{'IT': 250002.0}" in error_msg
+
 
 class TestEmployeeValidation:
     """社員データバリデーション関数のテストクラス。"""
@@ -195,6 +307,37 @@ class TestEmployeeValidation:
             assert success is False
             assert "performance_score" in error_msg
 
+    def test_summary_values(self, valid_employee_df):
+        """サマリーの集計値が列ごとの集計結果と一致することを確認。"""
+        _, _, _, summary = validate_employee_data(valid_employee_df)
+
+        assert summary["departments"] == (
+            valid_employee_df["department"].value_counts().to_dict()
+        )
+        assert summary["avg_age"] == pytest.approx(valid_employee_df["age"].mean())
+        assert summary["avg_salary"] == pytest.approx(
+            valid_employee_df["salary"].mean()
+        )
+        assert summary["avg_score"] == pytest.approx(
+            valid_employee_df["performance_score"].mean()
+        )
+        assert "department_stats" not in summary
+
+    def test_detailed_summary(self, valid_employee_df):
+        """詳細サマリーに部署別統計と年齢の四分位数が含まれることを確認。"""
+        _, _, _, summary = validate_employee_data(
+            valid_employee_df, detailed_summary=True
+        )
+
+        it_stats = summary["department_stats"]["IT"]
+        assert it_stats["count"] == 2
+        assert it_stats["avg_salary"] == pytest.approx(375000)
+        assert it_stats["min_salary"] == 350000
+        assert it_stats["max_score"] == pytest.approx(4.2)
+        assert summary["age_quantiles"]["q50"] == pytest.approx(
+            valid_employee_df["age"].median()
+        )
+
     def test_exception_handling(self, valid_employee_df, monkeypatch):
         """予期せぬ例外が適切に処理されることを確認。"""
 
@@ -219,3 +362,47 @@ class TestEmployeeValidation:
         assert "予期しないエラー" in error_msg
         assert "テスト用の予期せぬエラー" in error_msg
         assert summary is None
+
+
+class TestEmployeeValidator:
+    """スキーマキャッシュと再利用可能なバリデータのテストクラス。"""
+
+    def test_schema_is_cached(self):
+        """スキーマが一度だけ構築され、同じインスタンスが返されることを確認。"""
+        clear_schema_cache()
+        assert get_employee_schema() is get_employee_schema()
+
+    def test_clear_schema_cache(self):
+        """キャッシュを破棄すると新しいスキーマが構築されることを確認。"""
+        schema = get_employee_schema()
+        clear_schema_cache()
+        assert get_employee_schema() is not schema
+
+    def test_validator_reuses_schema(self):
+        """バリデータがキャッシュ済みのスキーマを保持することを確認。"""
+        validator = EmployeeValidator()
+        assert validator.schema is get_employee_schema()
+
+    def test_validator_matches_function(self, invalid_department_df):
+        """バリデータが validate_employee_data と同じ結果を返すことを確認。"""
+        validator = EmployeeValidator()
+        success, validated_df, error_msg, summary = validator.validate(
+            invalid_department_df
+        )
+        expected = validate_employee_data(invalid_department_df)
+
+        assert success is expected[0] is False
+        assert validated_df is None
+        assert error_msg == expected[2]
+        assert summary is None
+
+    def test_validator_thread_safety(self, invalid_salary_df):
+        """複数スレッドから同じバリデータを共有しても結果が一致することを確認。"""
+        validator = EmployeeValidator()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: validator.validate(invalid_salary_df), range(8))
+            )
+
+        assert all(result[0] is False for result in results)
+        assert len({result[2] for result in results}) == 1
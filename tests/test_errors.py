@@ -0,0 +1,159 @@
+"""件数と先頭の失敗ケースを持つ構造化エラーのテスト。"""
+
+import pickle
+
+import pandera as pa
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.utils import (
+    ValidationErrorReport,
+    get_employee_schema,
+    validate_employee_data,
+    validate_employee_data_lazy,
+)
+
+
+@pytest.fixture
+def many_failures_df():
+    """年齢の範囲外の行を多数含むデータフレーム。"""
+    df = generate_employee_data(5000, seed=7)
+    df.loc[df.index[::2], "age"] = 70
+    return df
+
+
+def schema_error(df):
+    """スキーマで検証し、送出されたスキーマエラーを返す。"""
+    with pytest.raises(pa.errors.SchemaError) as excinfo:
+        get_employee_schema().validate(df)
+    return excinfo.value
+
+
+class TestValidationErrorReport:
+    """構造化エラーのテストクラス。"""
+
+    def test_bounded_message(self, many_failures_df):
+        """失敗件数によらず、先頭の失敗ケースのみがメッセージに含まれることを確認。"""
+        success, _, error_msg, _ = validate_employee_data(many_failures_df)
+
+        assert success is False
+        assert isinstance(error_msg, ValidationErrorReport)
+        assert error_msg.startswith("Column 'age' failed element-wise validator")
+        assert "失敗件数: 2500件" in error_msg
+        assert "...ほか2490件" in error_msg
+        assert error_msg.count("行 ") == 10
+        assert error_msg.counts == {("age", "in_range"): 2500}
+        assert len(error_msg) < 1000
+
+    def test_full_failure_cases(self, many_failures_df):
+        """失敗ケースのデータフレームと、件数を指定した表示を取得できることを確認。"""
+        report = ValidationErrorReport.from_schema_error(
+            schema_error(many_failures_df), max_examples=3
+        )
+
+        assert report.total == 2500
+        assert list(report.failure_cases.columns) == [
+            "column",
+            "check",
+            "index",
+            "failure_case",
+        ]
+        assert len(report.failure_cases) == 2500
+        assert (report.failure_cases["check"] == "in_range").all()
+        assert len(report.examples()) == 3
+        assert report.render(max_examples=None).count("行 ") == 2500
+        assert str(report) == report.render(max_examples=3)
+
+    def test_without_failure_cases(self, many_failures_df):
+        """失敗ケースを保持しない場合も件数は失敗ケース全体のものになることを確認。"""
+        error = schema_error(many_failures_df)
+
+        report = ValidationErrorReport.from_schema_error(
+            error, keep_failure_cases=False
+        )
+
+        assert len(report.failure_cases) == 10
+        assert report.total == 2500
+        assert report == ValidationErrorReport.from_schema_error(error)
+
+    @pytest.mark.parametrize(
+        "fixture_name, header",
+        [
+            (
+                "many_failures_df",
+                "Column 'age' failed element-wise validator number 0: in_range(18, 65)",
+            ),
+            ("invalid_age_df", "expected series 'age' to have type int64, got object"),
+            ("duplicate_id_df", "series 'employee_id' contains duplicate values"),
+            (
+                "low_avg_salary_df",
+                "DataFrameSchema '社員情報スキーマ' failed series or dataframe "
+                "validator 4: <Check department_avg_salary: "
+                "各部署の平均給与は300000円以上である必要があります>",
+            ),
+        ],
+    )
+    def test_header_from_error_attributes(
+        self, request, monkeypatch, fixture_name, header
+    ):
+        """失敗ケースを含むPanderaのメッセージを使わずに説明を作成することを確認。"""
+        error = schema_error(request.getfixturevalue(fixture_name))
+
+        def fail(self):
+            raise AssertionError("str(SchemaError)が呼び出されました")
+
+        monkeypatch.setattr(pa.errors.SchemaError, "__str__", fail)
+        report = ValidationErrorReport.from_schema_error(error)
+
+        assert report.header == header
+        assert report.startswith(header)
+
+    def test_coercion_failure_is_column_level(self, valid_employee_df):
+        """型変換の失敗が列のエラーとして説明・集計されることを確認。"""
+        df = valid_employee_df.astype({"manager_id": object})
+        df.at[1, "manager_id"] = "abc"
+
+        report = ValidationErrorReport.from_schema_error(schema_error(df))
+
+        assert report.header == "Error while coercing 'manager_id' to type Int64"
+        assert list(report.counts) == [("manager_id", "coerce_dtype('Int64')")]
+        assert "abc" in report.failure_cases["failure_case"].tolist()
+
+    def test_pickle(self, self_manager_df):
+        """プロセス間で受け渡せるよう、属性を含めて復元できることを確認。"""
+        report = ValidationErrorReport.from_schema_error(schema_error(self_manager_df))
+
+        restored = pickle.loads(pickle.dumps(report))
+
+        assert restored == report
+        assert restored.counts == {(None, "manager_not_self"): 1}
+        assert "行 1: {'manager_id': 1002}" in restored
+        assert restored.failure_cases.equals(report.failure_cases)
+
+    def test_frame_check_detail(self, low_avg_salary_df):
+        """失敗ケースを持たないチェックは失敗内容の説明を含むことを確認。"""
+        report = ValidationErrorReport.from_schema_error(
+            schema_error(low_avg_salary_df)
+        )
+
+        assert report.failure_cases is None
+        assert report.examples() is None
+        assert "失敗件数" not in report
+        assert report.detail in report
+        assert "{'IT': 250002.0}" in report.detail
+
+    def test_lazy_counts(self, valid_employee_df):
+        """遅延検証の失敗ケースから列・チェックごとの件数を求めることを確認。"""
+        df = valid_employee_df.copy()
+        df.loc[[2, 3], "age"] = 70
+        df.at[4, "manager_id"] = 1005
+
+        report = validate_employee_data_lazy(df).error_report(max_examples=2)
+
+        assert report.counts == {
+            ("age", "in_range(18, 65)"): 2,
+            ("manager_id", "manager_not_self"): 1,
+        }
+        assert "列 'age' in_range(18, 65): 2件" in report
+        assert "...ほか1件" in report
+        assert validate_employee_data_lazy(valid_employee_df).error_report() is None
@@ -0,0 +1,186 @@
+"""組み込みの値チェックを融合して評価する検証エンジンのテスト。"""
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.utils import fused as fused_module
+from pandera_validation.utils import get_employee_schema
+from pandera_validation.utils.compact import to_compact_frame
+from pandera_validation.utils.fused import (
+    FusedSchema,
+    column_failure_mask,
+    compile_schema,
+)
+
+
+def pandera_failure_mask(series, checks):
+    """Panderaの遅延検証の失敗ケースから失敗した行のマスクを求める。"""
+    schema = pa.DataFrameSchema({series.name: pa.Column(checks=checks, nullable=True)})
+    try:
+        schema.validate(series.to_frame(), lazy=True)
+    except pa.errors.SchemaErrors as e:
+        return series.index.isin(e.failure_cases["index"])
+    return np.zeros(len(series), dtype=bool)
+
+
+def validation_outcome(schema, df, **kwargs):
+    """検証結果（成功時は検証済みデータ、失敗時はエラーメッセージ）を返す。"""
+    try:
+        return schema.validate(df, **kwargs)
+    except (pa.errors.SchemaError, pa.errors.SchemaErrors) as e:
+        return str(e)
+
+
+class TestColumnFailureMask:
+    """列ごとの失敗マスクのテストクラス。"""
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_same_as_pandera_checks(self, compact):
+        """不正値を含むデータで、Panderaのチェックと同じ行が失敗することを確認。"""
+        df = generate_employee_data(5000, invalid_rate=0.2, seed=3)
+        df.loc[df.index[::97], "performance_score"] = np.nan
+        df.loc[df.index[::89], "employee_id"] = 999
+        if compact:
+            df = to_compact_frame(df)
+        fused = FusedSchema(get_employee_schema(compact=compact))
+
+        masks = fused.failure_masks(df)
+
+        assert masks is not None
+        assert set(masks) == {
+            "employee_id",
+            "name",
+            "age",
+            "department",
+            "salary",
+            "join_date",
+            "performance_score",
+        }
+        for name, checks in fused.column_checks.items():
+            expected = pandera_failure_mask(df[name], checks)
+            assert masks[name].any()
+            np.testing.assert_array_equal(masks[name], expected, err_msg=name)
+
+    def test_range_boundaries(self):
+        """範囲の境界値を含め、開区間・閉区間の指定どおりに判定することを確認。"""
+        series = pd.Series([17, 18, 65, 66])
+        closed = pa.Check.in_range(18, 65)
+        open_ = pa.Check.in_range(18, 65, include_min=False, include_max=False)
+
+        np.testing.assert_array_equal(
+            column_failure_mask(series, [closed]), [True, False, False, True]
+        )
+        np.testing.assert_array_equal(
+            column_failure_mask(series, [open_]), [True, True, True, True]
+        )
+
+    def test_date_boundaries(self):
+        """日付列の境界値を日付の比較で判定し、NaTを失敗としないことを確認。"""
+        series = pd.Series(
+            pd.to_datetime(["1999-12-31", "2000-01-01", None]), name="join_date"
+        )
+        check = pa.Check.greater_than_or_equal_to(pd.Timestamp("2000-01-01"))
+
+        np.testing.assert_array_equal(
+            column_failure_mask(series, [check]), [True, False, False]
+        )
+        np.testing.assert_array_equal(
+            column_failure_mask(series, [check]), pandera_failure_mask(series, [check])
+        )
+
+    def test_unsupported_values(self):
+        """長さを持たない値や未対応のデータ型ではNoneを返すことを確認。"""
+        length = pa.Check.str_length(min_value=2, max_value=20)
+        assert column_failure_mask(pd.Series(["山田", None]), [length]) is None
+        assert column_failure_mask(pd.Series([1, 2], dtype="Int64"), [length]) is None
+
+
+class TestFusedSchema:
+    """融合スキーマのテストクラス。"""
+
+    def test_residual_schema(self):
+        """残りのスキーマから融合したチェックのみが除かれることを確認。"""
+        fused = FusedSchema(get_employee_schema())
+
+        assert [check.name for check in fused.column_checks["age"]] == ["in_range"]
+        assert fused.residual.columns["age"].checks == []
+        assert fused.residual.columns["join_date"].checks == []
+        assert "manager_id" not in fused.column_checks
+        assert len(fused.residual.checks) == len(fused.schema.checks)
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "valid_employee_df",
+            "invalid_age_df",
+            "invalid_salary_df",
+            "invalid_department_df",
+            "self_manager_df",
+            "early_join_date_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+            "missing_column_df",
+        ],
+    )
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_same_result_as_schema(self, fixture, lazy, request):
+        """元のスキーマと同じ検証結果・エラーメッセージになることを確認。"""
+        df = request.getfixturevalue(fixture)
+        schema = get_employee_schema()
+
+        expected = validation_outcome(schema, df, lazy=lazy)
+        actual = validation_outcome(compile_schema(schema), df, lazy=lazy)
+
+        if isinstance(expected, str):
+            assert actual == expected
+        else:
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_invalid_names(self, valid_employee_df):
+        """名前の長さの違反が元のスキーマと同じエラーで報告されることを確認。"""
+        df = valid_employee_df.copy()
+        df.loc[2, "name"] = "A"
+        schema = get_employee_schema()
+
+        message = validation_outcome(compile_schema(schema), df)
+
+        assert "str_length" in message
+        assert message == validation_outcome(schema, df)
+
+    def test_pyarrow_columns(self, valid_employee_df):
+        """pyarrowベースの列は元のスキーマで検証されることを確認。"""
+        pytest.importorskip("pyarrow")
+        schema = get_employee_schema(dtype_backend="pyarrow")
+        df = valid_employee_df.convert_dtypes(dtype_backend="pyarrow")
+        fused = compile_schema(schema)
+
+        assert fused.failure_masks(df) is None
+        pd.testing.assert_frame_equal(fused.validate(df), schema.validate(df))
+
+    def test_compiled_once(self):
+        """同じスキーマに対しては同じ融合スキーマが返されることを確認。"""
+        schema = get_employee_schema()
+        assert compile_schema(schema) is compile_schema(schema)
+
+    def test_cache_is_bounded_and_checks_identity(self, monkeypatch):
+        """保持する件数に上限があり、idが同じ別のスキーマの結果を返さないことを確認。"""
+        monkeypatch.setattr(fused_module, "FUSED_CACHE_MAXSIZE", 2)
+        monkeypatch.setattr(
+            fused_module, "_fused_cache", type(fused_module._fused_cache)()
+        )
+        schemas = [
+            pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(i))}) for i in range(3)
+        ]
+        for schema in schemas:
+            compile_schema(schema)
+
+        assert len(fused_module._fused_cache) == 2
+        assert id(schemas[0]) not in fused_module._fused_cache
+
+        # 破棄されたスキーマのidが再利用された場合を再現する
+        stale = compile_schema(schemas[1])
+        fused_module._fused_cache[id(schemas[2])] = (schemas[1], stale)
+        assert compile_schema(schemas[2]).schema is schemas[2]
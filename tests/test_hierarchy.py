@@ -0,0 +1,139 @@
+"""管理階層のインデックスとチェックのテスト。"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.schemas.employee import MAX_HIERARCHY_DEPTH
+from pandera_validation.schemas.hierarchy import ManagerHierarchy, lookup_positions
+from pandera_validation.utils import validate_employee_data, validate_employee_data_lazy
+
+
+def chain_df(length):
+    """社員IDの順に1段ずつ上司をたどる、指定した段数の管理階層を持つ社員データ。"""
+    df = generate_employee_data(length + 1, manager_ratio=1.0)
+    df["manager_id"] = pd.array(
+        [None] + df["employee_id"].iloc[:-1].tolist(), dtype="Int64"
+    )
+    df["performance_score"] = 4.0
+    return df
+
+
+class TestManagerHierarchy:
+    """管理階層のインデックスのテストクラス。"""
+
+    def test_missing_cycle_and_depth(self):
+        """上司の欠落、循環、深さを行ごとに求めることを確認。"""
+        # 1001→1000、1002⇄1003（循環）、1004→1002（循環に至る）、
+        # 1005→9999（存在しない）、1006→1006（自己参照）
+        employee_ids = np.array([1000, 1001, 1002, 1003, 1004, 1005, 1006])
+        manager_ids = np.array([0, 1000, 1003, 1002, 1002, 9999, 1006])
+
+        hierarchy = ManagerHierarchy.from_ids(
+            employee_ids, manager_ids, manager_ids > 0
+        )
+
+        assert hierarchy.missing.tolist() == [0, 0, 0, 0, 0, 1, 0]
+        assert hierarchy.in_cycle.tolist() == [0, 0, 1, 1, 0, 0, 0]
+        assert hierarchy.depth.tolist() == [0, 1, -1, -1, -1, 0, 0]
+        assert hierarchy.too_deep(0).tolist() == [0, 1, 0, 0, 1, 0, 0]
+        assert hierarchy.referenced.tolist() == [1, 0, 1, 1, 0, 0, 1]
+
+    def test_long_chain_and_large_cycle(self):
+        """長い階層と大きな循環を反復回数の対数で評価できることを確認。"""
+        ids = np.arange(1000, 101000)
+
+        chain = ManagerHierarchy.from_ids(ids, ids - 1, ids > 1000)
+        ring = ManagerHierarchy.from_ids(
+            ids, np.roll(ids, 1), np.ones(len(ids), dtype=bool)
+        )
+
+        assert chain.depth.tolist() == list(range(len(ids)))
+        assert ring.in_cycle.all()
+
+    def test_groups(self):
+        """グループをまたぐ上司の参照は存在しないものとして扱うことを確認。"""
+        hierarchy = ManagerHierarchy.from_ids(
+            np.array([1000, 1001, 1000, 1001]),
+            np.array([0, 1000, 1001, 1000]),
+            np.array([False, True, True, True]),
+            groups=np.array([0, 0, 1, 1]),
+        )
+
+        assert hierarchy.missing.tolist() == [0, 0, 0, 0]
+        assert hierarchy.in_cycle.tolist() == [0, 0, 1, 1]
+
+    def test_known_ids(self):
+        """既存の社員を上司とする行は、既存の深さに続く深さとなることを確認。"""
+        hierarchy = ManagerHierarchy.from_ids(
+            np.array([2000, 2001, 2002]),
+            np.array([1001, 2000, 3000]),
+            np.ones(3, dtype=bool),
+            known_ids=np.array([1000, 1001]),
+            known_depths=np.array([0, 4]),
+        )
+
+        assert hierarchy.missing.tolist() == [0, 0, 1]
+        assert hierarchy.depth.tolist() == [5, 6, 0]
+
+    @pytest.mark.parametrize("ids", [[5, 3, 5, 9], [5, 3, 5, 10**12]])
+    def test_lookup_positions(self, ids):
+        """密集した社員IDと疎な社員IDのどちらでも最初の行の位置を返すことを確認。"""
+        values = np.array([5, 3, 4, ids[-1], -1])
+
+        positions = lookup_positions(np.array(ids), values)
+
+        assert positions.tolist() == [0, 1, -1, 3, -1]
+
+    @pytest.mark.parametrize("high", [10**4, 10**12])
+    def test_lookup_positions_matches_first_occurrence(self, high):
+        """重複を含む多数の社員IDで、各値の最初の行の位置と一致することを確認。"""
+        rng = np.random.default_rng(0)
+        ids = rng.integers(0, high, size=5000)
+        values = np.concatenate([ids[rng.integers(0, len(ids), 3000)], [-5, high]])
+
+        first = {}
+        for position, employee_id in enumerate(ids.tolist()):
+            first.setdefault(employee_id, position)
+        expected = [first.get(value, -1) for value in values.tolist()]
+
+        assert lookup_positions(ids, values).tolist() == expected
+
+
+class TestHierarchyChecks:
+    """管理階層のデータフレームレベルチェックのテストクラス。"""
+
+    def test_dangling_manager(self, dangling_manager_df):
+        """存在しない上司IDを検出することを確認。"""
+        success, _, error_msg, _ = validate_employee_data(dangling_manager_df)
+
+        assert success is False
+        assert "上司IDは存在する社員IDである必要があります" in error_msg
+        assert "9999" in error_msg
+
+    def test_cycle(self, manager_cycle_df):
+        """管理階層の循環を検出し、循環に含まれる行を失敗ケースとすることを確認。"""
+        success, _, error_msg, _ = validate_employee_data(manager_cycle_df)
+        result = validate_employee_data_lazy(manager_cycle_df)
+
+        assert success is False
+        assert "管理階層に循環があってはなりません" in error_msg
+        cases = result.failure_cases[
+            result.failure_cases["check"] == "no_manager_cycle"
+        ]
+        assert set(cases["index"]) == {1, 2, 3}
+        assert set(cases["column"]) == {"manager_id"}
+
+    def test_depth(self):
+        """上限を超える深さの行だけを失敗ケースとすることを確認。"""
+        assert validate_employee_data(chain_df(MAX_HIERARCHY_DEPTH))[0] is True
+
+        result = validate_employee_data_lazy(chain_df(MAX_HIERARCHY_DEPTH + 2))
+        cases = result.failure_cases[result.failure_cases["check"] == "hierarchy_depth"]
+
+        assert result.success is False
+        assert cases["index"].tolist() == [
+            MAX_HIERARCHY_DEPTH + 1,
+            MAX_HIERARCHY_DEPTH + 2,
+        ]
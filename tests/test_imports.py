@@ -0,0 +1,130 @@
+"""パッケージの遅延読み込みと起動時間のテスト。"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pandera_validation
+from pandera_validation import schemas, utils
+from pandera_validation.schemas.columns import EMPLOYEE_STRUCTURE
+from pandera_validation.utils.validation import get_employee_schema
+
+# リポジトリのルートディレクトリ
+ROOT = Path(__file__).resolve().parent.parent
+
+# パッケージの読み込みにかけてよい時間（秒）
+IMPORT_TIME_BUDGET = 0.1
+
+
+def run_python(code: str, *args: str, cwd: Path = ROOT) -> dict:
+    """新しいPythonプロセスでコードを実行し、標準出力のJSONを返す。"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    completed = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+# 実行後に読み込まれた重いモジュールを出力する
+LOADED_MODULES = (
+    "import json, sys; "
+    "print(json.dumps({name: name in sys.modules for name in ('pandas', 'pandera')}))"
+)
+
+
+class TestLazyImport:
+    """パッケージの遅延読み込みのテストクラス。"""
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "pandera_validation",
+            "pandera_validation.schemas",
+            "pandera_validation.utils",
+        ],
+    )
+    def test_import_without_pandera(self, module):
+        """パッケージの読み込みだけではpandas・Panderaを読み込まないことを確認。"""
+        code = (
+            "import time; start = time.perf_counter(); "
+            f"import {module}; elapsed = time.perf_counter() - start; "
+            "import json, sys; print(json.dumps({"
+            "'pandas': 'pandas' in sys.modules, "
+            "'pandera': 'pandera' in sys.modules, 'elapsed': elapsed}))"
+        )
+        loaded = run_python(code)
+
+        assert loaded["pandas"] is False
+        assert loaded["pandera"] is False
+        assert loaded["elapsed"] < IMPORT_TIME_BUDGET
+
+    def test_attributes_resolved_on_access(self):
+        """遅延読み込みする属性を参照でき、``dir()`` に含まれることを確認。"""
+        for module in (pandera_validation, schemas, utils):
+            for name in module.__all__:
+                assert getattr(module, name) is not None
+                assert name in dir(module)
+
+        with pytest.raises(AttributeError):
+            utils.no_such_attribute
+
+    def test_attribute_cached_after_access(self):
+        """一度参照した属性がパッケージの属性として保持されることを確認。"""
+        value = utils.get_schema_for
+
+        assert vars(utils)["get_schema_for"] is value
+        assert sorted(utils.__all__) == utils.__all__
+
+    def test_cli_help_without_pandera(self, tmp_path):
+        """``--help`` がpandas・Panderaを読み込まずに終了することを確認。"""
+        code = (
+            "import runpy, sys; sys.argv = [sys.argv[1], '--help']\n"
+            "try:\n"
+            "    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n" + LOADED_MODULES
+        )
+        for script in ("sample_validation.py", "batch_validation.py"):
+            # ログファイルを作業ディレクトリに作成するため、一時ディレクトリで実行する
+            loaded = run_python(code, str(ROOT / script), cwd=tmp_path)
+            assert loaded == {"pandas": False, "pandera": False}
+
+    def test_preflight_without_pandera(self, tmp_path, valid_employee_df):
+        """構造の事前チェックがPanderaを読み込まずに実行できることを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.to_csv(path, index=False)
+        code = (
+            "import sys\n"
+            "from pandera_validation.utils.preflight import preflight_check\n"
+            "assert preflight_check(sys.argv[1]).ok\n" + LOADED_MODULES
+        )
+
+        loaded = run_python(code, str(path))
+
+        assert loaded["pandera"] is False
+
+
+class TestEmployeeStructure:
+    """Panderaに依存しない社員データの構造のテストクラス。"""
+
+    def test_matches_schema(self):
+        """構造の定義が社員データスキーマの列と一致することを確認。"""
+        schema = get_employee_schema()
+
+        assert list(EMPLOYEE_STRUCTURE.columns) == list(schema.columns)
+        assert EMPLOYEE_STRUCTURE.ordered == schema.ordered
+        for name, column in schema.columns.items():
+            structure = EMPLOYEE_STRUCTURE.columns[name]
+            assert structure.dtype == str(column.dtype), name
+            assert structure.nullable == column.nullable, name
+            assert structure.required == column.required, name
+            assert structure.coerce == column.coerce, name
@@ -0,0 +1,134 @@
+"""インクリメンタルバリデーションのテスト。"""
+
+import pandas as pd
+import pytest
+
+from pandera_validation.schemas import schema_hash
+from pandera_validation.utils import (
+    IncrementalValidator,
+    ValidationErrorReport,
+    validate_employee_data,
+)
+
+
+def make_delta(**overrides):
+    """既存データに追加する1行の社員データを生成する。"""
+    row = {
+        "employee_id": 1006,
+        "name": "中村優子",
+        "age": 29,
+        "department": "HR",
+        "salary": 380000,
+        "join_date": pd.Timestamp("2020-04-01"),
+        "manager_id": 1003,
+        "performance_score": 3.9,
+    }
+    row.update(overrides)
+    return pd.DataFrame([row])
+
+
+@pytest.fixture
+def validator(valid_employee_df):
+    """正常データを取り込み済みのバリデータ。"""
+    validator = IncrementalValidator()
+    success, _, _, _ = validator.validate_append(valid_employee_df)
+    assert success is True
+    return validator
+
+
+class TestIncrementalValidation:
+    """インクリメンタルバリデーションのテストクラス。"""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"employee_id": 1001},  # 既存データとの重複
+            {"salary": 200000},  # 行単位のエラー
+            {"department": "Marketing", "salary": 250000},  # 部署平均給与が基準未満
+            {"manager_id": 1004},  # 評価スコアが基準未満の社員が管理職になる
+            {"manager_id": 1006},  # 自分自身が上司
+            {"manager_id": 9999},  # 存在しない上司
+        ],
+    )
+    def test_same_result_as_full_revalidation(
+        self, validator, valid_employee_df, overrides
+    ):
+        """追加行のみの検証結果が全体の再検証と一致することを確認。"""
+        delta = make_delta(**overrides)
+        full = pd.concat([valid_employee_df, delta], ignore_index=True)
+
+        expected = validate_employee_data(full)
+        success, validated_df, error_msg, summary = validator.validate_append(delta)
+
+        assert success is expected[0]
+        assert (error_msg is None) is success
+        if success:
+            assert len(validated_df) == len(delta)
+            assert summary["record_count"] == len(full)
+            assert summary["schema_hash"] == schema_hash()
+            assert summary["departments"] == expected[3]["departments"]
+            assert summary["avg_salary"] == pytest.approx(expected[3]["avg_salary"])
+
+    def test_failed_append_keeps_state(self, validator, valid_employee_df):
+        """検証に失敗した追加行は状態に取り込まれないことを確認。"""
+        success, _, _, _ = validator.validate_append(make_delta(employee_id=1001))
+        assert success is False
+        assert validator.record_count == len(valid_employee_df)
+
+        success, _, _, _ = validator.validate_append(make_delta())
+        assert success is True
+        assert validator.record_count == len(valid_employee_df) + 1
+
+    def test_duplicate_after_append(self, validator):
+        """取り込み済みの追加行と重複する社員IDを検出することを確認。"""
+        assert validator.validate_append(make_delta())[0] is True
+
+        success, _, error_msg, _ = validator.validate_append(make_delta())
+
+        assert success is False
+        assert "1006" in error_msg
+        assert isinstance(error_msg, ValidationErrorReport)
+        assert error_msg.schema_hash == schema_hash()
+
+    def test_save_and_load(self, validator, tmp_path):
+        """保存した状態を読み込んで検証を継続できることを確認。"""
+        path = tmp_path / "state.npz"
+        validator.save(path)
+        restored = IncrementalValidator.load(path)
+
+        assert restored.record_count == validator.record_count
+        assert restored.state.department_count == validator.state.department_count
+        assert restored.validate_append(make_delta(employee_id=1002))[0] is False
+        assert restored.validate_append(make_delta())[0] is True
+
+    def test_depth_across_appends(self, validator):
+        """既存の社員の深さに続けて、追加行の管理階層の深さを評価することを確認。"""
+        # 社員ID=1002（深さ1）から1段ずつ階層を延ばす
+        manager_id = 1002
+        for employee_id in range(1006, 1015):
+            delta = make_delta(employee_id=employee_id, manager_id=manager_id)
+            assert validator.validate_append(delta)[0] is True
+            manager_id = employee_id
+
+        success, _, error_msg, _ = validator.validate_append(
+            make_delta(employee_id=1015, manager_id=manager_id)
+        )
+
+        assert success is False
+        assert "管理階層の深さは10段以下である必要があります: [1015]" in error_msg
+
+    @pytest.mark.parametrize(
+        "overrides, expected", [({}, True), ({"employee_id": 1001}, False)]
+    )
+    def test_arrow_delta(self, validator, overrides, expected):
+        """pyarrowベースの列を持つ追加行もArrow型のスキーマで検証できることを確認。"""
+        pytest.importorskip("pyarrow")
+        delta = make_delta(**overrides).convert_dtypes(dtype_backend="pyarrow")
+
+        success, validated_df, error_msg, _ = validator.validate_append(delta)
+
+        assert success is expected
+        assert (error_msg is None) is expected
+        if expected:
+            assert validated_df["employee_id"].dtype == delta["employee_id"].dtype
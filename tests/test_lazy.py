@@ -0,0 +1,140 @@
+"""全エラー収集と行分割を行う遅延検証のテスト。"""
+
+import logging
+import warnings
+
+import pandas as pd
+import pandera as pa
+
+from pandera_validation.utils import validate_employee_data, validate_employee_data_lazy
+
+
+class TestLazyValidation:
+    """遅延検証のテストクラス。"""
+
+    def test_valid_data(self, valid_employee_df):
+        """正常なデータではすべての行が有効になることを確認。"""
+        result = validate_employee_data_lazy(valid_employee_df)
+
+        assert result.success is True
+        assert len(result.valid_df) == len(valid_employee_df)
+        assert result.invalid_df.empty
+        assert result.failure_cases.empty
+        assert result.summary["record_count"] == len(valid_employee_df)
+
+    def test_collects_all_failures(self, valid_employee_df):
+        """複数の失敗ケースを1回の検証ですべて収集することを確認。"""
+        df = valid_employee_df.copy()
+        df.at[2, "age"] = 70
+        df.at[3, "department"] = "Legal"
+        df.at[4, "manager_id"] = 1005
+
+        result = validate_employee_data_lazy(df)
+
+        assert result.success is False
+        failures = result.failure_cases
+        assert list(failures.columns) == ["column", "check", "index", "failure_case"]
+        assert set(zip(failures["column"], failures["index"])) == {
+            ("age", 2),
+            ("department", 3),
+            ("manager_id", 4),
+        }
+        assert failures.loc[
+            failures["column"] == "department", "failure_case"
+        ].item() == ("Legal")
+
+    def test_split_rows(self, valid_employee_df):
+        """失敗した行のみが隔離され、残りは有効な行となることを確認。"""
+        df = valid_employee_df.copy()
+        df.at[1, "salary"] = 200000
+        df.at[3, "age"] = 70
+
+        result = validate_employee_data_lazy(df)
+
+        assert result.invalid_df.index.tolist() == [1, 3]
+        assert result.valid_df.index.tolist() == [0, 2, 4]
+        assert result.summary["record_count"] == 3
+
+    def test_dtype_failure_quarantines_bad_cells(self, invalid_age_df):
+        """型変換できない値を持つ行のみが隔離され、有効な行は型変換されることを確認。"""
+        result = validate_employee_data_lazy(invalid_age_df)
+
+        failures = result.failure_cases
+        assert failures["index"].tolist() == [1]
+        assert failures["failure_case"].tolist() == ["三十四"]
+        assert result.invalid_df.index.tolist() == [1]
+        assert result.valid_df["age"].dtype == "int64"
+
+    def test_dtype_failure_quarantines_changed_values(self, invalid_age_df):
+        """型変換で値が変わる行（小数の切り捨て）も隔離されることを確認。"""
+        df = invalid_age_df.copy()
+        df.at[3, "age"] = 30.5
+
+        result = validate_employee_data_lazy(df)
+
+        assert result.failure_cases["index"].tolist() == [1, 3]
+        assert result.invalid_df.index.tolist() == [1, 3]
+        assert result.valid_df["age"].tolist() == [28, 42, 31]
+        assert validate_employee_data(df)[0] is False
+
+    def test_value_checks_after_dtype_failure(self, invalid_age_df):
+        """データ型の不一致で実行できなかった値チェックを、変換できた値で評価することを確認。"""
+        df = invalid_age_df.copy()
+        df.at[3, "age"] = 99
+
+        result = validate_employee_data_lazy(df)
+
+        failures = result.failure_cases
+        assert set(zip(failures["check"], failures["index"])) == {
+            ("dtype('int64')", 1),
+            ("in_range(18, 65)", 3),
+        }
+        assert result.valid_df["age"].tolist() == [28, 42, 31]
+
+    def test_frame_check_attributed_to_rows(self, low_manager_score_df):
+        """データフレームレベルのチェックの失敗が原因行に対応付けられることを確認。"""
+        result = validate_employee_data_lazy(low_manager_score_df)
+
+        failures = result.failure_cases
+        assert failures["check"].tolist() == ["manager_min_score"]
+        assert failures["index"].tolist() == [2]
+        assert result.invalid_df["employee_id"].tolist() == [1003]
+
+    def test_unattributable_failure_quarantines_all(self, missing_column_df):
+        """原因行を特定できない失敗ではすべての行が隔離されることを確認。"""
+        result = validate_employee_data_lazy(missing_column_df)
+
+        assert result.success is False
+        assert result.valid_df.empty
+        pd.testing.assert_frame_equal(result.invalid_df, missing_column_df)
+        assert result.summary is None
+
+    def test_no_concat_warning(self, missing_column_df):
+        """失敗ケースの結合で空の一覧によるFutureWarningが出ないことを確認。"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            result = validate_employee_data_lazy(missing_column_df)
+
+        assert result.success is False
+
+    def test_unexpected_coercion_error_is_logged(
+        self, valid_employee_df, monkeypatch, caplog
+    ):
+        """有効な行の型変換で予期しない例外が発生した場合はログに記録することを確認。"""
+        df = valid_employee_df.copy()
+        df.at[2, "age"] = 70
+
+        coerce_dtype = pa.Column.coerce_dtype
+
+        def fail(self, check_obj):
+            if self.name == "age":
+                raise RuntimeError("unexpected")
+            return coerce_dtype(self, check_obj)
+
+        monkeypatch.setattr(pa.Column, "coerce_dtype", fail)
+        with caplog.at_level(logging.ERROR):
+            result = validate_employee_data_lazy(df)
+
+        assert len(result.valid_df) == len(df) - 1
+        assert "予期しないエラー" in caplog.text
+        assert "RuntimeError: unexpected" in caplog.text
@@ -0,0 +1,88 @@
+"""プロセスプールによる並列バリデーションのテスト。"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from pandera_validation.schemas import schema_hash
+from pandera_validation.utils import (
+    ValidationErrorReport,
+    validate_employee_data,
+    validate_employee_data_parallel,
+)
+from pandera_validation.utils.parallel import split_frame
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """テスト間で共有するプロセスプール。"""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+class TestParallelValidation:
+    """並列バリデーションのテストクラス。"""
+
+    def test_split_frame(self, valid_employee_df):
+        """分割したパーティションが元のデータを過不足なく含むことを確認。"""
+        partitions = split_frame(valid_employee_df, 3)
+
+        assert len(partitions) == 3
+        pd.testing.assert_frame_equal(pd.concat(partitions), valid_employee_df)
+        assert len(split_frame(valid_employee_df, 10)) == len(valid_employee_df)
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "valid_employee_df",
+            "invalid_salary_df",
+            "duplicate_id_df",
+            "self_manager_df",
+            "dangling_manager_df",
+            "manager_cycle_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+            "missing_column_df",
+        ],
+    )
+    def test_same_verdict_as_serial(self, request, executor, fixture_name):
+        """並列検証の結果が単一プロセスでの検証結果と一致することを確認。"""
+        df = request.getfixturevalue(fixture_name)
+
+        expected = validate_employee_data(df)
+        success, validated_df, error_msg, summary = validate_employee_data_parallel(
+            df, n_partitions=3, executor=executor
+        )
+
+        assert success is expected[0]
+        assert (error_msg is None) is success
+        if success:
+            pd.testing.assert_frame_equal(validated_df, expected[1])
+            assert summary["departments"] == expected[3]["departments"]
+            assert summary["avg_salary"] == pytest.approx(expected[3]["avg_salary"])
+
+    def test_duplicate_across_partitions(self, valid_employee_df, executor):
+        """異なるパーティションにまたがる社員IDの重複を検出することを確認。"""
+        df = valid_employee_df.copy()
+        df.at[4, "employee_id"] = 1001
+
+        success, _, error_msg, _ = validate_employee_data_parallel(
+            df, n_partitions=2, executor=executor
+        )
+
+        assert success is False
+        assert "1001" in error_msg
+        assert isinstance(error_msg, ValidationErrorReport)
+        assert error_msg.counts == {("employee_id", "field_uniqueness"): 1}
+        assert error_msg.schema_hash == schema_hash()
+
+    def test_own_pool(self, valid_employee_df):
+        """エグゼキュータを指定しない場合も検証できることを確認。"""
+        success, _, _, summary = validate_employee_data_parallel(
+            valid_employee_df, max_workers=2
+        )
+
+        assert success is True
+        assert summary["record_count"] == len(valid_employee_df)
+        assert summary["schema_hash"] == schema_hash()
@@ -0,0 +1,110 @@
+"""列名・列の順序・データ型の事前チェックのテスト。"""
+
+import pytest
+
+from pandera_validation.utils import read_employee_file, validate_employee_csv
+from pandera_validation.utils.preflight import preflight_check
+
+
+class TestPreflightCheck:
+    """構造の事前チェックのテストクラス。"""
+
+    def test_valid_csv(self, valid_employee_df, tmp_path):
+        """正しい構造のCSVではエラーがないことを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.to_csv(path, index=False)
+
+        result = preflight_check(path)
+
+        assert result.ok is True
+        assert result.columns == list(valid_employee_df.columns)
+
+    def test_missing_column(self, missing_column_df, tmp_path):
+        """必須の列がないCSVを検出することを確認。"""
+        path = tmp_path / "employees.csv"
+        missing_column_df.to_csv(path, index=False)
+
+        result = preflight_check(path)
+
+        assert result.ok is False
+        assert result.errors == ["列 'salary' がありません"]
+
+    def test_malformed_sample(self, invalid_age_df, tmp_path):
+        """先頭の行に型変換できない値があるCSVを検出することを確認。"""
+        path = tmp_path / "employees.csv"
+        invalid_age_df.to_csv(path, index=False)
+
+        result = preflight_check(path)
+
+        assert result.ok is False
+        assert len(result.errors) == 1
+        assert "'age'" in result.errors[0]
+        assert "三十四" in result.errors[0]
+
+    def test_null_in_non_nullable_column(self, valid_employee_df, tmp_path):
+        """NULLを許容しない列のNULL値を検出することを確認。"""
+        path = tmp_path / "employees.csv"
+        df = valid_employee_df.astype({"salary": "Int64"})
+        df.at[2, "salary"] = None
+        df.to_csv(path, index=False)
+
+        result = preflight_check(path)
+
+        assert result.errors == ["列 'salary' にNULL値があります（先頭100行中1件）"]
+
+    def test_column_order(self, valid_employee_df, tmp_path):
+        """ordered=Trueの場合に列の順序の違いを検出することを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df[valid_employee_df.columns[::-1]].to_csv(path, index=False)
+
+        assert preflight_check(path).ok is True
+        assert preflight_check(path, ordered=True).ok is False
+
+    def test_arrow_types(self, valid_employee_df, tmp_path):
+        """Parquet・Arrow IPCのスキーマ情報からデータ型の不一致を検出することを確認。"""
+        pytest.importorskip("pyarrow")
+        valid_path = tmp_path / "valid.parquet"
+        invalid_path = tmp_path / "invalid.feather"
+        valid_employee_df.to_parquet(valid_path)
+        valid_employee_df.astype({"age": str}).to_feather(invalid_path)
+
+        assert preflight_check(valid_path).ok is True
+        assert preflight_check(invalid_path).errors == [
+            "列 'age' のデータ型が一致しません: string（期待: int64）"
+        ]
+
+    @pytest.mark.filterwarnings("ignore:Feather V1 files are deprecated")
+    @pytest.mark.parametrize("arrow_format", ["feather_v1", "ipc_stream"])
+    def test_arrow_formats(self, valid_employee_df, tmp_path, arrow_format):
+        """Feather V1・Arrow IPCストリーム形式のファイルも確認できることを確認。"""
+        pa = pytest.importorskip("pyarrow")
+        from pyarrow import feather, ipc
+
+        valid_path = tmp_path / "valid.arrow"
+        invalid_path = tmp_path / "invalid.arrow"
+        for df, path in [
+            (valid_employee_df, valid_path),
+            (valid_employee_df.astype({"age": str}), invalid_path),
+        ]:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if arrow_format == "feather_v1":
+                feather.write_feather(table, path, version=1)
+            else:
+                with ipc.new_stream(path, table.schema) as writer:
+                    writer.write_table(table)
+
+        assert preflight_check(valid_path).ok is True
+        assert preflight_check(invalid_path).errors == [
+            "列 'age' のデータ型が一致しません: string（期待: int64）"
+        ]
+        assert len(read_employee_file(valid_path)) == len(valid_employee_df)
+
+    def test_streaming_rejects_before_reading(self, missing_column_df, tmp_path):
+        """ストリーミング検証が事前チェックのエラーを返すことを確認。"""
+        path = tmp_path / "employees.csv"
+        missing_column_df.to_csv(path, index=False)
+
+        success, _, error_msg, _ = validate_employee_csv(path, chunksize=1)
+
+        assert success is False
+        assert error_msg == "列 'salary' がありません"
@@ -0,0 +1,61 @@
+"""チェックごとの実行時間計測のテスト。"""
+
+import json
+import logging
+
+from pandera_validation.utils import validate_employee_data
+
+
+class TestValidationProfile:
+    """プロファイリングモードのテストクラス。"""
+
+    def test_profile_in_summary(self, valid_employee_df):
+        """プロファイリング結果がサマリーに含まれることを確認。"""
+        success, validated_df, _, summary = validate_employee_data(
+            valid_employee_df, profile=True
+        )
+
+        assert success is True
+        assert str(validated_df["manager_id"].dtype) == "Int64"
+        profile = summary["profile"]
+        kinds = {record["kind"] for record in profile["checks"]}
+        assert kinds == {"dtype", "column", "frame"}
+        assert all(record["failures"] == 0 for record in profile["checks"])
+        assert all(
+            record["rows"] == len(valid_employee_df) for record in profile["checks"]
+        )
+        assert profile["total_seconds"] >= 0
+
+        checks = {(record["column"], record["check"]) for record in profile["checks"]}
+        assert ("salary", "greater_than_or_equal_to") in checks
+        assert ("employee_id", "unique") in checks
+        assert (None, "department_avg_salary") in checks
+
+    def test_profile_off_by_default(self, valid_employee_df):
+        """プロファイリングを指定しない場合はサマリーに含まれないことを確認。"""
+        _, _, _, summary = validate_employee_data(valid_employee_df)
+
+        assert "profile" not in summary
+
+    def test_profile_failure(self, invalid_salary_df, caplog):
+        """失敗時も通常と同じエラーを返し、失敗件数をログに出力することを確認。"""
+        expected = validate_employee_data(invalid_salary_df)
+        with caplog.at_level(logging.INFO, logger="pandera_validation"):
+            success, _, error_msg, summary = validate_employee_data(
+                invalid_salary_df, profile=True
+            )
+
+        assert success is False
+        assert error_msg == expected[2]
+        assert summary is None
+
+        records = [
+            json.loads(r.message)
+            for r in caplog.records
+            if r.message.startswith('{"event": "validation_profile"')
+        ]
+        assert len(records) == 1
+        salary_checks = [
+            c for c in records[0]["checks"] if c["column"] == "salary" and c["failures"]
+        ]
+        assert salary_checks[0]["failures"] == 1
@@ -0,0 +1,201 @@
+"""CSV・Parquet・Arrow IPC形式の読み込みとpyarrowベースのデータ型の検証のテスト。"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandera.errors import ParserError
+
+from pandera_validation.utils import (
+    get_employee_schema,
+    read_employee_file,
+    validate_employee_data,
+    validate_employee_data_lazy,
+)
+from pandera_validation.utils.readers import csv_read_options, read_employee_csv
+from pandera_validation.utils.validation import infer_dtype_backend
+
+
+@pytest.fixture
+def pa():
+    """pyarrowモジュール（インストールされていない場合はスキップ）。"""
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(params=["employees.parquet", "employees.feather"])
+def write_file(request, tmp_path, pa):
+    """データフレームをParquetまたはArrow IPCファイルに書き出す関数を返す。"""
+
+    def write(df):
+        path = tmp_path / request.param
+        if path.suffix == ".parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_feather(path)
+        return path
+
+    return write
+
+
+class TestColumnarReaders:
+    """Parquet・Arrow IPC形式の読み込みのテストクラス。"""
+
+    def test_keeps_arrow_dtypes(self, valid_employee_df, write_file, pa):
+        """読み込んだ列がNumPyに変換されずpyarrowベースのままであることを確認。"""
+        df = read_employee_file(write_file(valid_employee_df))
+
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert df["join_date"].dtype == pd.ArrowDtype(pa.timestamp("ns"))
+        assert df["manager_id"].isna().sum() == 2
+        assert infer_dtype_backend(df) == "pyarrow"
+        assert infer_dtype_backend(valid_employee_df) is None
+
+    def test_unsupported_suffix(self, tmp_path):
+        """未対応の拡張子ではValueErrorが送出されることを確認。"""
+        with pytest.raises(ValueError):
+            read_employee_file(tmp_path / "employees.xlsx")
+
+    def test_valid_data(self, valid_employee_df, write_file, pa):
+        """pyarrowベースのデータが変換されずに検証を通過することを確認。"""
+        df = read_employee_file(write_file(valid_employee_df))
+
+        success, validated_df, error_msg, summary = validate_employee_data(df)
+
+        assert success is True
+        assert error_msg is None
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in validated_df.dtypes)
+        assert validated_df["manager_id"].dtype == pd.ArrowDtype(pa.int64())
+        assert summary["record_count"] == len(valid_employee_df)
+        assert summary["departments"]["IT"] == 2
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "invalid_salary_df",
+            "duplicate_id_df",
+            "self_manager_df",
+            "invalid_department_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+            "early_join_date_df",
+        ],
+    )
+    def test_same_verdict_as_numpy(self, request, write_file, fixture_name):
+        """NumPyベースのデータと同じ検証結果になることを確認。"""
+        numpy_df = request.getfixturevalue(fixture_name)
+        arrow_df = read_employee_file(write_file(numpy_df))
+
+        assert validate_employee_data(arrow_df)[0] is False
+        assert validate_employee_data(numpy_df)[0] is False
+
+    def test_lazy_failure_cases(self, self_manager_df, write_file):
+        """遅延検証で自己参照の上司IDを持つ行だけが隔離されることを確認。"""
+        df = read_employee_file(write_file(self_manager_df))
+
+        result = validate_employee_data_lazy(df)
+
+        assert result.success is False
+        assert list(result.invalid_df.index) == [1]
+        assert set(result.failure_cases["check"]) == {"manager_not_self"}
+
+    def test_arrow_schema_rejects_numpy_dtypes(self, valid_employee_df, pa):
+        """Arrow型のスキーマはNumPyベースの列を変換せずに拒否することを確認。"""
+        schema = get_employee_schema(dtype_backend="pyarrow")
+
+        with pytest.raises(Exception):
+            schema.validate(valid_employee_df)
+
+
+@pytest.fixture(params=["c", "pyarrow"])
+def engine(request):
+    """CSVエンジン（pyarrowがインストールされていない場合はCのみ）。"""
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+class TestCsvReader:
+    """スキーマのデータ型でのCSVの読み込みのテストクラス。"""
+
+    def test_read_options(self):
+        """スキーマから列、データ型、日付列が作成されることを確認。"""
+        options = csv_read_options(header=["employee_id", "join_date"], engine="c")
+
+        assert options["usecols"] == ["employee_id", "join_date"]
+        assert options["dtype"]["employee_id"] == "int64"
+        assert options["date_columns"] == ["join_date"]
+
+    def test_typed_read(self, valid_employee_df, tmp_path, engine):
+        """日付を含む各列が読み込み時にスキーマのデータ型に変換されることを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.assign(extra="x").to_csv(path, index=False)
+
+        df = read_employee_csv(path, engine=engine)
+
+        assert list(df.columns) == list(valid_employee_df.columns)
+        assert df["age"].dtype == np.int64
+        assert df["join_date"].dtype == "datetime64[ns]"
+        assert validate_employee_data(df)[0] is True
+
+    def test_malformed_cells(self, invalid_age_df, tmp_path, engine):
+        """型変換できないセルが失敗ケースとして報告されることを確認。"""
+        path = tmp_path / "employees.csv"
+        df = invalid_age_df.copy()
+        df["join_date"] = df["join_date"].astype(str)
+        df.at[3, "join_date"] = "不明"
+        df.to_csv(path, index=False)
+
+        with pytest.raises(ParserError) as excinfo:
+            read_employee_csv(path, engine=engine)
+
+        failure_cases = excinfo.value.failure_cases
+        assert failure_cases[["column", "index", "failure_case"]].values.tolist() == [
+            ["age", 1, "三十四"],
+            ["join_date", 3, "不明"],
+        ]
+        assert "2件のセル" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "column, value",
+        [("age", "28.9"), ("salary", "350000.5"), ("salary", "99999999999999999999")],
+    )
+    def test_inexact_integer_cells(
+        self, valid_employee_df, tmp_path, engine, column, value
+    ):
+        """整数列の小数・桁あふれした値を切り捨てずに失敗ケースとすることを確認。"""
+        path = tmp_path / "employees.csv"
+        df = valid_employee_df.astype({column: object})
+        df.at[2, column] = value
+        df.to_csv(path, index=False)
+
+        with pytest.raises(ParserError) as excinfo:
+            read_employee_csv(path, engine=engine)
+
+        failure_cases = excinfo.value.failure_cases
+        assert failure_cases[["column", "index", "failure_case"]].values.tolist() == [
+            [column, 2, value]
+        ]
+
+    def test_large_integer_is_exact(self, valid_employee_df, tmp_path, engine):
+        """浮動小数点数で表せない大きさの整数も正確に読み込むことを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.assign(
+            employee_id=valid_employee_df["employee_id"] + 2**53
+        ).to_csv(path, index=False)
+
+        df = read_employee_csv(path, engine=engine)
+
+        assert df["employee_id"].tolist() == [
+            i + 2**53 for i in valid_employee_df["employee_id"]
+        ]
+
+    def test_missing_column(self, missing_column_df, tmp_path, engine):
+        """存在しない列は読み込まれず、スキーマの検証で報告されることを確認。"""
+        path = tmp_path / "employees.csv"
+        missing_column_df.to_csv(path, index=False)
+
+        df = read_employee_csv(path, engine=engine)
+        success, _, error_msg, _ = validate_employee_data(df)
+
+        assert "salary" not in df.columns
+        assert success is False
+        assert "salary" in error_msg
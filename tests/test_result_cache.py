@@ -0,0 +1,135 @@
+"""検証結果キャッシュのテスト。"""
+
+import pandas as pd
+import pytest
+
+from pandera_validation.schemas import employee
+from pandera_validation.utils import (
+    ValidationErrorReport,
+    ValidationResultCache,
+    validate_employee_data,
+    validation,
+)
+from pandera_validation.utils.result_cache import hash_frame, make_cache_key
+
+
+class TestValidationResultCache:
+    """検証結果キャッシュのテストクラス。"""
+
+    def test_hit_skips_validation(self, valid_employee_df, monkeypatch):
+        """同じ内容のデータではチェックを実行せずに結果を返すことを確認。"""
+        cache = ValidationResultCache()
+        success, validated_df, _, summary = validate_employee_data(
+            valid_employee_df, cache=cache
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("キャッシュ済みのデータが再検証されました")
+
+        monkeypatch.setattr(validation, "_run_validation", fail)
+        cached = validate_employee_data(valid_employee_df.copy(), cache=cache)
+
+        assert success is True
+        assert cached[0] is True
+        assert cached[3] == summary
+        pd.testing.assert_frame_equal(cached[1], validated_df)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_failure_is_cached(self, invalid_age_df):
+        """失敗した検証結果もエラーメッセージと共に再利用されることを確認。"""
+        cache = ValidationResultCache()
+        _, _, error_msg, _ = validate_employee_data(invalid_age_df, cache=cache)
+        success, validated_df, cached_msg, _ = validate_employee_data(
+            invalid_age_df, cache=cache
+        )
+
+        assert success is False
+        assert validated_df is None
+        assert cached_msg == error_msg
+        assert cache.hits == 1
+
+    @pytest.mark.parametrize("persistent", [False, True])
+    @pytest.mark.parametrize(
+        "fixture_name", ["invalid_age_df", "invalid_salary_df", "low_avg_salary_df"]
+    )
+    def test_cached_error_report(self, request, tmp_path, fixture_name, persistent):
+        """キャッシュから返すエラーが同じ属性の ``ValidationErrorReport`` であることを確認。"""
+        df = request.getfixturevalue(fixture_name)
+        path = tmp_path / "cache.sqlite" if persistent else None
+        _, _, error_msg, _ = validate_employee_data(df)
+        validate_employee_data(df, cache=ValidationResultCache(path=path))
+
+        cache = ValidationResultCache(path=path)
+        if not persistent:
+            validate_employee_data(df, cache=cache)
+        _, _, cached_msg, _ = validate_employee_data(df, cache=cache)
+
+        assert cache.hits == 1
+        assert isinstance(cached_msg, ValidationErrorReport)
+        assert str(cached_msg) == str(error_msg)
+        for name in ("header", "counts", "detail", "max_examples", "schema_hash"):
+            assert getattr(cached_msg, name) == getattr(error_msg, name)
+        if error_msg.examples() is None:
+            assert cached_msg.examples() is None
+        else:
+            pd.testing.assert_frame_equal(
+                cached_msg.examples().astype(str), error_msg.examples().astype(str)
+            )
+
+    def test_unhashable_column_skips_cache(self, valid_employee_df):
+        """ハッシュ化できない値の列があっても、キャッシュなしと同じ結果になることを確認。"""
+        df = valid_employee_df.assign(tags=[["a"], ["b"], [], ["c"], ["d", "e"]])
+        cache = ValidationResultCache()
+
+        expected = validate_employee_data(df)
+        success, _, error_msg, summary = validate_employee_data(df, cache=cache)
+
+        assert expected[0] is True
+        assert success is True
+        assert error_msg is None
+        assert summary == expected[3]
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    def test_key_depends_on_content_and_options(self, valid_employee_df):
+        """データの内容・検証オプション・スキーマのバージョンでキーが変わることを確認。"""
+        changed = valid_employee_df.copy()
+        changed.loc[0, "salary"] += 1
+        content_hash = hash_frame(valid_employee_df)
+
+        assert hash_frame(valid_employee_df.copy()) == content_hash
+        assert hash_frame(changed) != content_hash
+        assert make_cache_key(content_hash, compact=False) != make_cache_key(
+            content_hash, compact=True
+        )
+        assert make_cache_key(content_hash).startswith(f"v{employee.SCHEMA_VERSION}:")
+
+    def test_lru_eviction(self):
+        """最大件数を超えた場合に最も古い結果が破棄されることを確認。"""
+        cache = ValidationResultCache(maxsize=2)
+        cache.put("a", (True, None, {}))
+        cache.put("b", (True, None, {}))
+        cache.get("a")
+        cache.put("c", (True, None, {}))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_sqlite_persistence(self, valid_employee_df, tmp_path):
+        """SQLiteファイルに保存した結果を別のインスタンスで再利用できることを確認。"""
+        path = tmp_path / "cache.sqlite"
+        first = ValidationResultCache(path=path)
+        _, _, _, summary = validate_employee_data(
+            valid_employee_df, detailed_summary=True, cache=first
+        )
+        first.close()
+
+        second = ValidationResultCache(path=path)
+        success, _, _, cached_summary = validate_employee_data(
+            valid_employee_df, detailed_summary=True, cache=second
+        )
+        second.close()
+
+        assert success is True
+        assert second.hits == 1
+        assert cached_summary == summary
@@ -0,0 +1,184 @@
+"""標本検証のテスト。"""
+
+import numpy as np
+import pytest
+
+from benchmarks.data import generate_employee_data
+from pandera_validation.utils import (
+    SamplingOptions,
+    validate_employee_data,
+    validate_employee_sample,
+)
+from pandera_validation.utils.sampling import draw_sample
+
+
+@pytest.fixture(scope="module")
+def large_df():
+    """不正値を約2%含む合成社員データ。"""
+    return generate_employee_data(20000, invalid_rate=0.02, seed=3)
+
+
+class TestDrawSample:
+    """標本の抽出のテストクラス。"""
+
+    def test_head_and_tail(self, valid_employee_df):
+        """先頭・末尾から指定した行数を抽出することを確認。"""
+        head = draw_sample(valid_employee_df, SamplingOptions(method="head", size=2))
+        tail = draw_sample(valid_employee_df, SamplingOptions(method="tail", size=2))
+
+        assert list(head.index) == [0, 1]
+        assert list(tail.index) == [3, 4]
+
+    def test_random_is_reproducible(self, large_df):
+        """同じシードでは同じ行が抽出されることを確認。"""
+        options = SamplingOptions(method="random", size=500, seed=7)
+
+        first = draw_sample(large_df, options)
+        second = draw_sample(large_df, options)
+
+        assert len(first) == 500
+        assert first.index.is_unique
+        assert first.index.equals(second.index)
+
+    def test_stratified_covers_all_departments(self):
+        """層化抽出ではすべての部署が部署の行数に比例して抽出されることを確認。"""
+        df = generate_employee_data(
+            10000, department_weights={"IT": 0.9, "HR": 0.099, "Sales": 0.001}
+        )
+
+        sample = draw_sample(df, SamplingOptions(method="stratified", size=1000))
+        counts = sample["department"].value_counts()
+
+        assert set(counts.index) == {"IT", "HR", "Sales"}
+        assert counts["IT"] == pytest.approx(900, abs=10)
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 4])
+    def test_stratified_does_not_exceed_size(self, valid_employee_df, size):
+        """層化抽出の行数が部署数より少ない指定でも ``size`` 行を超えないことを確認。"""
+        sample = draw_sample(
+            valid_employee_df, SamplingOptions(method="stratified", size=size)
+        )
+
+        assert len(sample) == size
+        assert sample.index.is_unique
+
+    def test_unknown_method(self, valid_employee_df):
+        """未対応の抽出方法ではValueErrorが送出されることを確認。"""
+        with pytest.raises(ValueError):
+            draw_sample(valid_employee_df, SamplingOptions(method="every_other"))
+
+
+class TestValidateEmployeeSample:
+    """標本検証のテストクラス。"""
+
+    @pytest.mark.parametrize("confidence", [0.0, 1.0, 1.5, -0.1])
+    def test_invalid_confidence(self, valid_employee_df, confidence):
+        """信頼水準が0より大きく1未満でない場合はValueErrorが送出されることを確認。"""
+        with pytest.raises(ValueError, match="信頼水準"):
+            validate_employee_sample(
+                valid_employee_df, SamplingOptions(confidence=confidence)
+            )
+
+    def test_valid_data(self):
+        """有効なデータでは成功し、判定できないルールが記録されることを確認。"""
+        df = generate_employee_data(5000)
+
+        success, validated_df, error_msg, summary = validate_employee_data(
+            df, sample=SamplingOptions(size=500)
+        )
+
+        assert success is True
+        assert validated_df is None
+        assert error_msg is None
+        sampling = summary["sampling"]
+        assert sampling["sample_size"] == 500
+        assert sampling["population_size"] == 5000
+        assert sampling["checks"] == []
+        assert {rule["rule"] for rule in sampling["undecided_rules"]} == {
+            "unique(employee_id)",
+            "manager_exists",
+            "no_manager_cycle",
+            "hierarchy_depth",
+            "department_avg_salary",
+            "manager_min_score",
+        }
+
+    @pytest.mark.parametrize("method", ["random", "stratified"])
+    def test_confidence_interval_covers_true_rate(self, large_df, method):
+        """推定した行の失敗率の信頼区間が全行での失敗率を含むことを確認。"""
+        full = validate_employee_sample(
+            large_df, SamplingOptions(method="head", size=len(large_df))
+        )
+        true_rate = full[3]["sampling"]["invalid_row_rate"]["rate"]
+
+        success, _, error_msg, summary = validate_employee_sample(
+            large_df, SamplingOptions(method=method, size=4000, confidence=0.99)
+        )
+
+        estimate = summary["sampling"]["invalid_row_rate"]
+        assert success is False
+        assert "推定失敗率" in error_msg
+        assert estimate["ci_low"] <= true_rate <= estimate["ci_high"]
+        assert summary["sampling"]["representative"] is True
+
+    def test_full_sample_has_exact_rate(self, large_df):
+        """全行を標本とした場合、信頼区間の幅が0になることを確認。"""
+        _, _, _, summary = validate_employee_sample(
+            large_df, SamplingOptions(method="random", size=len(large_df))
+        )
+
+        estimate = summary["sampling"]["invalid_row_rate"]
+        assert estimate["ci_low"] == estimate["rate"] == estimate["ci_high"]
+
+    def test_check_failure_counts(self, valid_employee_df):
+        """チェックごとの失敗件数と失敗率が求められることを確認。"""
+        df = valid_employee_df.copy()
+        df.at[0, "age"] = 70
+        df.at[1, "age"] = 10
+
+        _, _, _, summary = validate_employee_sample(
+            df, SamplingOptions(method="head", size=5)
+        )
+
+        (check,) = summary["sampling"]["checks"]
+        assert check["column"] == "age"
+        assert check["failures"] == 2
+        assert check["rate"] == pytest.approx(0.4)
+        assert summary["sampling"]["representative"] is False
+
+    def test_duplicate_in_sample_is_decided(self, duplicate_id_df):
+        """標本内で重複した社員IDは判定できたルールの違反として扱うことを確認。"""
+        success, _, error_msg, summary = validate_employee_sample(
+            duplicate_id_df, SamplingOptions(method="head", size=5)
+        )
+
+        rules = [rule["rule"] for rule in summary["sampling"]["failed_rules"]]
+        assert success is False
+        assert rules == ["unique(employee_id)"]
+        assert "unique(employee_id)" in error_msg
+
+    def test_uncoerced_sample(self, valid_employee_df):
+        """型変換前の文字列の列でも、変換した値で行をまたぐルールを判定することを確認。"""
+        df = valid_employee_df.copy()
+        df["performance_score"] = ["4.2", "3.0", "4.5", "3.2", "高"]
+
+        success, _, error_msg, summary = validate_employee_sample(
+            df, SamplingOptions(method="head", size=5)
+        )
+
+        rules = [rule["rule"] for rule in summary["sampling"]["failed_rules"]]
+        assert success is False
+        assert rules == ["manager_min_score"]
+        assert summary["sampling"]["checks"][0]["column"] == "performance_score"
+        assert "manager_min_score" in error_msg
+
+    def test_sample_interval_bounds(self):
+        """失敗が0件でも信頼区間の上限が0より大きいことを確認。"""
+        df = generate_employee_data(5000)
+        df.loc[np.arange(0, 5000, 100), "age"] = 99
+
+        _, _, _, summary = validate_employee_sample(df, SamplingOptions(size=10))
+
+        estimate = summary["sampling"]["invalid_row_rate"]
+        assert 0.0 <= estimate["ci_low"] <= estimate["rate"] <= estimate["ci_high"]
+        assert estimate["ci_high"] > 0.0
@@ -0,0 +1,244 @@
+"""マイクロバッチ検証サービスのテスト。"""
+
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from pandera_validation.utils import service as service_module
+from pandera_validation.utils import validate_employee_data
+from pandera_validation.utils.service import (
+    MicroBatcher,
+    ValidationService,
+    records_to_frame,
+    validate_batch,
+)
+
+
+def to_records(df):
+    """データフレームをJSONで受け取る形式のレコードに変換する。"""
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+@pytest.fixture
+def payloads(valid_employee_df, invalid_age_df, duplicate_id_df, low_manager_score_df):
+    """有効なリクエストと、行単位・行をまたぐルールに違反するリクエスト。"""
+    return [
+        to_records(valid_employee_df),
+        to_records(invalid_age_df),
+        to_records(valid_employee_df),
+        to_records(duplicate_id_df),
+        to_records(low_manager_score_df),
+        [],
+    ]
+
+
+class TestValidateBatch:
+    """バッチ検証のテストクラス。"""
+
+    def test_matches_individual_validation(self, payloads):
+        """各リクエストの結果が個別に検証した場合と同じになることを確認。"""
+        results = validate_batch(payloads)
+
+        assert [result["success"] for result in results] == [
+            True,
+            False,
+            True,
+            False,
+            False,
+            False,
+        ]
+        for records, result in zip(payloads, results):
+            success, _, error_msg, summary = validate_employee_data(
+                records_to_frame(records)
+            )
+            assert result == {
+                "success": success,
+                "error": error_msg,
+                "summary": summary,
+            }
+
+    def test_rules_are_evaluated_per_request(self, valid_employee_df):
+        """別のリクエストとの社員IDの重複は違反にならないことを確認。"""
+        results = validate_batch([to_records(valid_employee_df)] * 3)
+
+        assert all(result["success"] for result in results)
+        assert results[0]["summary"]["record_count"] == len(valid_employee_df)
+
+    def test_value_types_match_individual_validation(self, valid_employee_df):
+        """他のリクエストの値でデータ型が変わる場合も個別の検証と同じ結果になることを確認。"""
+        valid = to_records(valid_employee_df)
+        changed = [dict(record) for record in valid]
+        changed[1]["age"] = 30.5
+        integral = [dict(record) for record in valid]
+        integral[2]["age"] = 40.0
+        text = [dict(record) for record in valid]
+        text[3]["age"] = "30"
+        unparsable = [dict(record) for record in valid]
+        unparsable[0]["age"] = "x"
+        out_of_range = [dict(record) for record in valid]
+        out_of_range[4]["age"] = 99
+        int_scores = [dict(record, performance_score=4) for record in valid]
+        payloads = [
+            valid,
+            changed,
+            integral,
+            text,
+            unparsable,
+            out_of_range,
+            int_scores,
+        ]
+
+        results = validate_batch(payloads)
+
+        assert [result["success"] for result in results] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        for records, result in zip(payloads, results):
+            _, _, error_msg, _ = validate_employee_data(records_to_frame(records))
+            assert result["error"] == error_msg
+
+    def test_records_to_frame(self, valid_employee_df):
+        """入社日の文字列が日付に変換されることを確認。"""
+        df = records_to_frame(to_records(valid_employee_df))
+
+        assert pd.api.types.is_datetime64_dtype(df["join_date"])
+
+
+class TestMicroBatcher:
+    """マイクロバッチのテストクラス。"""
+
+    def test_coalesces_concurrent_requests(self, payloads):
+        """同時に届いたリクエストが1つのバッチにまとめられることを確認。"""
+
+        async def run():
+            batcher = MicroBatcher(max_batch_size=len(payloads), max_wait=1.0)
+            try:
+                results = await asyncio.gather(
+                    *(batcher.submit(records) for records in payloads)
+                )
+            finally:
+                await batcher.stop()
+            return batcher, results
+
+        batcher, results = asyncio.run(run())
+
+        assert batcher.batch_count == 1
+        assert results == validate_batch(payloads)
+
+    def test_max_batch_size(self, valid_employee_df):
+        """最大件数を超えるリクエストが複数のバッチに分かれることを確認。"""
+        records = to_records(valid_employee_df)
+
+        async def run():
+            batcher = MicroBatcher(max_batch_size=2, max_wait=1.0)
+            try:
+                await asyncio.gather(*(batcher.submit(records) for _ in range(5)))
+            finally:
+                await batcher.stop()
+            return batcher
+
+        batcher = asyncio.run(run())
+
+        assert batcher.batch_count == 3
+        assert batcher.request_count == 5
+
+
+class TestValidationService:
+    """HTTP/JSONサービスのテストクラス。"""
+
+    @staticmethod
+    async def request(port, method, path, body=b""):
+        """HTTPリクエストを送り、ステータスコードとJSONのレスポンスを返す。"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + body
+        )
+        response = await reader.read()
+        writer.close()
+        head, _, payload = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(payload)
+
+    def test_endpoints(self, valid_employee_df, invalid_age_df):
+        """検証結果とエラーのレスポンスを確認。"""
+
+        async def run():
+            service = ValidationService(port=0)
+            await service.start()
+            try:
+                responses = await asyncio.gather(
+                    self.request(
+                        service.port,
+                        "POST",
+                        "/validate",
+                        json.dumps(to_records(valid_employee_df)).encode(),
+                    ),
+                    self.request(
+                        service.port,
+                        "POST",
+                        "/validate",
+                        json.dumps({"records": to_records(invalid_age_df)}).encode(),
+                    ),
+                    self.request(service.port, "POST", "/validate", b"{"),
+                    self.request(service.port, "GET", "/validate"),
+                    self.request(service.port, "GET", "/unknown"),
+                )
+                return *responses, await self.request(service.port, "GET", "/health")
+            finally:
+                await service.stop()
+
+        valid, invalid, malformed, wrong_method, unknown, health = asyncio.run(run())
+
+        assert valid[0] == 200 and valid[1]["success"] is True
+        assert valid[1]["summary"]["record_count"] == len(valid_employee_df)
+        assert invalid[0] == 200 and invalid[1]["success"] is False
+        assert "age" in invalid[1]["error"]
+        assert malformed[0] == 400
+        assert wrong_method[0] == 405
+        assert unknown[0] == 404
+        assert health[0] == 200 and health[1]["requests"] == 2
+
+    @pytest.mark.parametrize(
+        "raw, status",
+        [
+            (b"GARBAGE\r\n\r\n", 400),
+            (b"POST /validate HTTP/1.1\r\nContent-Length: abc\r\n\r\n", 400),
+            (b"POST /validate HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 400),
+            (
+                b"POST /validate HTTP/1.1\r\nContent-Length: 100\r\n\r\n" + b"[" * 100,
+                413,
+            ),
+        ],
+    )
+    def test_rejected_request_closes_connection(self, monkeypatch, raw, status):
+        """不正なリクエスト・大きすぎるボディに応答してから接続を閉じることを確認。"""
+        monkeypatch.setattr(service_module, "MAX_BODY_BYTES", 10)
+
+        async def run():
+            service = ValidationService(port=0)
+            await service.start()
+            try:
+                reader, writer = await asyncio.open_connection(
+                    "127.0.0.1", service.port
+                )
+                writer.write(raw)
+                # 接続が閉じられなければタイムアウトする
+                response = await asyncio.wait_for(reader.read(), timeout=5)
+                writer.close()
+                return response
+            finally:
+                await service.stop()
+
+        head, _, payload = asyncio.run(run()).partition(b"\r\n\r\n")
+
+        assert int(head.split()[1]) == status
+        assert b"Connection: close" in head
+        assert "error" in json.loads(payload)
@@ -0,0 +1,89 @@
+"""メモリマップで開く列指向キャッシュのテスト。"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from pandera_validation.utils import snapshot, validate_employee_data
+from pandera_validation.utils.readers import read_employee_csv
+from pandera_validation.utils.snapshot import (
+    default_snapshot_path,
+    is_snapshot_current,
+    load_employee_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def pa():
+    """pyarrowモジュール（インストールされていない場合はスキップ）。"""
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def csv_path(tmp_path, valid_employee_df):
+    """正常な社員データのCSVファイル。"""
+    path = tmp_path / "employees.csv"
+    valid_employee_df.to_csv(path, index=False)
+    return path
+
+
+class TestEmployeeSnapshot:
+    """列指向キャッシュのテストクラス。"""
+
+    def test_created_once(self, csv_path, monkeypatch):
+        """初回のみCSVを読み込み、以降はキャッシュから読み込むことを確認。"""
+        first = load_employee_snapshot(csv_path)
+
+        # 2回目以降はCSVを解析しない
+        def fail(*args, **kwargs):
+            raise AssertionError("CSVが再び読み込まれました")
+
+        monkeypatch.setattr(snapshot, "read_employee_csv", fail)
+        second = load_employee_snapshot(csv_path)
+
+        assert default_snapshot_path(csv_path).name == "employees.csv.arrow"
+        assert is_snapshot_current(csv_path, default_snapshot_path(csv_path))
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in second.dtypes)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_rebuilt_when_source_changes(self, csv_path, valid_employee_df):
+        """元のファイルが変更された場合はキャッシュを作り直すことを確認。"""
+        path = default_snapshot_path(csv_path)
+        load_employee_snapshot(csv_path)
+
+        valid_employee_df.iloc[:3].to_csv(csv_path, index=False)
+        assert not is_snapshot_current(csv_path, path)
+
+        df = load_employee_snapshot(csv_path)
+        assert len(df) == 3
+        assert is_snapshot_current(csv_path, path)
+
+    def test_invalid_cache_file(self, csv_path, tmp_path):
+        """Arrow IPC形式でないファイルは最新のキャッシュとみなさないことを確認。"""
+        path = tmp_path / "broken.arrow"
+        path.write_bytes(b"not an arrow file")
+
+        assert not is_snapshot_current(csv_path, path)
+        assert len(load_employee_snapshot(csv_path, path)) == 5
+        assert not os.path.exists(f"{path}.tmp")
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "valid_employee_df",
+            "invalid_salary_df",
+            "self_manager_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+        ],
+    )
+    def test_same_verdict_as_csv(self, request, tmp_path, fixture_name):
+        """キャッシュからの検証結果がCSVから読み込んだ場合と一致することを確認。"""
+        path = tmp_path / "employees.csv"
+        request.getfixturevalue(fixture_name).to_csv(path, index=False)
+
+        expected, _, _, _ = validate_employee_data(read_employee_csv(path))
+        for _ in range(2):
+            success, _, _, _ = validate_employee_data(load_employee_snapshot(path))
+            assert success is expected
@@ -0,0 +1,157 @@
+"""チャンク単位のストリーミング検証のテスト。"""
+
+import pandas as pd
+import pytest
+from pandera.errors import ParserError
+
+from pandera_validation.schemas import schema_hash
+from pandera_validation.utils import (
+    ValidationErrorReport,
+    get_employee_schema,
+    read_employee_csv,
+    validate_employee_csv,
+    validate_employee_data,
+)
+from pandera_validation.utils.preflight import preflight_check
+
+
+def validate_whole_file(path):
+    """CSVファイル全体を読み込んで検証する（比較用）。"""
+    df = pd.read_csv(path)
+    df["join_date"] = pd.to_datetime(df["join_date"])
+    return validate_employee_data(df)
+
+
+def validate_typed_file(path):
+    """構造の事前チェックの後、スキーマのデータ型でCSVファイル全体を読み込んで検証する
+    （``sample_validation.py`` と同じ手順の比較用）。"""
+    preflight = preflight_check(path)
+    if not preflight.ok:
+        return False, None, "\n".join(preflight.errors), None
+    try:
+        df = read_employee_csv(path)
+    except ParserError as e:
+        return False, None, str(e), None
+    return validate_employee_data(df)
+
+
+class TestStreamingValidation:
+    """ストリーミング検証のテストクラス。"""
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "valid_employee_df",
+            "invalid_salary_df",
+            "duplicate_id_df",
+            "self_manager_df",
+            "dangling_manager_df",
+            "manager_cycle_df",
+            "invalid_department_df",
+            "low_avg_salary_df",
+            "low_manager_score_df",
+            "early_join_date_df",
+            "missing_column_df",
+        ],
+    )
+    @pytest.mark.parametrize("chunksize", [1, 2, 100])
+    def test_same_verdict_as_whole_file(
+        self, request, tmp_path, fixture_name, chunksize
+    ):
+        """チャンクサイズによらず、ファイル全体の検証と同じ結果になることを確認。"""
+        path = tmp_path / "employees.csv"
+        request.getfixturevalue(fixture_name).to_csv(path, index=False)
+
+        expected = validate_whole_file(path)
+        success, validated_df, error_msg, summary = validate_employee_csv(
+            path, chunksize=chunksize
+        )
+
+        assert success is expected[0]
+        assert validated_df is None
+        assert (error_msg is None) is success
+
+    @pytest.mark.parametrize(
+        "fixture_name, check",
+        [
+            ("low_avg_salary_df", "department_avg_salary"),
+            ("low_manager_score_df", "manager_min_score"),
+        ],
+    )
+    def test_frame_rule_message_matches_schema(
+        self, request, tmp_path, fixture_name, check
+    ):
+        """行をまたぐルールのメッセージがスキーマのチェックと同じ文言であることを確認。"""
+        path = tmp_path / "employees.csv"
+        request.getfixturevalue(fixture_name).to_csv(path, index=False)
+        errors = {c.name: c.error for c in get_employee_schema().checks}
+
+        _, _, error_msg, _ = validate_employee_csv(path, chunksize=2)
+
+        assert error_msg.startswith(f"{errors[check]}: ")
+
+    def test_summary_matches_whole_file(self, tmp_path, valid_employee_df):
+        """ストリーミング検証のサマリーが全体検証のサマリーと一致することを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.to_csv(path, index=False)
+
+        _, _, _, expected = validate_whole_file(path)
+        _, _, _, summary = validate_employee_csv(path, chunksize=2)
+
+        assert summary["record_count"] == expected["record_count"]
+        assert summary["departments"] == expected["departments"]
+        assert summary["schema_hash"] == expected["schema_hash"] == schema_hash()
+        assert summary["avg_age"] == pytest.approx(expected["avg_age"])
+        assert summary["avg_salary"] == pytest.approx(expected["avg_salary"])
+        assert summary["avg_score"] == pytest.approx(expected["avg_score"])
+
+    def test_duplicate_across_chunks(self, tmp_path, valid_employee_df):
+        """異なるチャンクにまたがる社員IDの重複を検出することを確認。"""
+        df = valid_employee_df.copy()
+        df.at[4, "employee_id"] = 1001
+        path = tmp_path / "employees.csv"
+        df.to_csv(path, index=False)
+
+        success, _, error_msg, _ = validate_employee_csv(path, chunksize=2)
+
+        assert success is False
+        assert "employee_id" in error_msg
+        assert "1001" in error_msg
+        assert isinstance(error_msg, ValidationErrorReport)
+        assert error_msg.counts == {("employee_id", "field_uniqueness"): 1}
+        assert error_msg.schema_hash == schema_hash()
+
+    def test_cycle_across_chunks(self, tmp_path, manager_cycle_df):
+        """異なるチャンクにまたがる管理階層の循環を検出することを確認。"""
+        df = manager_cycle_df.copy()
+        df["performance_score"] = 4.0
+        path = tmp_path / "employees.csv"
+        df.to_csv(path, index=False)
+
+        success, _, error_msg, _ = validate_employee_csv(path, chunksize=1)
+
+        assert success is False
+        assert "管理階層に循環があってはなりません: [1002, 1003, 1004]" in error_msg
+
+    @pytest.mark.parametrize(
+        "column, values, expected",
+        [
+            ("salary", [350000.0, 420000.0, 580000.0, 310000.0, 400000.0], True),
+            ("performance_score", [4, 4, 5, 3, 4], True),
+            ("age", [28.9, 34, 42, 23, 31], False),
+        ],
+    )
+    @pytest.mark.parametrize("chunksize", [2, 100])
+    def test_same_types_as_typed_read(
+        self, tmp_path, valid_employee_df, column, values, expected, chunksize
+    ):
+        """チャンク単位でも ``read_employee_csv`` と同じデータ型で読み込むことを確認。"""
+        path = tmp_path / "employees.csv"
+        valid_employee_df.assign(**{column: values}).to_csv(path, index=False)
+
+        success, _, error_msg, _ = validate_employee_csv(path, chunksize=chunksize)
+        typed = validate_typed_file(path)
+
+        assert success is typed[0] is expected
+        if not expected:
+            assert error_msg == typed[2]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""マイクロバッチで社員データを検証するHTTP/JSONサービスの起動スクリプト。"""
+
+import argparse
+import asyncio
+import logging
+
+from pandera_validation.utils.service import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT,
+    ValidationService,
+)
+
+# ロギングの設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+
+def main():
+    """コマンドライン引数を解析してサービスを起動する。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="待ち受けるホスト")
+    parser.add_argument("--port", type=int, default=8080, help="待ち受けるポート")
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=DEFAULT_MAX_BATCH_SIZE,
+        help="1つのバッチにまとめるリクエストの最大件数",
+    )
+    parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=DEFAULT_MAX_WAIT,
+        help="後続のリクエストを待つ最大時間（秒）",
+    )
+    args = parser.parse_args()
+
+    # リクエストごとのログ出力を抑制
+    logging.getLogger("pandera_validation.utils.validation").setLevel(logging.WARNING)
+    logging.getLogger("pandera_validation.utils.lazy").setLevel(logging.WARNING)
+
+    service = ValidationService(
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait,
+    )
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()